@@ -1,57 +1,169 @@
 import asyncio
 from datetime import timedelta
+import json
 import logging
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.ssl import get_default_context
 
 from .smartApp import SmartApp
+from .smartApp.dispatcher import RequestDispatcher
+from .smartApp.const import TRACE_CYCLES
+from .smartApp.session import create_session
+from .statistics import StatisticsImporter
 from .const import (
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DATA_STATISTICS,
+    DATA_DISPATCHER,
+    DATA_SESSION,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     CONF_PROXY,
     CONF_UPDATE_INTERVAL,
+    CONF_DAILY_BUDGET,
+    CONF_TRACE,
+    CONF_WARM_UP,
+    DEFAULT_DAILY_BUDGET,
     DEFAULT_NAME,
     PLATFORMS,
     DEVICE_STATUS_CODES,
+    DEVICE_ACTIVE_CODES,
+    DEVICE_IDLE_CODES,
+    DEVICE_TIMER_CODES,
+    STATISTICS_IMPORT_HOUR,
+    DEFAULT_BACKFILL_MONTHS,
+    SERVICE_BACKFILL_STATISTICS,
+    ATTR_MONTHS,
+    SERVICE_DUMP_TRACE,
+    ATTR_CYCLES,
+    DEFAULT_TRACE_CYCLES,
 )
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+STORAGE_VERSION = 1
+
+BACKFILL_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_MONTHS, default=DEFAULT_BACKFILL_MONTHS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=60)
+        ),
+    }
+)
+
+DUMP_TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_TRACE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=TRACE_CYCLES)
+        ),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
 
+    username = entry.data.get(CONF_USERNAME)
+    # Entries created before unique ids get the one the config flow now sets
+    if entry.unique_id is None and not any(
+        other.unique_id == username.lower()
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        hass.config_entries.async_update_entry(entry, unique_id=username.lower())
+    # Owned by this entry so its connections stay warm between polls
+    session = create_session(get_default_context())
+    try:
+        return await _async_setup_client(hass, entry, session)
+    except BaseException:
+        # Unload is not called for an entry that failed to set up
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await session.close()
+        raise
+
+
+async def _async_setup_client(
+    hass: HomeAssistant, entry: ConfigEntry, session
+) -> bool:
+    """Everything of the setup that needs the session closed if it fails"""
     username = entry.data.get(CONF_USERNAME)
     password = entry.data.get(CONF_PASSWORD)
     proxy = entry.options.get(CONF_PROXY, '')
-    session = async_get_clientsession(hass)
-    client = SmartApp(session, username, password, proxy)
+    update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    daily_budget = entry.options.get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET)
+    # Every account shares the request slots of this process
+    dispatcher = hass.data[DOMAIN].setdefault(DATA_DISPATCHER, RequestDispatcher())
+    client = SmartApp(
+        session,
+        username,
+        password,
+        proxy,
+        update_interval,
+        daily_budget,
+        dispatcher,
+    )
+    client.tracer.enabled = entry.options.get(CONF_TRACE, False)
+
+    # Keep honouring a rate limit cooldown across restarts
+    cooldown_store = Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.cooldown"
+    )
+    client.restore_cooldown(await cooldown_store.async_load() or {})
+    cooldown = client.cooldown_as_dict()
+
+    # Status codes each model is known not to support
+    capabilities_store = Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.capabilities"
+    )
+    client.capabilities.restore(await capabilities_store.async_load() or {})
 
     _LOGGER.info("\nLoading your Panasonic devices. This may takes few minutes to complete.\n")
+    if entry.options.get(CONF_WARM_UP, False):
+        await client.warm_up()
     await client.login()
 
     async def async_update_data():
         try:
             _LOGGER.info("Updating device info...")
-            return await client.get_device_with_info(DEVICE_STATUS_CODES)
+            devices = await client.get_device_with_info(
+                DEVICE_STATUS_CODES,
+                DEVICE_ACTIVE_CODES,
+                DEVICE_IDLE_CODES,
+                DEVICE_TIMER_CODES,
+            )
         except:
             raise UpdateFailed("Failed while updating device status")
 
+        if client.cooldown_as_dict() != cooldown:
+            cooldown.update(client.cooldown_as_dict())
+            await cooldown_store.async_save(cooldown)
+        if client.capabilities.changed:
+            client.capabilities.changed = False
+            await capabilities_store.async_save(client.capabilities.as_dict())
+
+        # Wake up right when the next device read is booked
+        scheduler = client.scheduler
+        coordinator.update_interval = timedelta(
+            seconds=scheduler.next_wakeup(scheduler.now())
+        )
+        return devices
+
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name=DEFAULT_NAME,
         update_method=async_update_data,
-        update_interval=timedelta(seconds=entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)),
+        update_interval=timedelta(seconds=client.scheduler.tick),
     )
 
     await coordinator.async_refresh()
@@ -59,17 +171,106 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not coordinator.last_update_success:
         raise ConfigEntryNotReady
 
+    statistics = StatisticsImporter(hass, client, entry.entry_id)
+
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_CLIENT: client,
         DATA_COORDINATOR: coordinator,
+        DATA_STATISTICS: statistics,
+        DATA_SESSION: session,
     }
 
+    async def async_close_session(_event) -> None:
+        await session.close()
+
+    # Unload closes the session too, but Home Assistant stops without unloading
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async def async_import_daily_statistics(*_):
+        statistics.set_devices(coordinator.data or [])
+        await statistics.async_import()
+
+    @callback
+    def async_schedule_import(*_) -> None:
+        # Cancelled on unload instead of outliving the entry
+        entry.async_create_background_task(
+            hass, async_import_daily_statistics(), f"{DOMAIN} statistics import"
+        )
+
+    # Resume an interrupted backfill and import the days missing since the
+    # last imported point on setup, then the previous day every night
+    async_schedule_import()
+    entry.async_on_unload(
+        async_track_time_change(
+            hass,
+            async_schedule_import,
+            hour=STATISTICS_IMPORT_HOUR,
+            minute=0,
+            second=0,
+        )
+    )
+
+    async def async_backfill_statistics(call: ServiceCall) -> None:
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            data = hass.data[DOMAIN].get(config_entry.entry_id)
+            if data is None:
+                continue
+            importer = data[DATA_STATISTICS]
+            importer.set_devices(data[DATA_COORDINATOR].data or [])
+            config_entry.async_create_background_task(
+                hass,
+                importer.async_backfill(call.data[ATTR_MONTHS]),
+                f"{DOMAIN} statistics backfill",
+            )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_BACKFILL_STATISTICS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_BACKFILL_STATISTICS,
+            async_backfill_statistics,
+            schema=BACKFILL_STATISTICS_SCHEMA,
+        )
+
+    async def async_dump_trace(call: ServiceCall) -> None:
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            data = hass.data[DOMAIN].get(config_entry.entry_id)
+            if data is None:
+                continue
+            tracer = data[DATA_CLIENT].tracer
+            if not tracer.enabled:
+                _LOGGER.warning(
+                    "Poll cycle tracing is disabled for %s", config_entry.title
+                )
+                continue
+            trace = tracer.export(call.data[ATTR_CYCLES])
+            path = hass.config.path(
+                f"{DOMAIN}_trace_{config_entry.entry_id}_"
+                f"{dt_util.now().strftime('%Y%m%d%H%M%S')}.json"
+            )
+            await hass.async_add_executor_job(_write_trace, path, trace)
+            _LOGGER.info("Poll cycle trace of %s written to %s", config_entry.title, path)
+
+    if not hass.services.has_service(DOMAIN, SERVICE_DUMP_TRACE):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_DUMP_TRACE,
+            async_dump_trace,
+            schema=DUMP_TRACE_SCHEMA,
+        )
+
     entry.add_update_listener(async_reload_entry)
     return True
 
 
+def _write_trace(path: str, trace: dict) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(trace, file, ensure_ascii=False)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     unloaded = all(
@@ -81,12 +282,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
     if unloaded:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data[DATA_SESSION].close()
+        if list(hass.data[DOMAIN]) == [DATA_DISPATCHER]:
+            hass.data[DOMAIN].pop(DATA_DISPATCHER)
+            # The services serve every entry, so they go with the last one
+            hass.services.async_remove(DOMAIN, SERVICE_BACKFILL_STATISTICS)
+            hass.services.async_remove(DOMAIN, SERVICE_DUMP_TRACE)
 
     return unloaded
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    # Through the config entries, so the entry's unload callbacks and tasks run
+    await hass.config_entries.async_reload(entry.entry_id)
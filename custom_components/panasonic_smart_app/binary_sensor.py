@@ -67,6 +67,8 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
 
 class PanasonoicTankSensor(PanasonicBaseEntity, BinarySensorEntity):
 
+    status_codes = ("0x00", "0x0A")
+
     @property
     def available(self) -> bool:
         status = self.coordinator.data[self.index]["status"]
@@ -85,7 +87,7 @@ class PanasonoicTankSensor(PanasonicBaseEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         status = self.coordinator.data[self.index]["status"]
         _is_tank_full = bool(int(status.get("0x0A", 0)))
-        _LOGGER.debug(f"[{self.label}] is_on: {_is_tank_full}")
+        _LOGGER.debug("[%s] is_on: %s", self.label, _is_tank_full)
         return _is_tank_full
 
 
@@ -94,6 +96,10 @@ class PanasonicRefrigeratorBinarySensorABC(
 ):
     """Abstract class for binary sensor of Panasonic refrigerator."""
 
+    @property
+    def status_codes(self) -> tuple[str, ...]:
+        return (self.command_type,)
+
     @property
     @abstractmethod
     def icon(self) -> str:
@@ -123,7 +129,7 @@ class PanasonicRefrigeratorBinarySensorABC(
             _LOGGER.exception(f"Error while getting status for {self.label}")
             return None
 
-        _LOGGER.debug(f"[{self.label}] is_on: {_is_on}")
+        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
 
         return _is_on
 
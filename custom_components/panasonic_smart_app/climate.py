@@ -69,6 +69,9 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
 
 
 class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
+
+    status_codes = ("0x00", "0x01", "0x02", "0x03", "0x04", "0x0F")
+
     @property
     def available(self) -> bool:
         status = self.coordinator.data[self.index]["status"]
@@ -111,7 +114,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         _is_on = bool(int(status.get("0x00", 0)))
 
         if not _is_on:
-            _LOGGER.debug(f"[{self.label}] hvac_mode: off")
+            _LOGGER.debug("[%s] hvac_mode: off", self.label)
             return HVACMode.OFF
         else:
             if not status.get("0x01", None):
@@ -121,7 +124,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
             mode_mapping = list(
                 filter(lambda m: m["mappingCode"] == value, CLIMATE_AVAILABLE_MODE)
             )[0]
-            _LOGGER.debug(f"[{self.label}] hvac_mode: {mode_mapping['key']}")
+            _LOGGER.debug("[%s] hvac_mode: %s", self.label, mode_mapping['key'])
             return mode_mapping["key"]
 
     @property
@@ -141,7 +144,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         """ Force adding off mode into list """
         _hvac_modes.append(HVACMode.OFF)
 
-        _LOGGER.debug(f"[{self.label}] hvac_modes: {_hvac_modes}")
+        _LOGGER.debug("[%s] hvac_modes: %s", self.label, _hvac_modes)
 
         return _hvac_modes
 
@@ -149,7 +152,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         status = self.coordinator.data[self.index]["status"]
         _is_on = bool(int(status.get("0x00", 0)))
 
-        _LOGGER.debug(f"[{self.label}] set_hvac_mode: {hvac_mode}")
+        _LOGGER.debug("[%s] set_hvac_mode: %s", self.label, hvac_mode)
 
         if hvac_mode == HVACMode.OFF:
             await self.client.set_command(self.auth, 128, 0)
@@ -172,21 +175,21 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         _preset_mode = (
             HVACMode.OFF if not _is_on else CLIMATE_AVAILABLE_PRESET[_hvac_mode]
         )
-        _LOGGER.debug(f"[{self.label}] preset_mode: {_preset_mode}")
+        _LOGGER.debug("[%s] preset_mode: %s", self.label, _preset_mode)
 
         return _preset_mode
 
     @property
     def preset_modes(self) -> list:
         _preset_modes = list(CLIMATE_AVAILABLE_PRESET.values())
-        _LOGGER.debug(f"[{self.label}] preset_modes: {_preset_modes}")
+        _LOGGER.debug("[%s] preset_modes: %s", self.label, _preset_modes)
         return _preset_modes
 
     async def async_set_preset_mode(self, preset_mode) -> None:
         status = self.coordinator.data[self.index]["status"]
         _is_on = bool(int(status.get("0x00", 0)))
 
-        _LOGGER.debug(f"[{self.label}] Set preset mode to: {preset_mode}")
+        _LOGGER.debug("[%s] Set preset mode to: %s", self.label, preset_mode)
 
         value = getKeyFromDict(CLIMATE_AVAILABLE_PRESET, preset_mode)
         self.client.set_command(self.auth, 1, value)
@@ -199,18 +202,18 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
     def fan_mode(self) -> str:
         status = self.coordinator.data[self.index]["status"]
         _fan_mode = int(status.get("0x02", 0))
-        _LOGGER.debug(f"[{self.label}] fan_mode: {_fan_mode}")
+        _LOGGER.debug("[%s] fan_mode: %s", self.label, _fan_mode)
         return CLIMATE_AVAILABLE_FAN_MODE[_fan_mode]
 
     @property
     def fan_modes(self) -> list:
         _fan_modes = list(CLIMATE_AVAILABLE_FAN_MODE.values())
-        _LOGGER.debug(f"[{self.label}] fan_modes: {_fan_modes}")
+        _LOGGER.debug("[%s] fan_modes: %s", self.label, _fan_modes)
         return _fan_modes
 
     async def async_set_fan_mode(self, fan_mode) -> None:
         """Set new fan mode."""
-        _LOGGER.debug(f"[{self.label}] Set fan mode to {fan_mode}")
+        _LOGGER.debug("[%s] Set fan mode to %s", self.label, fan_mode)
         mode_id = int(getKeyFromDict(CLIMATE_AVAILABLE_FAN_MODE, fan_mode))
         await self.client.set_command(self.auth, 130, mode_id)
         await self.coordinator.async_request_refresh()
@@ -220,17 +223,17 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         status = self.coordinator.data[self.index]["status"]
         _raw_swing_mode = int(status.get("0x0F", 0))
         _swing_mode = CLIMATE_AVAILABLE_SWING_MODE[_raw_swing_mode]
-        _LOGGER.debug(f"[{self.label}] swing_mode: {_swing_mode}")
+        _LOGGER.debug("[%s] swing_mode: %s", self.label, _swing_mode)
         return _swing_mode
 
     @property
     def swing_modes(self) -> list:
         _swing_modes = list(CLIMATE_AVAILABLE_SWING_MODE.values())
-        _LOGGER.debug(f"[{self.label}] swing_modes: {_swing_modes}")
+        _LOGGER.debug("[%s] swing_modes: %s", self.label, _swing_modes)
         return _swing_modes
 
     async def async_set_swing_mode(self, swing_mode) -> None:
-        _LOGGER.debug(f"[{self.label}] Set swing mode to {swing_mode}")
+        _LOGGER.debug("[%s] Set swing mode to %s", self.label, swing_mode)
         mode_id = int(getKeyFromDict(CLIMATE_AVAILABLE_SWING_MODE, swing_mode))
         await self.client.set_command(self.auth, 143, mode_id)
         await self.coordinator.async_request_refresh()
@@ -239,13 +242,13 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
     def target_temperature(self) -> int:
         status = self.coordinator.data[self.index]["status"]
         _target_temperature = float(status.get("0x03", 0))
-        _LOGGER.debug(f"[{self.label}] target_temperature: {_target_temperature}")
+        _LOGGER.debug("[%s] target_temperature: %s", self.label, _target_temperature)
         return _target_temperature
 
     async def async_set_temperature(self, **kwargs):
         """ Set new target temperature """
         target_temp = kwargs.get(ATTR_TEMPERATURE)
-        _LOGGER.debug(f"[{self.label}] Set temperature to {target_temp}")
+        _LOGGER.debug("[%s] Set temperature to %s", self.label, target_temp)
         await self.client.set_command(self.auth, 3, int(target_temp))
         await self.coordinator.async_request_refresh()
 
@@ -253,7 +256,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
     def current_temperature(self) -> int:
         status = self.coordinator.data[self.index]["status"]
         _current_temperature = float(status.get("0x04", 0))
-        _LOGGER.debug(f"[{self.label}] current_temperature: {_current_temperature}")
+        _LOGGER.debug("[%s] current_temperature: %s", self.label, _current_temperature)
         return _current_temperature
 
     @property
@@ -265,7 +268,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         minimum_temperature = list(filter(lambda t: t[0] == "Min", temperature_range))[
             0
         ][1]
-        _LOGGER.debug(f"[{self.label}] min_temp: {minimum_temperature}")
+        _LOGGER.debug("[%s] min_temp: %s", self.label, minimum_temperature)
 
         return minimum_temperature
 
@@ -278,7 +281,7 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
         maximum_temperature = list(filter(lambda t: t[0] == "Max", temperature_range))[
             0
         ][1]
-        _LOGGER.debug(f"[{self.label}] max_temp: {maximum_temperature}")
+        _LOGGER.debug("[%s] max_temp: %s", self.label, maximum_temperature)
 
         return maximum_temperature
 
@@ -290,6 +293,9 @@ class PanasonicClimate(PanasonicBaseEntity, ClimateEntity):
 
 
 class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
+
+    status_codes = ("0x00", "0x15", "0x56")
+
     @property
     def available(self) -> bool:
         status = self.coordinator.data[self.index]["status"]
@@ -318,10 +324,10 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
         status = self.coordinator.data[self.index]["status"]
         _is_on = bool(int(status.get("0x00", 0)))
         if not _is_on:
-            _LOGGER.debug(f"[{self.label}] hvac_mode: off")
+            _LOGGER.debug("[%s] hvac_mode: off", self.label)
             return HVACMode.OFF
         else:
-            _LOGGER.debug(f"[{self.label}] hvac_mode: fan_only")
+            _LOGGER.debug("[%s] hvac_mode: fan_only", self.label)
             return HVACMode.FAN_ONLY
 
     @property
@@ -329,7 +335,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
         return [HVACMode.OFF, HVACMode.FAN_ONLY]
 
     async def async_set_hvac_mode(self, hvac_mode) -> None:
-        _LOGGER.debug(f"[{self.label}] set_hvac_mode: {hvac_mode}")
+        _LOGGER.debug("[%s] set_hvac_mode: %s", self.label, hvac_mode)
 
         if hvac_mode == HVACMode.OFF:
             await self.client.set_command(self.auth, 0, 0)
@@ -345,7 +351,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
         )[0]["Parameters"]
         _raw_preset_mode = int(status.get("0x15"))
         _preset_mode = list(filter(lambda m: m[1] == _raw_preset_mode, raw_mode_list))[0][0]
-        _LOGGER.debug(f"[{self.label}] preset_mode: {_preset_mode}")
+        _LOGGER.debug("[%s] preset_mode: %s", self.label, _preset_mode)
 
         return _preset_mode
 
@@ -360,7 +366,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
 
         _preset_modes = list(map(mode_extractor, raw_mode_list))
 
-        _LOGGER.debug(f"[{self.label}] preset_modes: {_preset_modes}")
+        _LOGGER.debug("[%s] preset_modes: %s", self.label, _preset_modes)
         return _preset_modes
 
     async def async_set_preset_mode(self, preset_mode) -> None:
@@ -369,7 +375,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
         )[0]["Parameters"]
         target_option = list(filter(lambda m: m[0] == preset_mode, raw_mode_list))
         if len(target_option) > 0:
-            _LOGGER.debug(f"[{self.label}] Set preset mode to: {preset_mode}")
+            _LOGGER.debug("[%s] Set preset mode to: %s", self.label, preset_mode)
             mode_id = target_option[0][1]
             await self.client.set_command(self.auth, 21, mode_id)
             await self.coordinator.async_request_refresh()
@@ -383,7 +389,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
         )[0]["Parameters"]
         _raw_fan_mode = int(status.get("0x56", 0))
         _fan_mode = list(filter(lambda m: m[1] == _raw_fan_mode, raw_mode_list))[0][0]
-        _LOGGER.debug(f"[{self.label}] fan_mode: {_fan_mode}")
+        _LOGGER.debug("[%s] fan_mode: %s", self.label, _fan_mode)
         return _fan_mode
 
     @property
@@ -396,7 +402,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
             return mode[0]
 
         _fan_modes = list(map(mode_extractor, raw_mode_list))
-        _LOGGER.debug(f"[{self.label}] fan_modes: {_fan_modes}")
+        _LOGGER.debug("[%s] fan_modes: %s", self.label, _fan_modes)
         return _fan_modes
 
     async def async_set_fan_mode(self, fan_mode) -> None:
@@ -405,7 +411,7 @@ class PanasonicERV(PanasonicBaseEntity, ClimateEntity):
         )[0]["Parameters"]
         target_option  = list(filter(lambda m: m[0] == fan_mode, raw_mode_list))
         if len(target_option) > 0:
-            _LOGGER.debug(f"[{self.label}] Set fan mode to {fan_mode}")
+            _LOGGER.debug("[%s] Set fan mode to %s", self.label, fan_mode)
             mode_id = target_option[0][1]
             await self.client.set_command(self.auth, 86, mode_id)
             await self.coordinator.async_request_refresh()
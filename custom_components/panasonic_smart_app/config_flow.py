@@ -15,7 +15,11 @@ from .const import (
     DOMAIN,
     CONF_PROXY,
     CONF_UPDATE_INTERVAL,
+    CONF_DAILY_BUDGET,
+    CONF_TRACE,
+    CONF_WARM_UP,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_DAILY_BUDGET,
 )
 from .smartApp import SmartApp
 from .smartApp.exceptions import PanasonicExceedRateLimit
@@ -39,11 +43,15 @@ class SmartAppFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> dict[str, Any]:
         self._errors = {}
 
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
-
         if user_input is not None:
             username = user_input[CONF_USERNAME]
+            await self.async_set_unique_id(username.lower())
+            self._abort_if_unique_id_configured()
+            # Entries created before unique ids only have their username
+            for entry in self._async_current_entries(include_ignore=False):
+                if entry.data.get(CONF_USERNAME, "").lower() == username.lower():
+                    return self.async_abort(reason="already_configured")
+
             password = user_input[CONF_PASSWORD]
             proxy = user_input.get(CONF_PROXY, '')
             session = async_get_clientsession(self.hass)
@@ -108,6 +116,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Optional(CONF_UPDATE_INTERVAL, default=self.config_entry.options.get(
                         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
                     )): int,
+                    vol.Optional(CONF_DAILY_BUDGET, default=self.config_entry.options.get(
+                        CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET
+                    )): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(CONF_TRACE, default=self.config_entry.options.get(
+                        CONF_TRACE, False
+                    )): bool,
+                    vol.Optional(CONF_WARM_UP, default=self.config_entry.options.get(
+                        CONF_WARM_UP, False
+                    )): bool,
                 }
             ),
         )
@@ -2,6 +2,8 @@
 
 from homeassistant.components.climate import HVACMode
 
+from .smartApp.const import REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR
+
 DOMAIN = "panasonic_smart_app"
 PLATFORMS = [
     "humidifier",
@@ -25,14 +27,38 @@ DEVICE_TYPE_SWITCH = 17
 
 DATA_CLIENT = "client"
 DATA_COORDINATOR = "coordinator"
+DATA_STATISTICS = "statistics"
+DATA_DISPATCHER = "dispatcher"
+DATA_SESSION = "session"
 
 CONF_PROXY = "proxy"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_DAILY_BUDGET = "daily_api_budget"
+CONF_TRACE = "trace_poll_cycles"
+CONF_WARM_UP = "warm_up_connections"
 
 DEVICE_CLASS_SWITCH = "switch"
 DEVICE_CLASS_DEHUMIDIFIER = "dehumidifier"
 
 DEFAULT_UPDATE_INTERVAL = 180
+# No budget unless one is set in the options
+DEFAULT_DAILY_BUDGET = 0
+STATISTICS_IMPORT_HOUR = 1
+DEFAULT_BACKFILL_MONTHS = 12
+
+SERVICE_BACKFILL_STATISTICS = "backfill_statistics"
+ATTR_MONTHS = "months"
+SERVICE_DUMP_TRACE = "dump_trace"
+ATTR_CYCLES = "cycles"
+DEFAULT_TRACE_CYCLES = 10
+
+# Endpoints whose response time is published as a sensor
+METRIC_ENDPOINTS = (
+    "DeviceGetInfo",
+    "UserGetInfo",
+    "UserGetDeviceStatus",
+    "DeviceSetCommand",
+)
 
 DEVICE_STATUS_CODES = {
     DEVICE_TYPE_AC: [
@@ -117,6 +143,46 @@ DEVICE_STATUS_CODES = {
     ],
 }
 
+# A positive value of any of these codes means the appliance is running and
+# is polled fast. Types listed here are polled slowly otherwise.
+DEVICE_ACTIVE_CODES = {
+    DEVICE_TYPE_AC: ("0x00",),
+    DEVICE_TYPE_DEHUMIDIFIER: ("0x00",),
+    DEVICE_TYPE_WASHING_MACHINE: (
+        "0x50",  # Washing machine status, any but standby
+        "0x13",  # Remaining washing time
+        "0x15",  # Remaining time to trigger timer
+    ),
+    DEVICE_TYPE_PURIFIER: ("0x00",),
+    DEVICE_TYPE_ERV: ("0x00",),
+}
+# A positive value of any of these codes means the appliance is waiting on
+# the user and is polled slowly even while powered on.
+DEVICE_IDLE_CODES = {
+    DEVICE_TYPE_DEHUMIDIFIER: ("0x0A",),  # Tank full
+}
+
+# Countdown codes that predict the next state change, with the seconds per
+# unit of their value and whether nothing else is expected to change before
+# they reach zero.
+DEVICE_TIMER_CODES = {
+    DEVICE_TYPE_AC: {
+        "0x0B": (60, False),  # On timer
+        "0x0C": (60, False),  # Off timer
+    },
+    DEVICE_TYPE_DEHUMIDIFIER: {
+        "0x02": (3600, False),  # Off timer
+        "0x55": (3600, False),  # On timer
+    },
+    DEVICE_TYPE_WASHING_MACHINE: {
+        "0x13": (60, True),  # Remaining washing time
+        "0x15": (60, True),  # Remaining time to trigger timer
+    },
+}
+
+# Seconds between local updates of countdown entities
+COUNTDOWN_UPDATE_INTERVAL = 30
+
 DEHUMIDIFIER_MAX_HUMD = 70
 DEHUMIDIFIER_MIN_HUMD = 40
 DEHUMIDIFIER_AVAILABLE_HUMIDITY = {0: 40, 1: 45, 2: 50, 3: 55, 4: 60, 5: 65, 6: 70}
@@ -196,6 +262,8 @@ ICON_REFRIGERATOR_SHOPPING_MODE = "mdi:cart"
 ICON_REFRIGERATOR_VACATION_MODE = "mdi:beach"
 
 ICON_CO2_FOOTPRINT = "mdi:molecule-co2"
+ICON_API = "mdi:api"
+ICON_API_LATENCY = "mdi:timer-sand"
 
 LABEL_DEHUMIDIFIER = ""
 LABEL_CLIMATE = ""
@@ -238,6 +306,11 @@ LABEL_TURBO = "急速"
 LABEL_ENERGY = "本月耗電量"
 LABEL_REFRIGERATOR_OPEN_DOOR = "本月開門次數"
 LABEL_CO2_FOOTPRINT = "本月碳排放"
+LABEL_API_BUDGET = "剩餘 API 額度"
+LABEL_API_LATENCY = "API 回應時間"
+LABEL_DAILY_ENERGY = "每日耗電量"
+LABEL_DAILY_CO2_FOOTPRINT = "每日碳排放"
+LABEL_DAILY_REFRIGERATOR_OPEN_DOOR = "每日開門次數"
 LABEL_POWER = "電源"
 LABEL_ERV = ""
 
@@ -246,3 +319,14 @@ UNIT_MINUTE = "分鐘"
 
 STATE_MEASUREMENT = "measurement"
 STATE_TOTAL_INCREASING = "total_increasing"
+
+# Label, icon and state class of metrics found in the "Other" report. The
+# report only holds month-to-date totals, so metrics missing here are still
+# exposed as totals, named after the raw field.
+REPORT_METRICS = {
+    REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR: (
+        LABEL_REFRIGERATOR_OPEN_DOOR,
+        ICON_REFRIGERATOR,
+        STATE_TOTAL_INCREASING,
+    ),
+}
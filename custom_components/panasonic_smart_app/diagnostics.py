@@ -0,0 +1,27 @@
+"""Diagnostics support for Panasonic Smart App."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_CLIENT, CONF_PROXY
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_PROXY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    client = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "budget": client.budget.as_dict(),
+        "metrics": client.metrics.as_dict(),
+        "capabilities": client.capabilities.as_dict(),
+        "rate_limited_until": client.rate_limited_until,
+    }
@@ -1,12 +1,95 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
 
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN, MANUFACTURER, COUNTDOWN_UPDATE_INTERVAL
 from .smartApp import SmartApp
 
+_LOGGER = logging.getLogger(__package__)
+
+DISCOVERY_COMMAND = "command"
+DISCOVERY_STATUS = "status"
+
+
+def power_on(status: Mapping) -> bool:
+    """Available only while the appliance is powered on."""
+    return bool(int(status.get("0x00") or 0))
+
+
+def power_off(status: Mapping) -> bool:
+    """Available only while the appliance is powered off."""
+    power = status.get("0x00")
+    return power is not None and int(power) == 0
+
+
+def power_reported(status: Mapping) -> bool:
+    """Available whenever the appliance reports its power status."""
+    return status.get("0x00") is not None
+
+
+def get_model_command_types(client: SmartApp, device: dict) -> set[str]:
+    """Lower-cased command types advertised in CommandList for a device model."""
+    model_type = device.get("ModelType")
+    for command in client.get_commands():
+        if command["ModelType"] == model_type:
+            return {c["CommandType"].lower() for c in command["JSON"][0]["list"]}
+    return set()
+
+
+@dataclass(frozen=True, kw_only=True)
+class PanasonicEntityDescription(EntityDescription):
+    """Describes a table-driven Panasonic entity."""
+
+    device_type: int
+    status_code: str
+    set_command: int | None = None
+    # Label appended to the nickname. Defaults to CommandName from CommandList.
+    label: str | None = None
+    with_nickname: bool = True
+    discovery: str = DISCOVERY_COMMAND
+    available_fn: Callable[[Mapping], bool] | None = None
+
+
+def build_described_entities(coordinator, client, descriptions, entity_class) -> list:
+    """Instantiate entity_class for every description supported by each device."""
+    entities = []
+
+    for index, device in enumerate(coordinator.data):
+        device_type = int(device.get("DeviceType"))
+        candidates = [d for d in descriptions if d.device_type == device_type]
+        if not candidates:
+            continue
+
+        command_types = get_model_command_types(client, device)
+        status = device.get("status") or {}
+
+        for description in candidates:
+            if description.discovery == DISCOVERY_COMMAND:
+                supported = description.status_code.lower() in command_types
+            elif description.discovery == DISCOVERY_STATUS:
+                supported = description.status_code in status
+            else:
+                supported = True
+
+            if supported:
+                entities.append(
+                    entity_class(coordinator, index, client, device, description)
+                )
+
+    return entities
+
 
 class PanasonicBaseEntity(CoordinatorEntity, ABC):
+    # Status codes the entity reads; None means it may read any of them
+    status_codes: tuple[str, ...] | None = None
+
     def __init__(
         self,
         coordinator,
@@ -25,10 +108,27 @@ class PanasonicBaseEntity(CoordinatorEntity, ABC):
         """Label to use for name and unique id."""
         ...
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.client.want_status_codes(self.auth, self.unique_id, self.status_codes)
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.client.drop_status_codes(self.auth, self.unique_id)
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        with self.client.tracer.span("write_state", entity=self.unique_id):
+            super()._handle_coordinator_update()
+
     @property
     def current_device_info(self) -> dict:
         return self.device
 
+    @property
+    def status(self) -> Mapping:
+        return self.coordinator.data[self.index].get("status") or {}
+
     @property
     def nickname(self) -> str:
         return self.current_device_info["NickName"]
@@ -67,3 +167,121 @@ class PanasonicBaseEntity(CoordinatorEntity, ABC):
             "manufacturer": MANUFACTURER,
             "model": self.model,
         }
+
+
+class PanasonicCountdownMixin(object):
+    """Ticks a countdown status down locally between device reads.
+
+    The next coordinator update re-syncs the value with the device. Entities
+    using it must define countdown_value, the current countdown interpolated
+    from the last read; being a plain object, the mixin cannot enforce it.
+    """
+
+    _countdown_written = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_countdown_tick,
+                timedelta(seconds=COUNTDOWN_UPDATE_INTERVAL),
+            )
+        )
+
+    @callback
+    def _async_countdown_tick(self, _now) -> None:
+        value = self.countdown_value
+        if value != self._countdown_written:
+            self._countdown_written = value
+            self.async_write_ha_state()
+
+
+class PanasonicDescribedEntity(PanasonicBaseEntity):
+    """Shared engine for entities defined by a PanasonicEntityDescription.
+
+    Everything derived from the description and the model CommandList is
+    resolved once per entity, so state writes only read the raw status value.
+    """
+
+    entity_description: PanasonicEntityDescription
+
+    def __init__(self, coordinator, index, client, device, description):
+        super().__init__(coordinator, index, client, device)
+        self.entity_description = description
+        self._status_code = description.status_code
+        self._available_fn = description.available_fn
+        self._label = None
+        self._command = None
+        self._value_to_option = None
+        self._option_to_value = None
+
+    def _this_command(self) -> dict:
+        """The CommandList entry backing this entity."""
+        if self._command is None:
+            code = self._status_code.lower()
+            for command in self.commands:
+                if command["CommandType"].lower() == code:
+                    self._command = command
+                    break
+            else:
+                self._command = {"CommandName": "", "Parameters": []}
+                _LOGGER.warning(
+                    "[%s] Command %s not found in CommandList",
+                    self.nickname,
+                    self._status_code,
+                )
+        return self._command
+
+    def _compile_parameters(self) -> None:
+        parameters = self._this_command().get("Parameters") or []
+        self._value_to_option = {p[1]: p[0] for p in parameters}
+        self._option_to_value = {p[0]: p[1] for p in parameters}
+
+    @property
+    def value_to_option(self) -> dict:
+        if self._value_to_option is None:
+            self._compile_parameters()
+        return self._value_to_option
+
+    @property
+    def option_to_value(self) -> dict:
+        if self._option_to_value is None:
+            self._compile_parameters()
+        return self._option_to_value
+
+    @property
+    def status_codes(self) -> tuple[str, ...]:
+        if self._available_fn is None:
+            return (self._status_code,)
+        return (self._status_code, "0x00")
+
+    @property
+    def raw_value(self):
+        return self.status.get(self._status_code)
+
+    @property
+    def available(self) -> bool:
+        if self._available_fn is None:
+            return super().available
+        return self._available_fn(self.status)
+
+    @property
+    def label(self) -> str:
+        if self._label is None:
+            description = self.entity_description
+            label = description.label
+            if label is None:
+                # Keyed on the description when the model lacks the command,
+                # so the name and unique_id never end up blank
+                label = self._this_command()["CommandName"] or description.key
+            self._label = (
+                f"{self.nickname} {label}" if description.with_nickname else label
+            )
+        return self._label
+
+    async def async_send_value(self, value: int) -> None:
+        await self.client.set_command(
+            self.auth, self.entity_description.set_command, value
+        )
+        await self.coordinator.async_request_refresh()
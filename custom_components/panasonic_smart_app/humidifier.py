@@ -51,6 +51,9 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
 
 
 class PanasonicDehumidifier(PanasonicBaseEntity, HumidifierEntity):
+
+    status_codes = ("0x00", "0x01", "0x04")
+
     @property
     def available(self) -> bool:
         status = self.coordinator.data[self.index]["status"]
@@ -64,7 +67,7 @@ class PanasonicDehumidifier(PanasonicBaseEntity, HumidifierEntity):
     def target_humidity(self) -> int:
         status = self.coordinator.data[self.index]["status"]
         _target_humidity = DEHUMIDIFIER_AVAILABLE_HUMIDITY[int(status.get("0x04", 0))]
-        _LOGGER.debug(f"[{self.label}] target_humidity: {_target_humidity}")
+        _LOGGER.debug("[%s] target_humidity: %s", self.label, _target_humidity)
         return _target_humidity
 
     @property
@@ -85,7 +88,7 @@ class PanasonicDehumidifier(PanasonicBaseEntity, HumidifierEntity):
             filter(lambda m: m[1] == int(status.get("0x01") or 0), raw_mode_list)
         )[0]
         _mode = target_mode[0] if len(target_mode) > 0 else ""
-        _LOGGER.debug(f"[{self.label}] _mode: {_mode}")
+        _LOGGER.debug("[%s] _mode: %s", self.label, _mode)
         return _mode
 
     @property
@@ -108,7 +111,7 @@ class PanasonicDehumidifier(PanasonicBaseEntity, HumidifierEntity):
     def is_on(self) -> bool:
         status = self.coordinator.data[self.index]["status"]
         _is_on_status = bool(int(status.get("0x00") or 0))
-        _LOGGER.debug(f"[{self.label}] is_on: {_is_on_status}")
+        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on_status)
         return _is_on_status
 
     @property
@@ -121,7 +124,7 @@ class PanasonicDehumidifier(PanasonicBaseEntity, HumidifierEntity):
         if mode is None:
             return
 
-        _LOGGER.debug(f" [{self.label}] Set mode to {mode}")
+        _LOGGER.debug(" [%s] Set mode to %s", self.label, mode)
 
         raw_mode_list = list(
             filter(lambda c: c["CommandType"] == "0x01", self.commands)
@@ -143,18 +146,18 @@ class PanasonicDehumidifier(PanasonicBaseEntity, HumidifierEntity):
         )
         targetKey = getKeyFromDict(DEHUMIDIFIER_AVAILABLE_HUMIDITY, targetValue)
 
-        _LOGGER.debug(f"[{self.label}] Set humidity to {targetValue}")
+        _LOGGER.debug("[%s] Set humidity to %s", self.label, targetValue)
         await self.client.set_command(self.auth, 132, int(targetKey))
         await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self) -> None:
         """ Turn on dehumidifier """
-        _LOGGER.debug(f"[{self.label}] Turning on")
+        _LOGGER.debug("[%s] Turning on", self.label)
         await self.client.set_command(self.auth, 128, 1)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
         """ Turn off dehumidifier """
-        _LOGGER.debug(f"[{self.label}] Turning off")
+        _LOGGER.debug("[%s] Turning off", self.label)
         await self.client.set_command(self.auth, 128, 0)
         await self.coordinator.async_request_refresh()
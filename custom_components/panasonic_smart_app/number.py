@@ -1,8 +1,16 @@
 import logging
-from datetime import timedelta
-from homeassistant.components.number import NumberEntity
+from dataclasses import dataclass
 
-from .entity import PanasonicBaseEntity
+from homeassistant.components.number import NumberEntity, NumberEntityDescription
+
+from .entity import (
+    PanasonicCountdownMixin,
+    PanasonicDescribedEntity,
+    PanasonicEntityDescription,
+    build_described_entities,
+    power_on,
+    power_off,
+)
 from .const import (
     DOMAIN,
     DEVICE_TYPE_AC,
@@ -30,237 +38,96 @@ from .const import (
 _LOGGER = logging.getLogger(__package__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class PanasonicNumberEntityDescription(
+    PanasonicEntityDescription, NumberEntityDescription
+):
+    """Describes a Panasonic timer number."""
+
+
+NUMBER_DESCRIPTIONS: tuple[PanasonicNumberEntityDescription, ...] = (
+    PanasonicNumberEntityDescription(
+        key="dehumidifier_off_timer",
+        device_type=DEVICE_TYPE_DEHUMIDIFIER,
+        status_code="0x02",
+        set_command=130,
+        label=LABEL_DEHUMIDIFIER_OFF_TIMER,
+        icon=ICON_OFF_TIMER,
+        native_min_value=DEHUMIDIFIER_OFF_TIMER_MIN,
+        native_max_value=DEHUMIDIFIER_OFF_TIMER_MAX,
+        native_unit_of_measurement=UNIT_HOUR,
+        discovery=None,
+        available_fn=power_on,
+    ),
+    PanasonicNumberEntityDescription(
+        key="dehumidifier_on_timer",
+        device_type=DEVICE_TYPE_DEHUMIDIFIER,
+        status_code="0x55",
+        set_command=213,
+        label=LABEL_DEHUMIDIFIER_ON_TIMER,
+        icon=ICON_ON_TIMER,
+        native_min_value=DEHUMIDIFIER_ON_TIMER_MIN,
+        native_max_value=DEHUMIDIFIER_ON_TIMER_MAX,
+        native_unit_of_measurement=UNIT_HOUR,
+        available_fn=power_off,
+    ),
+    PanasonicNumberEntityDescription(
+        key="ac_off_timer",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x0C",
+        set_command=140,
+        label=LABEL_CLIMATE_OFF_TIMER,
+        icon=ICON_OFF_TIMER,
+        native_min_value=CLIMATE_OFF_TIMER_MIN,
+        native_max_value=CLIMATE_OFF_TIMER_MAX,
+        native_unit_of_measurement=UNIT_MINUTE,
+        discovery=None,
+        available_fn=power_on,
+    ),
+    PanasonicNumberEntityDescription(
+        key="ac_on_timer",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x0B",
+        set_command=139,
+        label=LABEL_CLIMATE_ON_TIMER,
+        icon=ICON_ON_TIMER,
+        native_min_value=CLIMATE_ON_TIMER_MIN,
+        native_max_value=CLIMATE_ON_TIMER_MAX,
+        native_unit_of_measurement=UNIT_MINUTE,
+        available_fn=power_off,
+    ),
+)
+
+
 async def async_setup_entry(hass, entry, async_add_entities) -> bool:
     client = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    devices = coordinator.data
-    commands = client.get_commands()
-    numbers = []
-
-    for index, device in enumerate(devices):
-
-        current_device_commands = [
-            command
-            for command in commands
-            if command["ModelType"] == device.get("ModelType")
-        ]
-        device_type = int(device.get("DeviceType"))
-
-        if device_type == DEVICE_TYPE_DEHUMIDIFIER:
-            numbers.append(
-                PanasonicDehumidifierOffTimer(
-                    coordinator,
-                    index,
-                    client,
-                    device,
-                )
-            )
-
-            if len(current_device_commands) > 0:
-                is_on_timer_supported = any(
-                    command["CommandType"] == "0x55"
-                    for command in current_device_commands[0]["JSON"][0]["list"]
-                )
-
-                if is_on_timer_supported:
-                    numbers.append(
-                        PanasonicDehumidifierOnTimer(
-                            coordinator,
-                            index,
-                            client,
-                            device,
-                        )
-                    )
-
-        if device_type == DEVICE_TYPE_AC:
-            numbers.append(
-                PanasonicACOffTimer(
-                    coordinator,
-                    index,
-                    client,
-                    device,
-                )
-            )
-
-            if len(current_device_commands) > 0:
-                is_on_timer_supported = any(
-                    command["CommandType"] == "0x0b"
-                    for command in current_device_commands[0]["JSON"][0]["list"]
-                )
-
-                if is_on_timer_supported:
-                    numbers.append(
-                        PanasonicACOnTimer(
-                            coordinator,
-                            index,
-                            client,
-                            device,
-                        )
-                    )
+    numbers = build_described_entities(
+        coordinator, client, NUMBER_DESCRIPTIONS, PanasonicTimerNumber
+    )
 
     async_add_entities(numbers, True)
 
     return True
 
 
-class PanasonicDehumidifierOnTimer(PanasonicBaseEntity, NumberEntity):
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = int(status.get("0x00", -1)) == 0
-        return _is_on_status
-
-    @property
-    def label(self) -> str:
-        return f"{self.nickname} {LABEL_DEHUMIDIFIER_ON_TIMER}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_ON_TIMER
-
-    @property
-    def native_value(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _on_timer = float(status.get("0x55") or 0)
-        _timer_value = 0 if _on_timer <= 0 else _on_timer
-        _LOGGER.debug(f"[{self.label}] value: {_timer_value}")
-        return int(_timer_value)
-
-    @property
-    def native_min_value(self) -> int:
-        return DEHUMIDIFIER_ON_TIMER_MIN
-
-    @property
-    def native_max_value(self) -> int:
-        return DEHUMIDIFIER_ON_TIMER_MAX
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        return UNIT_HOUR
-
-    async def async_set_native_value(self, value: float) -> None:
-        await self.client.set_command(self.auth, 213, int(value))
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicDehumidifierOffTimer(PanasonicBaseEntity, NumberEntity):
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self) -> str:
-        return f"{self.nickname} {LABEL_DEHUMIDIFIER_OFF_TIMER}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_OFF_TIMER
-
-    @property
-    def native_value(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _off_timer = float(status.get("0x02") or 0)
-        _timer_value = 0 if _off_timer <= 0 else _off_timer
-        _LOGGER.debug(f"[{self.label}] value: {_timer_value}")
-        return int(_timer_value)
-
-    @property
-    def native_min_value(self) -> int:
-        return DEHUMIDIFIER_OFF_TIMER_MIN
-
-    @property
-    def native_max_value(self) -> int:
-        return DEHUMIDIFIER_OFF_TIMER_MAX
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        return UNIT_HOUR
-
-    async def async_set_native_value(self, value: float) -> None:
-        await self.client.set_command(self.auth, 130, int(value))
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACOnTimer(PanasonicBaseEntity, NumberEntity):
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        if status.get("0x00") == None:
-            return False
-
-        _is_on_status = int(status.get("0x00")) == 0
-        return _is_on_status
-
-    @property
-    def label(self) -> str:
-        return f"{self.nickname} {LABEL_CLIMATE_ON_TIMER}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_ON_TIMER
-
-    @property
-    def native_value(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _on_timer = float(status.get("0x0B") or 0)
-        _timer_value = 0 if _on_timer <= 0 else _on_timer
-        _LOGGER.debug(f"[{self.label}] value: {_timer_value}")
-        return int(_timer_value)
-
-    @property
-    def native_min_value(self) -> int:
-        return CLIMATE_ON_TIMER_MIN
-
-    @property
-    def native_max_value(self) -> int:
-        return CLIMATE_ON_TIMER_MAX
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        return UNIT_MINUTE
+class PanasonicTimerNumber(
+    PanasonicCountdownMixin, PanasonicDescribedEntity, NumberEntity
+):
+    """ Panasonic on/off timer """
 
-    async def async_set_native_value(self, value: float) -> None:
-        await self.client.set_command(self.auth, 139, int(value))
-        await self.coordinator.async_request_refresh()
+    entity_description: PanasonicNumberEntityDescription
 
-
-class PanasonicACOffTimer(PanasonicBaseEntity, NumberEntity):
     @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self) -> str:
-        return f"{self.nickname} {LABEL_CLIMATE_OFF_TIMER}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_OFF_TIMER
+    def countdown_value(self) -> int:
+        _timer = self.client.get_countdown(self.device, self._status_code) or 0
+        return max(_timer, 0)
 
     @property
     def native_value(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _off_timer = float(status.get("0x0C") or 0)
-        _timer_value = 0 if _off_timer <= 0 else _off_timer
-        _LOGGER.debug(f"[{self.label}] value: {_timer_value}")
-        return int(_timer_value)
-
-    @property
-    def native_min_value(self) -> int:
-        return CLIMATE_OFF_TIMER_MIN
-
-    @property
-    def native_max_value(self) -> int:
-        return CLIMATE_OFF_TIMER_MAX
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        return UNIT_MINUTE
+        _timer_value = self.countdown_value
+        _LOGGER.debug("[%s] value: %s", self.label, _timer_value)
+        return _timer_value
 
     async def async_set_native_value(self, value: float) -> None:
-        await self.client.set_command(self.auth, 140, int(value))
-        await self.coordinator.async_request_refresh()
+        await self.async_send_value(int(value))
@@ -15,10 +15,15 @@ from homeassistant.const import (
     PERCENTAGE,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .entity import PanasonicBaseEntity
+from .entity import PanasonicBaseEntity, PanasonicCountdownMixin
 from .const import (
     DOMAIN,
+    DEFAULT_NAME,
+    MANUFACTURER,
     DEVICE_TYPE_DEHUMIDIFIER,
     DEVICE_TYPE_AC,
     DEVICE_TYPE_REFRIGERATOR,
@@ -26,6 +31,8 @@ from .const import (
     DEVICE_TYPE_PURIFIER,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    LABEL_API_BUDGET,
+    LABEL_API_LATENCY,
     LABEL_PM25,
     LABEL_CO2_FOOTPRINT,
     LABEL_HUMIDITY,
@@ -34,16 +41,17 @@ from .const import (
     LABEL_REFRIGERATOR_FREEZER_TEMPERATURE_DISPLAY,
     LABEL_REFRIGERATOR_REFRIGERATOR_TEMPERATURE_DISPLAY,
     LABEL_REFRIGERATOR_PARTIAL_FREEZING_TEMPERATURE_DISPLAY,
-    LABEL_REFRIGERATOR_OPEN_DOOR,
     LABEL_WASHING_MACHINE_COUNTDOWN,
     LABEL_WASHING_MACHINE_STATUS,
     LABEL_WASHING_MACHINE_CYCLE,
     LABEL_WASHING_MACHINE_MODE,
+    ICON_API,
+    ICON_API_LATENCY,
+    METRIC_ENDPOINTS,
     ICON_PM25,
     ICON_THERMOMETER,
     ICON_HUMIDITY,
     ICON_ENERGY,
-    ICON_REFRIGERATOR,
     ICON_CLOCK,
     ICON_INFO,
     ICON_WASHING_MACHINE,
@@ -55,6 +63,7 @@ from .const import (
     ICON_REFRIGERATOR_RAPID_FREEZING,
     STATE_MEASUREMENT,
     STATE_TOTAL_INCREASING,
+    REPORT_METRICS,
 )
 
 _LOGGER = logging.getLogger(__package__)
@@ -64,12 +73,16 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
     client = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
     devices = coordinator.data
-    sensors = []
+    sensors = [PanasonicApiBudgetSensor(coordinator, client, entry.entry_id)]
+    sensors.extend(
+        PanasonicApiLatencySensor(coordinator, client, entry.entry_id, endpoint)
+        for endpoint in METRIC_ENDPOINTS
+    )
 
     for index, device in enumerate(devices):
         device_type = int(device.get("DeviceType"))
         device_status = coordinator.data[index].get("status", {}).keys()
-        _LOGGER.debug(f"Device index #{index} status: {device_status}")
+        _LOGGER.debug("Device index #%s status: %s", index, device_status)
 
         if coordinator.data[index].get("energy"):
             sensors.append(
@@ -91,13 +104,14 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
                 )
             )
 
-        if coordinator.data[index].get("ref_open_door"):
+        for metric in coordinator.data[index].get("other") or {}:
             sensors.append(
-                PanasonicRefOpenDoorSensor(
+                PanasonicReportSensor(
                     coordinator,
                     index,
                     client,
                     device,
+                    metric,
                 )
             )
 
@@ -227,6 +241,8 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
 class PanasonicHumiditySensor(PanasonicBaseEntity, SensorEntity):
     """ Panasonic dehumidifier current humidity sensor """
 
+    status_codes = ("0x07",)
+
     @property
     def label(self):
         return f"{self.nickname} {LABEL_HUMIDITY}"
@@ -243,7 +259,7 @@ class PanasonicHumiditySensor(PanasonicBaseEntity, SensorEntity):
     def state(self) -> int:
         status = self.coordinator.data[self.index]["status"]
         _current_humd = status.get("0x07", None)
-        _LOGGER.debug(f"[{self.label}] state: {_current_humd}")
+        _LOGGER.debug("[%s] state: %s", self.label, _current_humd)
         return _current_humd if _current_humd else STATE_UNAVAILABLE
 
     @property
@@ -257,6 +273,8 @@ class PanasonicHumiditySensor(PanasonicBaseEntity, SensorEntity):
 class PanasonicDehumidifierPM10Sensor(PanasonicBaseEntity, SensorEntity, ABC):
     """Base class for PM1.0 sensor."""
 
+    status_codes = ("0x00", "0x56")
+
     @property
     def command_type(self) -> str:
         """Command type for PM1.0 sensor."""
@@ -285,7 +303,7 @@ class PanasonicDehumidifierPM10Sensor(PanasonicBaseEntity, SensorEntity, ABC):
         if not _is_on:
             return STATE_UNAVAILABLE
         _pm10 = float(status.get(self.command_type, -1))
-        _LOGGER.debug(f"[{self.label}] state: {_pm10}")
+        _LOGGER.debug("[%s] state: %s", self.label, _pm10)
         return _pm10
 
     @property
@@ -300,6 +318,10 @@ class PanasonicDehumidifierPM10Sensor(PanasonicBaseEntity, SensorEntity, ABC):
 
 class PanasonicPM25Sensor(PanasonicBaseEntity, SensorEntity, ABC):
 
+    @property
+    def status_codes(self) -> tuple[str, ...]:
+        return ("0x00", self.command_type)
+
     @property
     @abstractmethod
     def command_type(self) -> str:
@@ -325,7 +347,7 @@ class PanasonicPM25Sensor(PanasonicBaseEntity, SensorEntity, ABC):
         if not _is_on:
             return STATE_UNAVAILABLE
         _pm25 = float(status.get(self.command_type, -1))
-        _LOGGER.debug(f"[{self.label}] state: {_pm25}")
+        _LOGGER.debug("[%s] state: %s", self.label, _pm25)
         return _pm25
 
     @property
@@ -364,6 +386,8 @@ class PanasonicPurifierPM25Sensor(PanasonicPM25Sensor):
 class PanasonicOutdoorTemperatureSensor(PanasonicBaseEntity, SensorEntity):
     """ Panasonic AC outdoor temperature sensor """
 
+    status_codes = ("0x21",)
+
     @property
     def label(self) -> str:
         return f"{self.nickname} {LABEL_OUTDOOR_TEMPERATURE}"
@@ -380,7 +404,7 @@ class PanasonicOutdoorTemperatureSensor(PanasonicBaseEntity, SensorEntity):
     def state(self) -> int:
         status = self.coordinator.data[self.index]["status"]
         _outdoor_temperature = float(status.get("0x21", -1))
-        _LOGGER.debug(f"[{self.label}] state: {_outdoor_temperature}")
+        _LOGGER.debug("[%s] state: %s", self.label, _outdoor_temperature)
         return _outdoor_temperature if _outdoor_temperature >= 0 else STATE_UNAVAILABLE
 
     @property
@@ -395,6 +419,8 @@ class PanasonicOutdoorTemperatureSensor(PanasonicBaseEntity, SensorEntity):
 class PanasonicEnergySensor(PanasonicBaseEntity, SensorEntity):
     """ Panasonic energy sensor """
 
+    status_codes = ()
+
     @property
     def label(self) -> str:
         return f"{self.nickname} {LABEL_ENERGY}"
@@ -410,7 +436,7 @@ class PanasonicEnergySensor(PanasonicBaseEntity, SensorEntity):
     @property
     def state(self) -> int:
         energy = self.coordinator.data[self.index]["energy"]
-        _LOGGER.debug(f"[{self.label}] state: {energy}")
+        _LOGGER.debug("[%s] state: %s", self.label, energy)
         return energy if energy is not None and energy >= 0 else STATE_UNAVAILABLE
 
     @property
@@ -424,6 +450,9 @@ class PanasonicEnergySensor(PanasonicBaseEntity, SensorEntity):
 
 class PanasonicCO2FootprintSensor(PanasonicBaseEntity, SensorEntity):
     """Panasonic CO2 sensor"""
+
+    status_codes = ()
+
     @property
     def label(self) -> str:
         return f"{self.nickname} {LABEL_CO2_FOOTPRINT}"
@@ -439,7 +468,7 @@ class PanasonicCO2FootprintSensor(PanasonicBaseEntity, SensorEntity):
     @property
     def native_value(self) -> float:
         co2 = self.coordinator.data[self.index]["co2"]
-        _LOGGER.debug(f"[{self.label}] state: {co2}")
+        _LOGGER.debug("[%s] state: %s", self.label, co2)
         return co2
 
     @property
@@ -451,39 +480,120 @@ class PanasonicCO2FootprintSensor(PanasonicBaseEntity, SensorEntity):
         return UnitOfMass.KILOGRAMS
 
 
-class PanasonicRefOpenDoorSensor(PanasonicBaseEntity, SensorEntity):
-    """Panasonic Refrigerator open door sensor"""
+class PanasonicAccountSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor of the account itself.
+
+    Keyed on the config entry rather than the login, which is an email
+    address or phone number.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, client, entry_id):
+        super().__init__(coordinator)
+        self.client = client
+        self.entry_id = entry_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry_id)},
+            "name": DEFAULT_NAME,
+            "manufacturer": MANUFACTURER,
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+
+class PanasonicApiBudgetSensor(PanasonicAccountSensor):
+    """Remaining daily API calls of the account"""
+
+    _attr_icon = ICON_API
+
+    def __init__(self, coordinator, client, entry_id):
+        super().__init__(coordinator, client, entry_id)
+        self._attr_name = f"{DEFAULT_NAME} {LABEL_API_BUDGET}"
+        self._attr_unique_id = f"{entry_id}_api_budget"
+
+    @property
+    def native_value(self) -> int | None:
+        return self.client.budget.remaining
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return self.client.budget.as_dict()
+
+
+class PanasonicApiLatencySensor(PanasonicAccountSensor):
+    """Mean response time of an API endpoint"""
+
+    _attr_icon = ICON_API_LATENCY
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator, client, entry_id, endpoint):
+        super().__init__(coordinator, client, entry_id)
+        self.endpoint = endpoint
+        self._attr_name = f"{DEFAULT_NAME} {LABEL_API_LATENCY} {endpoint}"
+        self._attr_unique_id = f"{entry_id}_api_latency_{endpoint.lower()}"
+
+    @property
+    def native_value(self) -> int | None:
+        latency = self.client.metrics.get(self.endpoint).latency_mean
+        if latency is None:
+            return None
+        return round(latency * 1000)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return self.client.metrics.get(self.endpoint).as_dict()
+
+
+class PanasonicReportSensor(PanasonicBaseEntity, SensorEntity):
+    """Panasonic metric from the monthly "Other" report"""
+
+    status_codes = ()
+
+    def __init__(self, coordinator, index, client, device, metric):
+        super().__init__(coordinator, index, client, device)
+        self.metric = metric
+        self._metric_label, self._metric_icon, self._metric_state_class = (
+            REPORT_METRICS.get(metric, (metric, ICON_INFO, STATE_TOTAL_INCREASING))
+        )
 
     @property
     def label(self) -> str:
-        return f"{self.nickname} {LABEL_REFRIGERATOR_OPEN_DOOR}"
+        return f"{self.nickname} {self._metric_label}"
 
     @property
     def icon(self) -> str:
-        return ICON_REFRIGERATOR
+        return self._metric_icon
 
     @property
     def last_reset(self) -> None:
         return None
 
     @property
-    def native_value(self) -> int:
-        ref_open_door = self.coordinator.data[self.index]["ref_open_door"]
-        _LOGGER.debug(f"[{self.label}] state: {ref_open_door}")
-        return ref_open_door
+    def native_value(self) -> float | int | None:
+        value = (self.coordinator.data[self.index].get("other") or {}).get(self.metric)
+        _LOGGER.debug("[%s] state: %s", self.label, value)
+        if value is not None and value.is_integer():
+            return int(value)
+        return value
 
     @property
     def state_class(self) -> str:
-        return SensorStateClass.TOTAL_INCREASING
+        return self._metric_state_class
 
     @property
     def native_unit_of_measurement(self) -> None:
         return None
 
 
-class PanasonicWashingCountdownSensor(PanasonicBaseEntity, SensorEntity):
+class PanasonicWashingCountdownSensor(
+    PanasonicCountdownMixin, PanasonicBaseEntity, SensorEntity
+):
     """ Panasonic washing machine washing cycle countdown sensor """
 
+    status_codes = ("0x13", "0x41")
+
     @property
     def label(self):
         return f"{self.nickname} {LABEL_WASHING_MACHINE_COUNTDOWN}"
@@ -492,14 +602,18 @@ class PanasonicWashingCountdownSensor(PanasonicBaseEntity, SensorEntity):
     def icon(self) -> str:
         return ICON_CLOCK
 
+    @property
+    def countdown_value(self) -> int | None:
+        _current_countdown = self.client.get_countdown(self.device, "0x13")
+        if _current_countdown is None or _current_countdown < 0:
+            _current_countdown = self.client.get_countdown(self.device, "0x41")
+        return _current_countdown
+
     @property
     def state(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _current_countdown = status.get("0x13", None)
-        if _current_countdown is None or float(_current_countdown) < 0:
-            _current_countdown = status.get("0x41", None)
-        _LOGGER.debug(f"[{self.label}] state: {_current_countdown}")
-        return _current_countdown if _current_countdown else STATE_UNAVAILABLE
+        _current_countdown = self.countdown_value
+        _LOGGER.debug("[%s] state: %s", self.label, _current_countdown)
+        return STATE_UNAVAILABLE if _current_countdown is None else _current_countdown
 
     @property
     def state_class(self) -> str:
@@ -513,6 +627,8 @@ class PanasonicWashingCountdownSensor(PanasonicBaseEntity, SensorEntity):
 class PanasonicWashingStatusSensor(PanasonicBaseEntity, SensorEntity):
     """ Panasonic washing machine status sensor """
 
+    status_codes = ("0x50",)
+
     @property
     def label(self):
         return f"{self.nickname} {LABEL_WASHING_MACHINE_STATUS}"
@@ -543,7 +659,7 @@ class PanasonicWashingStatusSensor(PanasonicBaseEntity, SensorEntity):
         else:
             _current_status = STATE_UNAVAILABLE
 
-        _LOGGER.debug(f"[{self.label}] state: {_current_status}")
+        _LOGGER.debug("[%s] state: %s", self.label, _current_status)
         return _current_status
 
     @property
@@ -554,6 +670,8 @@ class PanasonicWashingStatusSensor(PanasonicBaseEntity, SensorEntity):
 class PanasonicWashingModeSensor(PanasonicBaseEntity, SensorEntity):
     """ Panasonic washing machine mode sensor """
 
+    status_codes = ("0x54",)
+
     @property
     def label(self):
         return f"{self.nickname} {LABEL_WASHING_MACHINE_MODE}"
@@ -576,7 +694,7 @@ class PanasonicWashingModeSensor(PanasonicBaseEntity, SensorEntity):
         _current_mode = list(
             filter(lambda m: m[1] == int(mode), raw_mode_list)
         )[0][0]
-        _LOGGER.debug(f"[{self.label}] state: {_current_mode}")
+        _LOGGER.debug("[%s] state: %s", self.label, _current_mode)
         return _current_mode
 
     @property
@@ -587,6 +705,8 @@ class PanasonicWashingModeSensor(PanasonicBaseEntity, SensorEntity):
 class PanasonicWashingCycleSensor(PanasonicBaseEntity, SensorEntity):
     """ Panasonic washing machine washing cycle sensor """
 
+    status_codes = ("0x55",)
+
     @property
     def label(self):
         return f"{self.nickname} {LABEL_WASHING_MACHINE_CYCLE}"
@@ -609,7 +729,7 @@ class PanasonicWashingCycleSensor(PanasonicBaseEntity, SensorEntity):
         _current_cycle = list(
             filter(lambda m: m[1] == int(cycle), raw_mode_list)
         )[0][0]
-        _LOGGER.debug(f"[{self.label}] state: {_current_cycle}")
+        _LOGGER.debug("[%s] state: %s", self.label, _current_cycle)
         return _current_cycle
 
     @property
@@ -620,6 +740,10 @@ class PanasonicWashingCycleSensor(PanasonicBaseEntity, SensorEntity):
 class PananocisRefrigeratorTemperatureSensorABC(PanasonicBaseEntity, SensorEntity, ABC):
     """Abstract class for temperature sensor of Panasonic refrigerator."""
 
+    @property
+    def status_codes(self) -> tuple[str, ...]:
+        return (self.command_type,)
+
     @property
     @abstractmethod
     def command_type(self) -> str:
@@ -660,7 +784,7 @@ class PananocisRefrigeratorTemperatureSensorABC(PanasonicBaseEntity, SensorEntit
             else unsigned_temperature - 256
         )
 
-        _LOGGER.debug(f"[{self.label}] state: {signed_temperature}")
+        _LOGGER.debug("[%s] state: %s", self.label, signed_temperature)
 
         return signed_temperature
 
@@ -697,6 +821,10 @@ class PananocisRefrigeratorPartialFreezingTemperatureSensor(PananocisRefrigerato
 class PananocisRefrigeratorEnumSensorABC(PanasonicBaseEntity, SensorEntity, ABC):
     """Abstract class for sensor of Panasonic refrigerator with enum values."""
 
+    @property
+    def status_codes(self) -> tuple[str, ...]:
+        return (self.command_type,)
+
     @property
     @abstractmethod
     def icon(self) -> str:
@@ -739,7 +867,7 @@ class PananocisRefrigeratorEnumSensorABC(PanasonicBaseEntity, SensorEntity, ABC)
 
         for parameter in self._this_command()["Parameters"]:
             if parameter[1] == value:
-                _LOGGER.debug(f"[{self.label}] current_option: {parameter[0]}")
+                _LOGGER.debug("[%s] current_option: %s", self.label, parameter[0])
                 return parameter[0]
 
         _LOGGER.error(f"Unknown value {value} for {self.label}")
@@ -1,10 +1,12 @@
 """ Panasonic Smart App API """
-from typing import Literal
-from datetime import datetime
-from collections import defaultdict
+from typing import AsyncIterator, Literal
+from datetime import date, datetime
+from collections import defaultdict, deque
 from http import HTTPStatus
 import asyncio
 import logging
+import math
+import time
 
 from .exceptions import (
     PanasonicRefreshTokenNotFound,
@@ -13,20 +15,44 @@ from .exceptions import (
     PanasonicLoginFailed,
     PanasonicDeviceOffline,
     PanasonicExceedRateLimit,
+    PanasonicBaseException,
 )
 from .const import (
     APP_TOKEN,
     USER_AGENT,
     SECONDS_BETWEEN_REQUEST,
     REQUEST_TIMEOUT,
+    DEBUG_LOG_SAMPLE,
     COMMANDS_PER_REQUEST,
+    CONCURRENT_REQUESTS,
+    MASK_WRITE_WINDOW,
+    RATE_LIMIT_COOLDOWN,
+    RATE_LIMIT_RECOVERY_READS,
+    POLL_INTERVAL,
+    BACKFILL_MONTHS_AHEAD,
     EXCEPTION_DEVICE_OFFLINE,
     EXCEPTION_DEVICE_NOT_RESPONDING,
     EXCEPTION_INVALID_REFRESH_TOKEN,
     EXCEPTION_DEVICE_JP_INFO,
     EXCEPTION_DEVICE_JP_FAILED,
+    REPORT_MAX_DAYS,
+    REPORT_POWER,
+    REPORT_CO2,
+    REPORT_OTHER,
+    REPORT_TOTAL_ENERGY,
+    REPORT_TOTAL_CO2,
+    REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR,
 )
-from .utils import chunks
+from .report import parse_daily_report, parse_report_metrics
+from .bitmask import MaskBatch, parse_mask
+from .budget import CallBudget, endpoint_name
+from .dispatcher import RequestDispatcher
+from .capabilities import ModelCapabilities
+from .metrics import RequestMetrics
+from .scheduler import PollScheduler
+from .status import CommandTypeIndex, DeviceStatus
+from .tracing import Tracer, traced
+from .utils import chunks, json_loads, redact
 from . import urls
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,9 +64,11 @@ def tryApiStatus(func):
             return await func(*args, **kwargs)
         except PanasonicTokenExpired:
             await args[0].refresh_token()
+            args[0].metrics.retried("token_refresh")
             return await func(*args, **kwargs)
         except (PanasonicInvalidRefreshToken, PanasonicLoginFailed):
             await args[0].login()
+            args[0].metrics.retried("login")
             return await func(*args, **kwargs)
         except PanasonicExceedRateLimit:
             """ Fallback to use overview API """
@@ -55,10 +83,31 @@ def tryApiStatus(func):
     return wrapper_call
 
 
+def retryAuth(func):
+    """Retry once after renewing the token, letting any other error through"""
+
+    async def wrapper_call(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except PanasonicTokenExpired:
+            await args[0].refresh_token()
+            args[0].metrics.retried("token_refresh")
+        except (PanasonicInvalidRefreshToken, PanasonicLoginFailed):
+            await args[0].login()
+            args[0].metrics.retried("login")
+        return await func(*args, **kwargs)
+
+    return wrapper_call
+
+
 def delay(func):
+    async def pause(tracer):
+        with tracer.span("delay"):
+            await asyncio.sleep(SECONDS_BETWEEN_REQUEST)
+
     async def wrapper_call(*args, **kwargs):
         results = await asyncio.gather(
-            *[func(*args, **kwargs), asyncio.sleep(SECONDS_BETWEEN_REQUEST)]
+            *[func(*args, **kwargs), pause(args[0].tracer)]
         )
         return results[0]
 
@@ -66,15 +115,68 @@ def delay(func):
 
 
 class SmartApp(object):
-    def __init__(self, session, account, password, proxy=None):
+    def __init__(
+        self,
+        session,
+        account,
+        password,
+        proxy=None,
+        update_interval=POLL_INTERVAL,
+        daily_budget=None,
+        dispatcher=None,
+    ):
         self.account = account
         self.password = password
         self._proxy = proxy
         self._session = session
         self._devices = []
         self._commands = []
+        self._status_indexes: dict[str, CommandTypeIndex] = {}
+        self._statuses: dict[str, DeviceStatus] = {}
+        # When each status code of a device was last read, keyed by Auth
+        self._status_read_at: dict[str, dict[str, float]] = {}
+        # Shared with the other accounts of the process, if any
+        self._dispatcher = dispatcher or RequestDispatcher()
+        self._reports: tuple[dict, dict, dict] = ({}, {}, {})
+        # Wall clock time until which per-device reads are suspended
+        self.rate_limited_until: float | None = None
+        self._recovery_reads: int | None = None
+        self.clock = time.monotonic
+        self.wall_clock = time.time
+        self.budget = CallBudget(daily_budget)
+        self.metrics = RequestMetrics()
+        self.tracer = Tracer()
+        self.capabilities = ModelCapabilities()
+        # Status codes read by each entity of a device, keyed by Auth
+        self._wanted_codes: dict[str, dict[str, frozenset | None]] = {}
+        # Models whose status is read COMMANDS_PER_REQUEST codes at a time
+        self._chunked_models: set[str] = set()
+        self._mask_batches: dict[str, MaskBatch] = {}
+        self._mask_locks: dict[str, asyncio.Lock] = {}
+        self.scheduler = PollScheduler(update_interval, budget=self.budget)
         self.last_request_id = 0
 
+    def set_clock(self, clock, wall_clock) -> None:
+        """Run scheduling, budget, cooldowns and reports on other clocks"""
+        self.clock = self.scheduler.clock = self.budget.clock = clock
+        self.tracer.clock = clock
+        self.wall_clock = self.capabilities.clock = wall_clock
+
+    async def warm_up(self, connections: int = CONCURRENT_REQUESTS):
+        """Open connections to the cloud ahead of the first requests"""
+
+        async def connect():
+            try:
+                async with self._session.get(
+                    urls.base(), timeout=REQUEST_TIMEOUT, proxy=self._proxy
+                ) as response:
+                    await response.read()
+            except Exception as exception:
+                _LOGGER.debug("Failed to warm up a connection: %s", exception)
+
+        await asyncio.gather(*[connect() for _ in range(connections)])
+
+    @traced("login")
     async def login(self):
         _LOGGER.info("Attemping to login...")
         data = {"MemId": self.account, "PW": self.password, "AppToken": APP_TOKEN}
@@ -85,6 +187,7 @@ class SmartApp(object):
         self._refresh_token = response["RefreshToken"]
         self._cp_token = response["CPToken"]
 
+    @traced("refresh_token")
     async def refresh_token(self):
         _LOGGER.info("Attemping to refresh token...")
         if self._refresh_token is None:
@@ -107,6 +210,7 @@ class SmartApp(object):
 
         self._devices = response["GwList"]
         self._commands = response["CommandList"]
+        self.capabilities.learn_command_list(self._commands)
 
         return self._devices
 
@@ -140,7 +244,72 @@ class SmartApp(object):
             result[command] = status
         return result
 
+    async def _get_device_info_chunks(
+        self, deviceId: str, gwid: str, option_chunks: list[list[str]]
+    ) -> tuple[dict, list[list[str]]]:
+        """Read chunks concurrently, returning merged result and failed chunks"""
+        results = await asyncio.gather(
+            *[self.get_device_info(deviceId, gwid, chunk) for chunk in option_chunks],
+            return_exceptions=True,
+        )
+        info = {}
+        failed = []
+        for chunk, result in zip(option_chunks, results):
+            if isinstance(result, PanasonicExceedRateLimit):
+                raise result
+            if isinstance(result, BaseException) or not result:
+                failed.append(chunk)
+            else:
+                info.update(result)
+        return info, failed
+
+    async def read_device_info(
+        self, deviceId: str, gwid: str, model_type: str, options: list[str]
+    ) -> tuple[dict, list[str]]:
+        """Read status codes, splitting them when a model fails on wide requests.
+
+        Returns the merged status and the codes that could not be read.
+        """
+        wide = len(options) > COMMANDS_PER_REQUEST
+        if not wide or model_type not in self._chunked_models:
+            info = await self.get_device_info(deviceId, gwid, options)
+            if info or not wide:
+                return info, [] if info else list(options)
+
+            # Probe with a single chunk before blaming the width of the request
+            option_chunks = chunks(list(options), COMMANDS_PER_REQUEST)
+            info = await self.get_device_info(deviceId, gwid, option_chunks[0])
+            if not info:
+                return {}, list(options)
+            _LOGGER.info(
+                "Model %s fails on wide status reads, splitting them", model_type
+            )
+            self._chunked_models.add(model_type)
+            partial, failed = await self._get_device_info_chunks(
+                deviceId, gwid, option_chunks[1:]
+            )
+            info.update(partial)
+        else:
+            info, failed = await self._get_device_info_chunks(
+                deviceId, gwid, chunks(list(options), COMMANDS_PER_REQUEST)
+            )
+            if not info:
+                return {}, list(options)
+
+        if failed:
+            # Retry only the chunks that failed
+            self.metrics.retried("status_chunk")
+            partial, failed = await self._get_device_info_chunks(deviceId, gwid, failed)
+            info.update(partial)
+        return info, [code for chunk in failed for code in chunk]
+
+    @retryAuth
     async def get_overview(self):
+        """Status of every device in one call, renewing an expired token.
+
+        It is the only read left during a rate limit cooldown, so it can not
+        rely on per-device reads to renew the token.
+        """
         headers = {"cptoken": self._cp_token}
         response = await self.request(
             method="GET",
@@ -149,91 +318,289 @@ class SmartApp(object):
         )
 
         result = defaultdict(dict)
-        for device in response.get("GwList"):
-            for info in device.get("List"):
+        for device in (response or {}).get("GwList") or []:
+            for info in device.get("List") or []:
                 command = info.get("CommandType")
                 status = info.get("Status")
                 result[device.get("GWID")][command] = status
         return result
 
-    async def get_device_with_info(self, status_code_mapping: dict):
+    def get_device_status(self, device: dict, status_codes=()) -> DeviceStatus:
+        """Long-lived status record of a device, refreshed in place every update"""
+        auth = device.get("Auth")
+        status = self._statuses.get(auth)
+        if status is None:
+            model_type = device.get("ModelType")
+            index = self._status_indexes.get(model_type)
+            if index is None:
+                index = CommandTypeIndex(status_codes)
+                self._status_indexes[model_type] = index
+            status = DeviceStatus(index)
+            self._statuses[auth] = status
+        return status
+
+    def want_status_codes(self, auth: str, key: str, codes) -> None:
+        """Register the status codes an entity reads; None means all of them"""
+        self._wanted_codes.setdefault(auth, {})[key] = (
+            None if codes is None else frozenset(codes)
+        )
+
+    def drop_status_codes(self, auth: str, key: str) -> None:
+        # Left empty rather than removed: every entity of the device is
+        # disabled, which is not the same as none added yet
+        wanted = self._wanted_codes.get(auth)
+        if wanted is not None:
+            wanted.pop(key, None)
+
+    def _requested_codes(self, device_type: int, auth: str, status_codes) -> list:
+        """Status codes backing the enabled entities of a device"""
+        wanted = self._wanted_codes.get(auth)
+        # Before the entities are added, e.g. on the first refresh
+        if wanted is None or None in wanted.values():
+            return list(status_codes)
+
+        keep = self.scheduler.status_codes(device_type).union(*wanted.values())
+        return [code for code in status_codes if code in keep]
+
+    def get_countdown(self, device: dict, command_type: str) -> int | None:
+        """Countdown status ticked down from the last read of the device"""
+        auth = device.get("Auth")
+        status = self._statuses.get(auth) or {}
+        try:
+            value = float(status.get(command_type))
+        except (TypeError, ValueError):
+            return None
+
+        timer = self.scheduler.timer_codes.get(int(device.get("DeviceType")), {})
+        read_at = self._status_read_at.get(auth, {}).get(command_type)
+        if command_type not in timer or read_at is None or value <= 0:
+            return int(value)
+
+        unit = timer[command_type][0]
+        elapsed = self.scheduler.now() - read_at
+        return max(math.ceil(value - elapsed / unit), 0)
+
+    def _mark_read(self, auth: str, values: dict, now: float) -> None:
+        """Record the read time of the codes that came back with a value"""
+        read_at = self._status_read_at.setdefault(auth, {})
+        for code, value in values.items():
+            if value != "":
+                read_at[code] = now
+
+    @traced("refresh_account")
+    async def _get_devices_with_reports(self, now: float) -> list:
+        """Refresh device list, and reports when they are due"""
         # Call APIs concurrently
-        get_device_task = asyncio.create_task(self.get_devices())
-        get_energy_report_task = asyncio.create_task(self.get_energy_report())
-        get_co2_report_task = asyncio.create_task(self.get_co2_report())
-        get_ref_open_door_report_task = asyncio.create_task(self.get_ref_open_door_report())
-
-        devices = await get_device_task or []
-        energy_report = await get_energy_report_task
-        co2_report = await get_co2_report_task
-        ref_open_door_report = await get_ref_open_door_report_task
-
-        async def get_device_overview(gwid: str):
-            all_device_overview = await self.get_overview() or {}
-            device_overview = all_device_overview.get(gwid, {})
-            if device_overview and "" in list(dict(device_overview).values()):
-                """ Retry if API return empty status for current device """
-                return await get_device_overview(gwid)
-            else:
-                return device_overview
+        calls = [self.get_devices()]
+        reports_due = self.scheduler.reports_due(now)
+        if reports_due:
+            calls += [
+                self.get_energy_report(),
+                self.get_co2_report(),
+                self.get_report(REPORT_OTHER),
+            ]
+        # Every call is awaited even when one of them fails
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # A rate limit takes precedence, it starts the cooldown
+            raise next(
+                (error for error in errors if isinstance(error, PanasonicExceedRateLimit)),
+                errors[0],
+            )
+        if reports_due:
+            self._reports = tuple(results[1:])
+            self.scheduler.reports_polled(now)
+
+        devices = results[0] or []
+        energy_report, co2_report, other_report = self._reports
+        self.scheduler.account_polled(now)
 
         for device in devices:
-            device_type = int(device.get("DeviceType"))
             gwid = device.get("GWID")
-
             device["energy"] = energy_report.get(gwid)
             device["co2"] = co2_report.get(gwid)
-            device["ref_open_door"] = ref_open_door_report.get(gwid)
+            device["other"] = other_report.get(gwid, {})
+            open_door = device["other"].get(REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR)
+            device["ref_open_door"] = None if open_door is None else int(open_door)
+
+        self.scheduler.forget([device.get("Auth") for device in devices])
+        return devices
+
+    def cooldown_as_dict(self) -> dict:
+        return {"until": self.rate_limited_until}
+
+    def restore_cooldown(self, data: dict) -> None:
+        """Cooldown saved before a restart, ended or not"""
+        self.rate_limited_until = data.get("until")
+
+    def in_cooldown(self) -> bool:
+        """Whether only the bulk overview may be used after a rate limit"""
+        if self.rate_limited_until is None:
+            return False
+        if self.wall_clock() < self.rate_limited_until:
+            return True
+
+        _LOGGER.info("Rate limit cooldown is over, resuming per-device reads")
+        self.rate_limited_until = None
+        self._recovery_reads = RATE_LIMIT_RECOVERY_READS
+        return False
+
+    def _enter_cooldown(self) -> None:
+        _LOGGER.warning(
+            "超量使用 API，功能將受限制，詳見 https://github.com/osk2/panasonic_smart_app/discussions/31"
+        )
+        self.rate_limited_until = self.wall_clock() + RATE_LIMIT_COOLDOWN
+        self._recovery_reads = None
+
+    @traced("overview")
+    async def _apply_overview(self, devices: list, now: float, polled: dict) -> None:
+        """Update statuses of devices from a single UserGetDeviceStatus call"""
+        try:
+            overview = await self.get_overview() or {}
+        except PanasonicExceedRateLimit:
+            self._enter_cooldown()
+            return
+        except PanasonicBaseException as exception:
+            _LOGGER.warning(exception)
+            return
+
+        for device in devices:
+            device_overview = overview.get(device.get("GWID"))
+            if not device_overview:
+                continue
+            _LOGGER.debug("[%s] overview: %s", device["NickName"], device_overview)
+            # Keep the last known value of codes the overview left empty
+            device["status"].update(
+                (code, value) for code, value in device_overview.items() if value != ""
+            )
+            auth = device.get("Auth")
+            self._mark_read(auth, device_overview, now)
+            polled[auth] = (int(device.get("DeviceType")), device["status"])
+
+    @traced("poll_cycle")
+    async def get_device_with_info(
+        self,
+        status_code_mapping: dict,
+        active_codes=None,
+        idle_codes=None,
+        timer_codes=None,
+    ):
+        """Get devices with their reports and statuses.
+
+        Device list and reports are refreshed once per update interval; each
+        device status is read only when the poll scheduler says it is due.
+        """
+        self.tracer.start_cycle()
+        if active_codes is not None:
+            self.scheduler.active_codes = active_codes
+        if idle_codes is not None:
+            self.scheduler.idle_codes = idle_codes
+        if timer_codes is not None:
+            self.scheduler.timer_codes = timer_codes
+
+        now = self.scheduler.now()
+        degraded = self.in_cooldown()
+        account_due = self.scheduler.account_due(now) and not degraded
+        if account_due or not self._devices:
+            try:
+                devices = await self._get_devices_with_reports(now)
+            except PanasonicExceedRateLimit:
+                if not self._devices:
+                    raise
+                self._enter_cooldown()
+                degraded = True
+                devices = self._devices
+        else:
+            devices = self._devices
+
+        polled = {}
+        # Devices left to the overview of this cycle
+        stale = []
+        reads_left = None if degraded else self._recovery_reads
+        for device in devices:
+            device_type = int(device.get("DeviceType"))
+            gwid = device.get("GWID")
+            auth = device.get("Auth")
 
             if device_type in status_code_mapping.keys():
                 status_codes = status_code_mapping[device_type]
-                device["status"] = {}
+                device["status"] = self.get_device_status(device, status_codes)
+                if not self.scheduler.is_due(auth, now):
+                    continue
+
+                if degraded or reads_left == 0:
+                    stale.append(device)
+                    continue
+
+                model_type = device.get("ModelType")
+                supported_codes = self.capabilities.filter(
+                    model_type, self._requested_codes(device_type, auth, status_codes)
+                )
+                if not supported_codes:
+                    # Nothing enabled needs a read
+                    continue
                 try:
-                    info = await self.get_device_info(device.get("Auth"), gwid, status_codes)
+                    with self.tracer.span(
+                        "read_device",
+                        device=device.get("NickName"),
+                        codes=len(supported_codes),
+                    ):
+                        info, failed = await self.read_device_info(
+                            auth, gwid, model_type, supported_codes
+                        )
+                    self.capabilities.learn_response(
+                        model_type,
+                        [code for code in supported_codes if code not in failed],
+                        info,
+                    )
+                    # Keep the last known value of codes that failed this time
+                    kept = {
+                        code: device["status"][code]
+                        for code in failed
+                        if info and code in device["status"]
+                    }
+                    device["status"].clear()
                     device["status"].update(info)
+                    device["status"].update(kept)
+                    self._mark_read(auth, info, now)
+                    polled[auth] = (device_type, device["status"])
+                    if reads_left is not None:
+                        reads_left -= 1
                 except PanasonicExceedRateLimit:
-                    _LOGGER.warning(
-                        "超量使用 API，功能將受限制，詳見 https://github.com/osk2/panasonic_smart_app/discussions/31"
-                    )
-                    overview = await get_device_overview(gwid)
-                    target_device = list(
-                        filter(lambda d: d["GWID"] == gwid, self._devices)
-                    )
-                    _LOGGER.debug(
-                        f"[{target_device[0]['NickName']}] overview: {overview}"
-                    )
-                    device["status"].update(overview)
-                    break
-
+                    self._enter_cooldown()
+                    degraded = True
+                    stale.append(device)
+
+        if degraded:
+            # Device list and reports wait for the cooldown to end
+            self.scheduler.account_polled(now)
+            if stale:
+                # One bulk read refreshes every device
+                stale = [device for device in devices if "status" in device]
+        if stale:
+            await self._apply_overview(stale, now, polled)
+
+        if not degraded and reads_left is not None and reads_left < self._recovery_reads:
+            # Double the reads allowed per cycle while no rate limit comes back
+            self._recovery_reads *= 2
+            if self._recovery_reads >= len(devices):
+                _LOGGER.info("Resumed per-device status reads")
+                self._recovery_reads = None
+
+        self.scheduler.plan(polled, now)
         return devices
 
-    async def get_energy_report(self) -> dict[str, float]:
-        headers = {"cptoken": self._cp_token}
-        payload = {
-            "name": "Power",
-            "from": datetime.today().replace(day=1).strftime("%Y/%m/%d"),
-            "unit": "day",
-            "max_num": 31,
-        }
-        response = await self.request(
-            method="POST",
-            headers=headers,
-            endpoint=urls.get_info(),
-            data=payload,
-        )
-        result = {}
-        for device in response.get("GwList"):
-            result[device.get("GwID")] = float(device.get("Total_kwh"))
-        return result
-
-    async def get_co2_report(self) -> dict[str, float]:
-        """Get CO2 report for current month"""
+    async def get_report(self, name: str) -> dict[str, dict[str, float]]:
+        """Get every numeric metric of a report for current month"""
         headers = {"cptoken": self._cp_token}
         payload = {
-            "name": "CO2",
-            "from": datetime.today().replace(day=1).strftime("%Y/%m/%d"),
+            "name": name,
+            "from": datetime.fromtimestamp(self.wall_clock())
+            .replace(day=1)
+            .strftime("%Y/%m/%d"),
             "unit": "day",
-            "max_num": 31,
+            "max_num": REPORT_MAX_DAYS,
         }
         response = await self.request(
             method="POST",
@@ -242,48 +609,55 @@ class SmartApp(object):
             data=payload,
         )
 
-        try:
-            gw_list = response["GwList"]
-        except KeyError:
-            _LOGGER.info("No CO2 data available")
-            return {}
-
-        result = {}
-        for index, device in enumerate(gw_list):
-            try:
-                gw_id = device["GwID"]
-            except KeyError:
-                _LOGGER.info(f"No CO2 data available for device {index}")
-                continue
+        report = parse_report_metrics(response or {})
+        if not report:
+            _LOGGER.info("No %s report available", name)
+        return report
 
-            try:
-                co2 = float(device["Total_kg"])
-            except KeyError:
-                _LOGGER.info(f"No CO2 data available for device {index}")
-                continue
-            except ValueError:
-                _LOGGER.warning(
-                    f"Invalid CO2 data {device['Total_kg']} for device {index}"
-                )
-                continue
+    @staticmethod
+    def _report_metric(report: dict, metric: str) -> dict[str, float]:
+        return {
+            gw_id: metrics[metric]
+            for gw_id, metrics in report.items()
+            if metric in metrics
+        }
 
-            result[gw_id] = co2
+    async def get_energy_report(self) -> dict[str, float]:
+        """Get energy report for current month"""
+        report = await self.get_report(REPORT_POWER)
+        return self._report_metric(report, REPORT_TOTAL_ENERGY)
 
-        return result
+    async def get_co2_report(self) -> dict[str, float]:
+        """Get CO2 report for current month"""
+        report = await self.get_report(REPORT_CO2)
+        return self._report_metric(report, REPORT_TOTAL_CO2)
 
     async def get_ref_open_door_report(self) -> dict[str, int]:
         """Get refrigerator open door report for current month"""
+        report = await self.get_report(REPORT_OTHER)
+        return {
+            gw_id: int(value)
+            for gw_id, value in self._report_metric(
+                report, REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR
+            ).items()
+        }
 
-        # TODO: Response from "Other" may contain reports other than
-        #       Ref_OpenDoor_Total. Make it more generic to handle
-        #       other reports when we know what they are.
+    @retryAuth
+    async def get_daily_report(
+        self, name: str, start: date
+    ) -> dict[str, list[tuple[date, float]]]:
+        """Get per-day values of a report starting from the given day.
 
+        Unlike the other getters, failures are raised rather than returned as
+        an empty report, so callers can tell a failed fetch from a month
+        without data.
+        """
         headers = {"cptoken": self._cp_token}
         payload = {
-            "name": "Other",
-            "from": datetime.today().replace(day=1).strftime("%Y/%m/%d"),
+            "name": name,
+            "from": start.strftime("%Y/%m/%d"),
             "unit": "day",
-            "max_num": 31,
+            "max_num": REPORT_MAX_DAYS,
         }
         response = await self.request(
             method="POST",
@@ -291,53 +665,137 @@ class SmartApp(object):
             endpoint=urls.get_info(),
             data=payload,
         )
+        if response is None:
+            raise PanasonicBaseException(f"Failed to get {name} report from {start}")
+        return parse_daily_report(response)
+
+    async def iter_monthly_reports(
+        self, name: str, months: list[date], concurrency=BACKFILL_MONTHS_AHEAD
+    ) -> AsyncIterator[tuple[date, dict[str, list[tuple[date, float]]]]]:
+        """Yield the daily report of each month in order.
+
+        Up to `concurrency` months are fetched ahead of the consumer, so only
+        that many reports are held in memory at once. The first month that
+        fails to be fetched raises, and no later month is yielded.
+        """
+        months = iter(months)
+        pending = deque()
+
+        def schedule_next():
+            month = next(months, None)
+            if month is not None:
+                task = asyncio.create_task(self.get_daily_report(name, month))
+                pending.append((month, task))
+
+        for _ in range(concurrency):
+            schedule_next()
 
         try:
-            gw_list = response["GwList"]
-        except KeyError:
-            _LOGGER.info("No refrigerator open door data available")
-            return {}
-
-        report = {}
-        for index, device in enumerate(gw_list):
-            try:
-                gw_id = device["GwID"]
-            except KeyError:
-                _LOGGER.info(
-                    f"No refrigerator open door data available for device {index}"
-                )
-                continue
-
-            try:
-                open_door = int(device["Ref_OpenDoor_Total"])
-            except KeyError:
-                _LOGGER.info(
-                    f"No refrigerator open door data available for device {index}"
-                )
-                continue
-            except ValueError:
-                _LOGGER.warning(
-                    "Invalid refrigerator open door data "
-                    f"{device['Ref_OpenDoor_Total']} for device {index}"
-                )
-                continue
-
-            report[gw_id] = open_door
-
-        return report
+            while pending:
+                month, task = pending.popleft()
+                report = await task
+                schedule_next()
+                yield month, {
+                    gwid: [
+                        (day, value)
+                        for day, value in series
+                        if (day.year, day.month) == (month.year, month.month)
+                    ]
+                    for gwid, series in report.items()
+                }
+        finally:
+            for _, task in pending:
+                if task.done() and not task.cancelled():
+                    # Months fetched ahead of a failure are dropped unseen
+                    task.exception()
+                task.cancel()
 
     @tryApiStatus
     async def set_command(self, deviceId=None, command=0, value=0):
         headers = {"cptoken": self._cp_token, "auth": deviceId}
         payload = {"DeviceID": 1, "CommandType": command, "Value": value}
+        self.scheduler.expedite(deviceId)
 
-        await self.request(
+        response = await self.request(
             method="GET", headers=headers, endpoint=urls.set_command(), params=payload
         )
-        return True
+        # None when the cloud answered with an unexpected status
+        return response is not None
+
+    def update_mask(
+        self, deviceId: str, status_code: str, command: int, set_bits=0, clear_bits=0
+    ) -> asyncio.Future:
+        """Change bits of a bitmask command such as the smart switch 0x70.
+
+        The cached status is updated before returning, so the change can be
+        shown right away. Changes requested within MASK_WRITE_WINDOW are
+        merged into one write, and writes to a device are serialized. The
+        returned future is True once written; on failure it is False and
+        the cached bits are put back. It never raises.
+        """
+        status = self._statuses.get(deviceId)
+        batch = self._mask_batches.get(deviceId)
+        if batch is None:
+            previous = parse_mask(status.get(status_code) if status else None)
+            batch = self._mask_batches[deviceId] = MaskBatch(previous)
+            batch.task = asyncio.create_task(
+                self._write_mask(deviceId, status_code, command, batch)
+            )
+        batch.add(set_bits, clear_bits)
+
+        if status is not None:
+            status[status_code] = format(
+                batch.apply(parse_mask(status.get(status_code))), "x"
+            )
+        return asyncio.shield(batch.done)
+
+    async def _write_mask(
+        self, deviceId: str, status_code: str, command: int, batch: MaskBatch
+    ) -> None:
+        written = False
+        try:
+            await asyncio.sleep(MASK_WRITE_WINDOW)
+            lock = self._mask_locks.setdefault(deviceId, asyncio.Lock())
+            async with lock:
+                # Later changes start a new batch written after this one
+                if self._mask_batches.get(deviceId) is batch:
+                    del self._mask_batches[deviceId]
+
+                status = self._statuses.get(deviceId)
+                mask = batch.apply(
+                    parse_mask(status.get(status_code) if status else None)
+                )
+                try:
+                    # tryApiStatus returns an empty dict when the write failed
+                    written = await self.set_command(deviceId, command, mask) is True
+                except Exception as exception:
+                    _LOGGER.warning(exception)
+        finally:
+            # Also when cancelled, e.g. on unload, so no caller waits forever
+            if self._mask_batches.get(deviceId) is batch:
+                del self._mask_batches[deviceId]
+            # Only the bits of this batch change: a later batch may have
+            # changed others in the meantime
+            status = self._statuses.get(deviceId)
+            if status is not None:
+                current = parse_mask(status.get(status_code))
+                current = batch.apply(current) if written else batch.revert(current)
+                status[status_code] = format(current, "x")
+            batch.done.set_result(written)
+
+    async def request(self, method, headers, endpoint, **kwargs):
+        """Shared request method, waiting for a slot of the dispatcher"""
+        with self.tracer.span("request", endpoint=endpoint_name(endpoint)):
+            with self.tracer.span("wait_slot"):
+                await self._dispatcher.acquire(self.account)
+            try:
+                self.budget.record(endpoint)
+                return await self._request(method, headers, endpoint, **kwargs)
+            finally:
+                self._dispatcher.release()
 
     @delay
-    async def request(
+    async def _request(
         self,
         method: Literal["GET", "POST"],
         headers,
@@ -346,16 +804,24 @@ class SmartApp(object):
         data=None,
         log=True,
     ):
-        """Shared request method"""
-
         resp = None
         request_id = self.last_request_id + 1
         self.last_request_id = request_id
         headers["user-agent"] = USER_AGENT
-        if log:
+        debug = log and _LOGGER.isEnabledFor(logging.DEBUG)
+        sampled = debug and request_id % DEBUG_LOG_SAMPLE == 0
+        if sampled:
             _LOGGER.debug(
-                f"Making #{request_id} request to {endpoint} with headers {headers} and data {data}, proxy: {self._proxy}"
+                "Making #%d request to %s with headers %s and data %s, proxy: %s",
+                request_id,
+                endpoint,
+                redact(headers),
+                redact(data),
+                self._proxy,
             )
+        elif debug:
+            _LOGGER.debug("Making #%d request to %s", request_id, endpoint)
+        started_at = self.clock()
         try:
             response = await self._session.request(
                 method,
@@ -367,6 +833,9 @@ class SmartApp(object):
                 proxy=self._proxy,
             )
         except:
+            ended_at = self.clock()
+            self.metrics.record(endpoint, "error", ended_at - started_at)
+            self.tracer.record("http", started_at, ended_at, status="error")
             auth = headers.get("auth", None)
             if auth:
                 device = list(
@@ -378,23 +847,32 @@ class SmartApp(object):
             else:
                 raise PanasonicDeviceOffline(f"無法連線至裝置，將於下輪更新時重試")
 
+        # The body is read and decoded once, whatever is logged
+        try:
+            body = await response.read()
+        except:
+            body = b""
+        ended_at = self.clock()
+        self.metrics.record(endpoint, response.status, ended_at - started_at, len(body))
+        self.tracer.record("http", started_at, ended_at, status=response.status)
+
         if response.status == HTTPStatus.OK:
             try:
-                resp = await response.json()
-                if log:
-                    _LOGGER.debug(
-                        "Succeed to access #%d API. Returned" " %d: %s",
-                        request_id,
-                        response.status,
-                        await response.text(),
-                    )
-            except:
+                resp = json_loads(body)
+            except ValueError:
                 resp = {}
+            if sampled:
+                _LOGGER.debug(
+                    "Succeed to access #%d API. Returned %d: %s",
+                    request_id,
+                    response.status,
+                    redact(resp),
+                )
         elif response.status == HTTPStatus.EXPECTATION_FAILED:
             resp = {}
             try:
-                resp = await response.json()
-            except:
+                resp = json_loads(body)
+            except ValueError:
                 """ Invalid CPToken or something else """
                 raise PanasonicLoginFailed
 
@@ -423,7 +901,7 @@ class SmartApp(object):
                     "Failed to access #%d API. Returned" " %d: %s",
                     request_id,
                     response.status,
-                    await response.text(),
+                    body.decode(errors="replace"),
                 )
                 raise PanasonicLoginFailed
 
@@ -434,7 +912,7 @@ class SmartApp(object):
                 "Failed to access #%d API. Returned" " %d: %s",
                 request_id,
                 response.status,
-                await response.text(),
+                body.decode(errors="replace"),
             )
 
         return resp
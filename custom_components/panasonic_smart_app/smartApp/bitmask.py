@@ -0,0 +1,37 @@
+""" Coalesced writes of bitmask commands """
+import asyncio
+
+
+def parse_mask(value) -> int:
+    """Bitmask from a hexadecimal status value"""
+    try:
+        return int(value or "0", 16)
+    except (TypeError, ValueError):
+        return 0
+
+
+class MaskBatch(object):
+    """Bit changes of one device waiting to be written together"""
+
+    __slots__ = ("set_bits", "clear_bits", "previous", "done", "task")
+
+    def __init__(self, previous: int = 0):
+        self.set_bits = 0
+        self.clear_bits = 0
+        # Mask before the first change of the batch
+        self.previous = previous
+        self.done = asyncio.get_running_loop().create_future()
+        self.task = None
+
+    def add(self, set_bits: int, clear_bits: int) -> None:
+        # The latest change of a bit wins
+        self.set_bits = (self.set_bits | set_bits) & ~clear_bits
+        self.clear_bits = (self.clear_bits | clear_bits) & ~set_bits
+
+    def apply(self, mask: int) -> int:
+        return (mask | self.set_bits) & ~self.clear_bits
+
+    def revert(self, mask: int) -> int:
+        """Bits changed by the batch put back as they were before it"""
+        changed = self.set_bits | self.clear_bits
+        return (mask & ~changed) | (self.previous & changed)
@@ -0,0 +1,118 @@
+""" Daily API call budget of a Panasonic account """
+from collections import deque
+import time
+
+from .const import (
+    BUDGET_WINDOW,
+    BUDGET_RESERVE,
+    BUDGET_MAX_REPORT_STRETCH,
+    BUDGET_MAX_STRETCH,
+)
+
+
+def endpoint_name(endpoint: str) -> str:
+    return endpoint.rstrip("/").rsplit("/", 1)[-1]
+
+
+class CallBudget(object):
+    """Counts API calls over a rolling day and plans how to stay under a budget.
+
+    Reports are the first to be refreshed less often, then every poll is
+    stretched evenly. The last BUDGET_RESERVE of the budget is kept for
+    commands, logins and token refreshes.
+    """
+
+    def __init__(self, daily_budget: int | None = None, clock=time.monotonic):
+        self.daily_budget = daily_budget
+        self.clock = clock
+        self._calls: dict[str, deque] = {}
+        self.stretch = 1.0
+        self.report_stretch = 1.0
+        self.projected = 0.0
+
+    def record(self, endpoint: str) -> None:
+        name = endpoint_name(endpoint)
+        calls = self._calls.get(name)
+        if calls is None:
+            calls = self._calls[name] = deque()
+        calls.append(self.clock())
+
+    def _prune(self, now: float) -> None:
+        since = now - BUDGET_WINDOW
+        for calls in self._calls.values():
+            while calls and calls[0] < since:
+                calls.popleft()
+
+    def used(self, window: float = BUDGET_WINDOW) -> dict[str, int]:
+        """Calls per endpoint within the last window seconds"""
+        now = self.clock()
+        self._prune(now)
+        since = now - window
+        used = {}
+        for name, calls in self._calls.items():
+            if window >= BUDGET_WINDOW:
+                count = len(calls)
+            else:
+                count = sum(1 for called_at in calls if called_at >= since)
+            if count:
+                used[name] = count
+        return used
+
+    @property
+    def used_today(self) -> int:
+        return sum(self.used().values())
+
+    @property
+    def remaining(self) -> int | None:
+        if not self.daily_budget:
+            return None
+        return max(self.daily_budget - self.used_today, 0)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether only the reserve is left"""
+        remaining = self.remaining
+        return remaining is not None and remaining <= self.daily_budget * BUDGET_RESERVE
+
+    def plan(self, device_rate: float, account_rate: float, report_rate: float) -> None:
+        """Pick stretch factors from projected calls per second of each kind"""
+        self.projected = (device_rate + account_rate + report_rate) * BUDGET_WINDOW
+        self.stretch = self.report_stretch = 1.0
+        if not self.daily_budget:
+            return
+
+        if self.exhausted:
+            self.stretch = BUDGET_MAX_STRETCH
+            self.report_stretch = BUDGET_MAX_REPORT_STRETCH
+            return
+
+        allowed = self.daily_budget * (1 - BUDGET_RESERVE) / BUDGET_WINDOW
+        if device_rate + account_rate + report_rate <= allowed:
+            return
+
+        # Refresh reports less often first
+        min_report_rate = report_rate / BUDGET_MAX_REPORT_STRETCH
+        left = allowed - device_rate - account_rate
+        if left >= min_report_rate:
+            self.report_stretch = report_rate / left
+            return
+
+        # Then stretch every poll evenly
+        self.report_stretch = BUDGET_MAX_REPORT_STRETCH
+        left = allowed - min_report_rate / BUDGET_MAX_STRETCH
+        if left <= 0:
+            self.stretch = BUDGET_MAX_STRETCH
+            return
+        self.stretch = min(
+            max((device_rate + account_rate) / left, 1.0), BUDGET_MAX_STRETCH
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "daily_budget": self.daily_budget,
+            "used": self.used(),
+            "used_last_hour": self.used(3600),
+            "projected": round(self.projected),
+            "stretch": round(self.stretch, 2),
+            "report_stretch": round(self.report_stretch, 2),
+        }
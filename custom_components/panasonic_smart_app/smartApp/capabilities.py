@@ -0,0 +1,106 @@
+""" Status codes each Panasonic model actually supports """
+from collections.abc import Iterable, Mapping
+import time
+
+from .const import CAPABILITY_MISSES, CAPABILITY_REPROBE
+
+
+class ModelCapabilities(object):
+    """Learns per ModelType which status codes are worth requesting.
+
+    Codes listed in CommandList or answered at least once are supported.
+    A code that comes back empty CAPABILITY_MISSES times in a row, while
+    the device answers other codes, is left out of requests for
+    CAPABILITY_REPROBE seconds.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.changed = False
+        self._supported: dict[str, set[str]] = {}
+        self._unsupported: dict[str, dict[str, float]] = {}
+        self._misses: dict[tuple[str, str], int] = {}
+
+    def learn_command_list(self, command_list: Iterable[dict]) -> None:
+        for command in command_list:
+            try:
+                codes = command["JSON"][0]["list"]
+            except (KeyError, IndexError, TypeError):
+                continue
+            for code in codes:
+                self._mark_supported(command["ModelType"], code["CommandType"].lower())
+
+    def _mark_supported(self, model_type: str, code: str) -> None:
+        supported = self._supported.setdefault(model_type, set())
+        if code not in supported:
+            supported.add(code)
+            self.changed = True
+        self._misses.pop((model_type, code), None)
+        if self._unsupported.get(model_type, {}).pop(code, None) is not None:
+            self.changed = True
+
+    def filter(self, model_type: str, codes: Iterable[str]) -> list[str]:
+        """Codes worth requesting from a device of the given model"""
+        unsupported = self._unsupported.get(model_type)
+        if not unsupported:
+            return list(codes)
+
+        now = self.clock()
+        result = []
+        for code in codes:
+            since = unsupported.get(code.lower())
+            if since is None:
+                result.append(code)
+            elif now - since >= CAPABILITY_REPROBE:
+                # Firmware updates may add codes, ask again once in a while
+                del unsupported[code.lower()]
+                self.changed = True
+                result.append(code)
+        return result
+
+    def learn_response(
+        self, model_type: str, requested: Iterable[str], info: Mapping
+    ) -> None:
+        """Learn from a DeviceGetInfo answer to the requested codes"""
+        if not any(value not in (None, "") for value in info.values()):
+            # Offline or failed, nothing to learn
+            return
+
+        supported = self._supported.get(model_type, ())
+        for code in requested:
+            key = code.lower()
+            if info.get(code) not in (None, ""):
+                self._mark_supported(model_type, key)
+                continue
+            if key in supported:
+                continue
+
+            misses = self._misses.get((model_type, key), 0) + 1
+            self._misses[(model_type, key)] = misses
+            if misses >= CAPABILITY_MISSES:
+                del self._misses[(model_type, key)]
+                self._unsupported.setdefault(model_type, {})[key] = self.clock()
+                self.changed = True
+
+    def as_dict(self) -> dict:
+        return {
+            "supported": {
+                model_type: sorted(codes) for model_type, codes in self._supported.items()
+            },
+            "unsupported": {
+                model_type: dict(codes)
+                for model_type, codes in self._unsupported.items()
+                if codes
+            },
+        }
+
+    def restore(self, data: Mapping) -> None:
+        self._supported = {
+            model_type: set(codes)
+            for model_type, codes in (data.get("supported") or {}).items()
+        }
+        self._unsupported = {
+            model_type: dict(codes)
+            for model_type, codes in (data.get("unsupported") or {}).items()
+        }
+        self.changed = False
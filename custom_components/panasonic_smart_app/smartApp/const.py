@@ -1,10 +1,50 @@
-BASE_URL = "https://ems2.panasonic.com.tw/api"
+import os
+
+# Overridable to point the client at a stand-in server such as tools/mock_cloud
+BASE_URL = os.environ.get(
+    "PANASONIC_SMART_APP_BASE_URL", "https://ems2.panasonic.com.tw/api"
+)
 APP_TOKEN = "D8CBFF4C-2824-4342-B22D-189166FEF503"
 USER_AGENT = "okhttp/4.9.1"
 
 SECONDS_BETWEEN_REQUEST = 2
 REQUEST_TIMEOUT = 20
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, REQUEST_TIMEOUT)
+# Poll cycles kept by the tracer
+TRACE_CYCLES = 50
+# Requests whose payloads are logged in full at debug level, one out of
+DEBUG_LOG_SAMPLE = 5
 COMMANDS_PER_REQUEST = 6
+CONCURRENT_REQUESTS = 4
+# Seconds idle connections and resolved addresses of the cloud are kept
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 600
+# Seconds bitmask changes are collected before being written together
+MASK_WRITE_WINDOW = 0.5
+POLL_INTERVAL = 180
+POLL_INTERVAL_ACTIVE = 60
+POLL_IDLE_FACTOR = 5
+POLL_TRANSITION_MARGIN = 10
+POLL_MIN_WAKEUP = 5
+BACKFILL_MONTHS_AHEAD = 3
+
+# Seconds of bulk-only polling after a rate limit, and per-device reads
+# allowed in the first cycle after it
+RATE_LIMIT_COOLDOWN = 3600
+RATE_LIMIT_RECOVERY_READS = 1
+
+# Empty answers in a row before a status code is considered unsupported by
+# a model, and seconds before asking for it again
+CAPABILITY_MISSES = 3
+CAPABILITY_REPROBE = 7 * 86400
+
+# Rolling window of the daily API budget, in seconds
+BUDGET_WINDOW = 86400
+# Share of the budget kept for commands, logins and token refreshes
+BUDGET_RESERVE = 0.1
+BUDGET_MAX_REPORT_STRETCH = 20
+BUDGET_MAX_STRETCH = 10
 
 EXCEPTION_COMMAND_NOT_FOUND = "無法透過CommandId取得Commmand"
 EXCEPTION_DEVICE_OFFLINE = "deviceOffline"
@@ -15,3 +55,23 @@ EXCEPTION_TOKEN_EXPIRED = "無法依據您的CPToken,auth取得相關資料"
 EXCEPTION_INVALID_REFRESH_TOKEN = "無效RefreshToken"
 EXCEPTION_CPTOKEN_EXPIRED = "此CPToken已經逾時"
 EXCEPTION_REACH_RATE_LIMIT = "系統檢測您當前超量使用"
+
+REPORT_POWER = "Power"
+REPORT_CO2 = "CO2"
+REPORT_OTHER = "Other"
+REPORT_MAX_DAYS = 31
+# Reports refreshed with the device list every update
+ACCOUNT_REPORTS = (REPORT_POWER, REPORT_CO2, REPORT_OTHER)
+
+REPORT_TOTAL_ENERGY = "Total_kwh"
+REPORT_TOTAL_CO2 = "Total_kg"
+REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR = "Ref_OpenDoor_Total"
+
+# Suffixes of the month-to-date totals of a UserGetInfo GwList entry; any
+# other field (identifiers, names, flags) is not a metric
+REPORT_METRIC_SUFFIXES = ("_Total", "_kwh", "_kg")
+
+# Candidate keys of the daily series in a UserGetInfo GwList entry
+REPORT_SERIES_KEYS = ("Information", "Data", "List", "DataList")
+REPORT_DATE_KEYS = ("DataTime", "Date", "Time", "DataName", "Day")
+REPORT_VALUE_KEYS = ("DataValue", "Value", "Data", "kwh", "kg")
@@ -0,0 +1,65 @@
+""" Request slots shared by every Panasonic account of a process """
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+
+from .const import CONCURRENT_REQUESTS
+
+
+class RequestDispatcher(object):
+    """Hands out a fixed number of request slots round-robin between accounts.
+
+    Every request holds its slot for at least SECONDS_BETWEEN_REQUEST, so the
+    number of slots also caps the combined request rate of all accounts.
+    """
+
+    def __init__(self, slots: int = CONCURRENT_REQUESTS):
+        self._free = slots
+        # Waiting requests per account, in round-robin order
+        self._waiting: dict[str, deque[asyncio.Future]] = {}
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiting.values())
+
+    async def acquire(self, account: str) -> None:
+        if self._free > 0 and not self._waiting:
+            self._free -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(account, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation
+                self.release()
+            else:
+                queue = self._waiting.get(account)
+                if queue is not None and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del self._waiting[account]
+            raise
+
+    def release(self) -> None:
+        while self._waiting:
+            account = next(iter(self._waiting))
+            queue = self._waiting.pop(account)
+            future = queue.popleft()
+            if queue:
+                # Move the account to the back of the line
+                self._waiting[account] = queue
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+    @asynccontextmanager
+    async def slot(self, account: str):
+        await self.acquire(account)
+        try:
+            yield
+        finally:
+            self.release()
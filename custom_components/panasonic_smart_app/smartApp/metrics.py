@@ -0,0 +1,99 @@
+""" Latency, status and traffic of the Panasonic API, per endpoint """
+from bisect import bisect_left
+
+from .budget import endpoint_name
+from .const import LATENCY_BUCKETS
+
+
+class EndpointMetrics(object):
+    def __init__(self):
+        self.requests = 0
+        self.statuses: dict[str, int] = {}
+        # Requests per latency bucket, the last one being above every bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.bytes_received = 0
+
+    def record(self, status: int | str, latency: float, size: int) -> None:
+        self.requests += 1
+        status = str(status)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.bytes_received += size
+
+    @property
+    def latency_mean(self) -> float | None:
+        if not self.requests:
+            return None
+        return self.latency_total / self.requests
+
+    def latency_quantile(self, quantile: float) -> float | None:
+        """Upper bound of the bucket holding the given quantile"""
+        if not self.requests:
+            return None
+        rank = quantile * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.latency_max
+
+    def as_dict(self) -> dict:
+        mean = self.latency_mean
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "latency_mean": round(mean, 3) if mean is not None else None,
+            "latency_p50": self.latency_quantile(0.5),
+            "latency_p95": self.latency_quantile(0.95),
+            "latency_max": round(self.latency_max, 3),
+            "latency_buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.buckets)
+                },
+                "inf": self.buckets[-1],
+            },
+            "bytes_received": self.bytes_received,
+        }
+
+
+class RequestMetrics(object):
+    """Collects what every API request cost since the client was created.
+
+    Latency covers the HTTP exchange only, not the SECONDS_BETWEEN_REQUEST
+    pause nor the wait for a dispatcher slot. Requests that never got an
+    answer are counted under the "error" status.
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        # Requests sent again, per cause
+        self.retries: dict[str, int] = {}
+
+    def get(self, endpoint: str) -> EndpointMetrics:
+        name = endpoint_name(endpoint)
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def record(
+        self, endpoint: str, status: int | str, latency: float, size: int = 0
+    ) -> None:
+        self.get(endpoint).record(status, latency, size)
+
+    def retried(self, cause: str) -> None:
+        self.retries[cause] = self.retries.get(cause, 0) + 1
+
+    def as_dict(self) -> dict:
+        return {
+            "endpoints": {
+                name: metrics.as_dict() for name, metrics in self.endpoints.items()
+            },
+            "retries": dict(self.retries),
+        }
@@ -0,0 +1,114 @@
+""" Parsers for UserGetInfo reports """
+from datetime import date, datetime
+import logging
+
+from .const import (
+    REPORT_SERIES_KEYS,
+    REPORT_DATE_KEYS,
+    REPORT_VALUE_KEYS,
+    REPORT_METRIC_SUFFIXES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATE_FORMATS = ("%Y/%m/%d", "%Y-%m-%d", "%Y%m%d", "%Y/%m/%d %H:%M:%S")
+
+
+def parse_date(value) -> date | None:
+    if not isinstance(value, str):
+        return None
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_number(value) -> float | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_daily_series(gw_entry: dict) -> list[tuple[date, float]]:
+    """Extract the per-day series of one GwList entry.
+
+    Rows are only kept with a recognizable date: placing them by their
+    position would import values on the wrong days if the API ever skips one.
+    """
+    gw_id = gw_entry.get("GwID")
+    for key in REPORT_SERIES_KEYS:
+        rows = gw_entry.get(key)
+        if isinstance(rows, list):
+            break
+    else:
+        _LOGGER.warning(
+            "No daily series found in the report of %s, keys: %s", gw_id, sorted(gw_entry)
+        )
+        return []
+
+    series = []
+    undated = 0
+    for row in rows:
+        if not isinstance(row, dict):
+            undated += 1
+            continue
+
+        day = value = None
+        for date_key in REPORT_DATE_KEYS:
+            day = parse_date(row.get(date_key))
+            if day:
+                break
+        for value_key in REPORT_VALUE_KEYS:
+            value = parse_number(row.get(value_key))
+            if value is not None:
+                break
+
+        if value is None:
+            continue
+        if day is None:
+            undated += 1
+            continue
+        series.append((day, value))
+
+    if undated:
+        _LOGGER.warning(
+            "Skipped %s rows without a recognizable date in the report of %s",
+            undated,
+            gw_id,
+        )
+    return series
+
+
+def parse_daily_report(response: dict) -> dict[str, list[tuple[date, float]]]:
+    """Per-gateway daily series of a UserGetInfo response"""
+    report = {}
+    for gw_entry in response.get("GwList") or []:
+        gw_id = gw_entry.get("GwID")
+        if gw_id is None:
+            continue
+        report[gw_id] = parse_daily_series(gw_entry)
+    return report
+
+
+def parse_report_metrics(response: dict) -> dict[str, dict[str, float]]:
+    """Numeric month-to-date totals of each gateway, in a single pass"""
+    report = {}
+    for gw_entry in response.get("GwList") or []:
+        gw_id = gw_entry.get("GwID")
+        if gw_id is None:
+            continue
+
+        metrics = {}
+        for key, value in gw_entry.items():
+            if not key.endswith(REPORT_METRIC_SUFFIXES):
+                continue
+            number = parse_number(value)
+            if number is not None:
+                metrics[key] = number
+        report[gw_id] = metrics
+    return report
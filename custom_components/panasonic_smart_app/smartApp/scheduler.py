@@ -0,0 +1,166 @@
+""" Activity-adaptive polling of Panasonic devices """
+import time
+
+from .const import (
+    POLL_INTERVAL_ACTIVE,
+    POLL_IDLE_FACTOR,
+    POLL_TRANSITION_MARGIN,
+    POLL_MIN_WAKEUP,
+    ACCOUNT_REPORTS,
+)
+
+
+def is_positive(status, command_type: str) -> bool:
+    try:
+        return float(status.get(command_type) or 0) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+class PollScheduler(object):
+    """Decides which devices need a status read in the current cycle.
+
+    Devices whose decoded state says they are running are read every
+    POLL_INTERVAL_ACTIVE seconds, idle ones every POLL_IDLE_FACTOR times the
+    configured interval. When the mix would exceed the volume of reading every
+    device once per configured interval, all intervals are stretched evenly.
+    A device with a running timer is additionally read just after the timer
+    is predicted to fire. An optional CallBudget stretches everything further
+    to keep the account under its daily API budget.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        active_codes=None,
+        idle_codes=None,
+        timer_codes=None,
+        budget=None,
+        clock=time.monotonic,
+    ):
+        self.interval = interval
+        self.active_codes: dict[int, tuple] = active_codes or {}
+        self.idle_codes: dict[int, tuple] = idle_codes or {}
+        self.timer_codes: dict[int, dict[str, tuple[int, bool]]] = timer_codes or {}
+        self.budget = budget
+        self.clock = clock
+        self._intervals: dict[str, float] = {}
+        self._next_poll: dict[str, float] = {}
+        self._next_account_poll = 0.0
+        self._next_report_poll = 0.0
+
+    @property
+    def tick(self) -> float:
+        """How often the coordinator should wake up"""
+        return min(self.interval, POLL_INTERVAL_ACTIVE)
+
+    def now(self) -> float:
+        return self.clock()
+
+    def device_interval(self, device_type: int, status) -> float:
+        if not status or device_type not in self.active_codes:
+            return self.interval
+
+        idle = self.interval * POLL_IDLE_FACTOR
+        if any(is_positive(status, code) for code in self.idle_codes.get(device_type, ())):
+            return idle
+        if any(is_positive(status, code) for code in self.active_codes[device_type]):
+            return min(POLL_INTERVAL_ACTIVE, self.interval)
+        return idle
+
+    def status_codes(self, device_type: int) -> set[str]:
+        """Codes the scheduler needs to read to classify a device"""
+        return {
+            *self.active_codes.get(device_type, ()),
+            *self.idle_codes.get(device_type, ()),
+            *self.timer_codes.get(device_type, ()),
+        }
+
+    def next_transition(self, device_type: int, status) -> tuple[float, bool] | None:
+        """Seconds until the earliest timer of a device fires.
+
+        Also tells whether that timer is the only thing expected to change
+        before it fires, in which case reads before it are redundant.
+        """
+        transition = None
+        for code, (unit, exclusive) in self.timer_codes.get(device_type, {}).items():
+            try:
+                remaining = float(status.get(code) or 0)
+            except (TypeError, ValueError):
+                continue
+            if remaining > 0 and (transition is None or remaining * unit < transition[0]):
+                transition = (remaining * unit, exclusive)
+        return transition
+
+    def next_wakeup(self, now: float) -> float:
+        """Seconds until the coordinator should run again"""
+        upcoming = [self._next_account_poll, *self._next_poll.values()]
+        return max(POLL_MIN_WAKEUP, min(self.tick, min(upcoming) - now))
+
+    def account_due(self, now: float) -> bool:
+        """Whether device list and reports should be refreshed"""
+        return now >= self._next_account_poll
+
+    def account_polled(self, now: float) -> None:
+        self._next_account_poll = now + self.interval * self.stretch
+
+    def reports_due(self, now: float) -> bool:
+        return now >= self._next_report_poll
+
+    def reports_polled(self, now: float) -> None:
+        report_stretch = 1.0 if self.budget is None else self.budget.report_stretch
+        self._next_report_poll = now + self.interval * self.stretch * report_stretch
+
+    @property
+    def stretch(self) -> float:
+        return 1.0 if self.budget is None else self.budget.stretch
+
+    def is_due(self, auth: str, now: float) -> bool:
+        return now >= self._next_poll.get(auth, 0.0)
+
+    def expedite(self, auth: str) -> None:
+        """Read the device in the next cycle, e.g. after a command"""
+        self._next_poll.pop(auth, None)
+
+    def forget(self, auths) -> None:
+        """Drop devices that are no longer registered"""
+        for auth in set(self._intervals) - set(auths):
+            self._intervals.pop(auth, None)
+            self._next_poll.pop(auth, None)
+
+    def plan(self, polled: dict, now: float) -> None:
+        """Book the next read of devices polled in this cycle.
+
+        polled maps the Auth of each device read in this cycle to its device
+        type and status.
+        """
+        for auth, (device_type, status) in polled.items():
+            self._intervals[auth] = self.device_interval(device_type, status)
+
+        if not self._intervals:
+            return
+
+        demand = sum(1 / interval for interval in self._intervals.values())
+        budget = len(self._intervals) / self.interval
+        scale = max(1.0, demand / budget)
+        if self.budget is not None:
+            self.budget.plan(
+                demand / scale,
+                1 / self.interval,
+                len(ACCOUNT_REPORTS) / self.interval,
+            )
+            scale *= self.budget.stretch
+
+        for auth, (device_type, status) in polled.items():
+            delay = self._intervals[auth] * scale
+            transition = self.next_transition(device_type, status)
+            if transition is not None:
+                seconds, exclusive = transition
+                seconds += POLL_TRANSITION_MARGIN
+                if exclusive:
+                    # Nothing else changes before the timer fires, but do not
+                    # wait longer than the slow tier in case it is cancelled
+                    delay = min(seconds, self.interval * POLL_IDLE_FACTOR)
+                else:
+                    delay = min(delay, seconds)
+            self._next_poll[auth] = now + delay
@@ -0,0 +1,23 @@
+""" HTTP session dedicated to the Panasonic cloud """
+import ssl
+
+import aiohttp
+
+from .const import CONCURRENT_REQUESTS, KEEPALIVE_TIMEOUT, DNS_CACHE_TTL
+
+
+def create_session(ssl_context: ssl.SSLContext | None = None) -> aiohttp.ClientSession:
+    """Session keeping up to CONCURRENT_REQUESTS connections alive.
+
+    Polls come in bursts every minute or so, so idle connections are kept
+    longer than aiohttp's default to skip the TCP and TLS handshakes (and
+    the proxy tunnel, if any) of the next burst.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONCURRENT_REQUESTS,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=ssl_context if ssl_context is not None else True,
+    )
+    return aiohttp.ClientSession(connector=connector)
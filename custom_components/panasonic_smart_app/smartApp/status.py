@@ -0,0 +1,142 @@
+""" Compact storage for device statuses """
+from array import array
+from collections.abc import Iterable, Mapping
+import sys
+
+# Kind of value held in each slot
+_MISSING = 0
+_INT_STR = 1  # Decimal string, stored as int and formatted back on read
+_INT = 2  # Native int
+_RAW = 3  # Anything else (hex strings, floats, empty strings, None)
+
+
+class CommandTypeIndex(object):
+    """Interns the command types of one model to small integer slots."""
+
+    __slots__ = ("_slots", "_keys")
+
+    def __init__(self, command_types: Iterable[str] = ()):
+        self._slots: dict[str, int] = {}
+        self._keys: list[str] = []
+        for command_type in command_types:
+            self.intern(command_type)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def intern(self, command_type: str) -> int:
+        slot = self._slots.get(command_type)
+        if slot is None:
+            slot = len(self._keys)
+            command_type = sys.intern(command_type)
+            self._slots[command_type] = slot
+            self._keys.append(command_type)
+        return slot
+
+    def lookup(self, command_type: str) -> int | None:
+        return self._slots.get(command_type)
+
+    def key(self, slot: int) -> str:
+        return self._keys[slot]
+
+
+class DeviceStatus(Mapping):
+    """Dict-like, read-mostly view of a device status.
+
+    Values are kept in a typed array indexed by the model's CommandTypeIndex,
+    so a record can be refreshed in place every update instead of building a
+    new dict of string keys and values.
+    """
+
+    __slots__ = ("_index", "_kinds", "_values", "_raw")
+
+    def __init__(self, index: CommandTypeIndex, initial=None):
+        self._index = index
+        size = len(index)
+        self._kinds = bytearray(size)
+        self._values = array("q", bytes(8 * size))
+        self._raw: dict[int, object] = {}
+        if initial:
+            self.update(initial)
+
+    def _ensure_capacity(self) -> None:
+        missing = len(self._index) - len(self._kinds)
+        if missing > 0:
+            self._kinds.extend(bytes(missing))
+            self._values.frombytes(bytes(8 * missing))
+
+    def _slot(self, command_type: str) -> int | None:
+        slot = self._index.lookup(command_type)
+        if slot is None or slot >= len(self._kinds) or not self._kinds[slot]:
+            return None
+        return slot
+
+    def __getitem__(self, command_type: str):
+        slot = self._slot(command_type)
+        if slot is None:
+            raise KeyError(command_type)
+
+        kind = self._kinds[slot]
+        if kind == _INT_STR:
+            return str(self._values[slot])
+        if kind == _INT:
+            return self._values[slot]
+        return self._raw[slot]
+
+    def __contains__(self, command_type) -> bool:
+        return self._slot(command_type) is not None
+
+    def __iter__(self):
+        index = self._index
+        for slot, kind in enumerate(self._kinds):
+            if kind:
+                yield index.key(slot)
+
+    def __len__(self) -> int:
+        return len(self._kinds) - self._kinds.count(_MISSING)
+
+    def __setitem__(self, command_type: str, value) -> None:
+        slot = self._index.intern(command_type)
+        if slot >= len(self._kinds):
+            self._ensure_capacity()
+
+        number = None
+        if isinstance(value, int) and not isinstance(value, bool):
+            kind, number = _INT, value
+        elif isinstance(value, str):
+            try:
+                number = int(value)
+            except ValueError:
+                pass
+            kind = _INT_STR if number is not None and str(number) == value else _RAW
+        else:
+            kind = _RAW
+
+        if kind != _RAW:
+            try:
+                self._values[slot] = number
+            except OverflowError:
+                kind = _RAW
+
+        if kind == _RAW:
+            self._raw[slot] = value
+        else:
+            self._raw.pop(slot, None)
+        self._kinds[slot] = kind
+
+    def update(self, other=(), **kwargs) -> None:
+        items = other.items() if isinstance(other, Mapping) else other
+        for command_type, value in items:
+            self[command_type] = value
+        for command_type, value in kwargs.items():
+            self[command_type] = value
+
+    def clear(self) -> None:
+        self._kinds[:] = bytes(len(self._kinds))
+        self._raw.clear()
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
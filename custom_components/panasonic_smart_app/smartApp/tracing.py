@@ -0,0 +1,121 @@
+""" Span tracing of poll cycles, exported as Chrome trace events """
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import itertools
+import os
+import time
+
+from .const import TRACE_CYCLES
+
+_parent_span: ContextVar[int | None] = ContextVar("panasonic_parent_span", default=None)
+
+
+class Tracer(object):
+    """Records nested spans while enabled, keeping the last TRACE_CYCLES cycles.
+
+    A cycle holds every span started between two calls to start_cycle, so
+    commands sent between polls land in the cycle before them. Parents are
+    tracked per asyncio task, so spans of gathered requests still point at
+    the span that gathered them.
+    """
+
+    def __init__(self, cycles: int = TRACE_CYCLES, clock=time.monotonic):
+        self.enabled = False
+        self.clock = clock
+        self._cycles: deque[list[dict]] = deque(maxlen=cycles)
+        self._span_ids = itertools.count(1)
+        self._lanes: dict[int, int] = {}
+
+    def start_cycle(self) -> None:
+        if self.enabled:
+            self._cycles.append([])
+            # Rows are numbered again in each cycle
+            self._lanes.clear()
+
+    def _lane(self) -> int:
+        """Small thread id of the current task, one row per task in viewers"""
+        try:
+            key = id(asyncio.current_task())
+        except RuntimeError:
+            key = 0
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = len(self._lanes) + 1
+        return lane
+
+    @contextmanager
+    def span(self, name: str, **args):
+        if not self.enabled:
+            yield
+            return
+
+        span_id = next(self._span_ids)
+        parent_id = _parent_span.get()
+        token = _parent_span.set(span_id)
+        started_at = self.clock()
+        try:
+            yield
+        finally:
+            _parent_span.reset(token)
+            self._append(name, started_at, self.clock(), span_id, parent_id, args)
+
+    def record(self, name: str, started_at: float, ended_at: float, **args) -> None:
+        """Add a span already measured with the clock of the tracer"""
+        if self.enabled:
+            span_id = next(self._span_ids)
+            self._append(name, started_at, ended_at, span_id, _parent_span.get(), args)
+
+    def _append(
+        self,
+        name: str,
+        started_at: float,
+        ended_at: float,
+        span_id: int,
+        parent_id: int | None,
+        args: dict,
+    ) -> None:
+        if not self._cycles:
+            self._cycles.append([])
+        self._cycles[-1].append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": round(started_at * 1e6),
+                "dur": round((ended_at - started_at) * 1e6),
+                "pid": os.getpid(),
+                "tid": self._lane(),
+                "args": {**args, "span_id": span_id, "parent_id": parent_id},
+            }
+        )
+
+    def export(self, cycles: int | None = None) -> dict:
+        """Last cycles in the Chrome trace format read by Perfetto"""
+        kept = list(self._cycles)
+        if cycles is not None:
+            kept = kept[-cycles:]
+        events = [event for cycle in kept for event in cycle]
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def clear(self) -> None:
+        self._cycles.clear()
+        self._lanes.clear()
+
+
+def traced(name: str):
+    """Trace an async SmartApp method as a span"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper_call(self, *args, **kwargs):
+            if not self.tracer.enabled:
+                return await func(self, *args, **kwargs)
+            with self.tracer.span(name):
+                return await func(self, *args, **kwargs)
+
+        return wrapper_call
+
+    return decorator
@@ -1,38 +1,42 @@
 """ Panasonic Smart App API """
 
-from .const import BASE_URL
+from . import const
+
+
+def base():
+    return const.BASE_URL
 
 
 def login():
-    url = f"{BASE_URL}/userlogin1"
+    url = f"{const.BASE_URL}/userlogin1"
     return url
 
 
 def get_devices():
-    url = f"{BASE_URL}/UserGetRegisteredGwList2"
+    url = f"{const.BASE_URL}/UserGetRegisteredGwList2"
     return url
 
 
 def get_device_info():
-    url = f"{BASE_URL}/DeviceGetInfo"
+    url = f"{const.BASE_URL}/DeviceGetInfo"
     return url
 
 
 def get_info():
-    url = f"{BASE_URL}/UserGetInfo"
+    url = f"{const.BASE_URL}/UserGetInfo"
     return url
 
 
 def get_device_overview():
-    url = f"{BASE_URL}/UserGetDeviceStatus"
+    url = f"{const.BASE_URL}/UserGetDeviceStatus"
     return url
 
 
 def set_command():
-    url = f"{BASE_URL}/DeviceSetCommand"
+    url = f"{const.BASE_URL}/DeviceSetCommand"
     return url
 
 
 def refresh_token():
-    url = f"{BASE_URL}/RefreshToken1"
+    url = f"{const.BASE_URL}/RefreshToken1"
     return url
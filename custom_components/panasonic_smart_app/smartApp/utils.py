@@ -1,2 +1,23 @@
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# The auth header and device field identify a device to the cloud
+REDACTED_KEYS = {"cptoken", "refreshtoken", "memid", "pw", "auth"}
+
+
 def chunks(L, n):
-    return [L[x : x + n] for x in range(0, len(L), n)]
\ No newline at end of file
+    return [L[x : x + n] for x in range(0, len(L), n)]
+
+
+def redact(data):
+    """Copy of a request or response payload without credentials"""
+    if isinstance(data, dict):
+        return {
+            key: "**REDACTED**" if str(key).lower() in REDACTED_KEYS else redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact(value) for value in data]
+    return data
@@ -0,0 +1,254 @@
+"""Import Panasonic daily reports into Home Assistant long-term statistics"""
+import asyncio
+from datetime import date, datetime, timedelta
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfEnergy, UnitOfMass
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    DOMAIN,
+    LABEL_DAILY_ENERGY,
+    LABEL_DAILY_CO2_FOOTPRINT,
+    LABEL_DAILY_REFRIGERATOR_OPEN_DOOR,
+)
+from .smartApp import SmartApp
+from .smartApp.const import REPORT_POWER, REPORT_CO2, REPORT_OTHER, REPORT_MAX_DAYS
+from .smartApp.exceptions import PanasonicBaseException
+
+_LOGGER = logging.getLogger(__package__)
+
+STORAGE_VERSION = 1
+
+STATISTIC_REPORTS = (
+    (REPORT_POWER, "energy", UnitOfEnergy.KILO_WATT_HOUR, LABEL_DAILY_ENERGY),
+    (REPORT_CO2, "co2", UnitOfMass.KILOGRAMS, LABEL_DAILY_CO2_FOOTPRINT),
+    (REPORT_OTHER, "ref_open_door", None, LABEL_DAILY_REFRIGERATOR_OPEN_DOOR),
+)
+
+
+def statistic_id(prefix: str, device: dict) -> str:
+    return f"{DOMAIN}:{prefix}_{slugify(device['Auth'])}"
+
+
+def month_starts(first: date, last: date) -> list[date]:
+    """First day of every month from first to last, inclusive"""
+    months = []
+    month = first.replace(day=1)
+    while month <= last:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+    return months
+
+
+class StatisticsImporter(object):
+    """Keeps long-term statistics of one account in sync with its daily reports"""
+
+    def __init__(self, hass: HomeAssistant, client: SmartApp, entry_id: str):
+        self.hass = hass
+        self.client = client
+        self.devices: list = []
+        self._lock = asyncio.Lock()
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.backfill")
+
+    def set_devices(self, devices: list) -> None:
+        self.devices = [
+            device for device in devices if device.get("GWID") and device.get("Auth")
+        ]
+
+    async def _async_get_last_point(self, stat_id: str) -> tuple[date, float] | None:
+        """Day and running sum of the last imported statistic"""
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, stat_id, True, {"sum"}
+        )
+        if not last.get(stat_id):
+            return None
+
+        row = last[stat_id][0]
+        start = row["start"]
+        if not isinstance(start, datetime):
+            start = dt_util.utc_from_timestamp(start)
+        return dt_util.as_local(start).date(), row.get("sum") or 0.0
+
+    async def _async_get_sum_before(self, stat_id: str, day: date) -> float:
+        """Running sum of the last statistic imported before a day"""
+        before = await get_instance(self.hass).async_add_executor_job(
+            statistics_during_period,
+            self.hass,
+            dt_util.utc_from_timestamp(0),
+            dt_util.start_of_local_day(day),
+            {stat_id},
+            "month",
+            None,
+            {"sum"},
+        )
+        rows = before.get(stat_id)
+        if not rows:
+            return 0.0
+        return rows[-1].get("sum") or 0.0
+
+    def _add_series(
+        self, device: dict, report: tuple, series: list, point: tuple, until: date
+    ) -> tuple[date, float]:
+        """Add rows after point up to until, returning the new last point"""
+        _, prefix, unit, label = report
+        last_day, total = point
+        statistics = []
+        for day, value in series:
+            if day <= last_day or day > until:
+                continue
+            total += value
+            statistics.append(
+                StatisticData(
+                    start=dt_util.start_of_local_day(day),
+                    state=value,
+                    sum=total,
+                )
+            )
+            last_day = day
+
+        if statistics:
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{device['NickName']} {label}",
+                source=DOMAIN,
+                statistic_id=statistic_id(prefix, device),
+                unit_of_measurement=unit,
+            )
+            async_add_external_statistics(self.hass, metadata, statistics)
+            _LOGGER.debug(
+                "[%s] Imported %d days of %s", device["NickName"], len(statistics), report[0]
+            )
+
+        return last_day, total
+
+    async def _async_import_report(self, report: tuple) -> None:
+        """Import complete days after the last imported point of every device"""
+        report_name, prefix, _, _ = report
+        yesterday = dt_util.now().date() - timedelta(days=1)
+        first_of_month = yesterday.replace(day=1)
+        points = {}
+        for device in self.devices:
+            point = await self._async_get_last_point(statistic_id(prefix, device))
+            points[device["GWID"]] = point or (first_of_month - timedelta(days=1), 0.0)
+
+        start = min(point[0] for point in points.values()) + timedelta(days=1)
+        while start <= yesterday:
+            daily_report = await self.client.get_daily_report(report_name, start)
+            for device in self.devices:
+                gwid = device["GWID"]
+                series = daily_report.get(gwid)
+                if series:
+                    points[gwid] = self._add_series(
+                        device, report, series, points[gwid], yesterday
+                    )
+            start += timedelta(days=REPORT_MAX_DAYS)
+
+    async def _async_backfill_report(self, report: tuple, checkpoint: dict) -> None:
+        """Re-import a report month by month, saving progress after each month.
+
+        A month that fails to be fetched raises before the checkpoint moves
+        past it, so the next run resumes from that month.
+        """
+        report_name = report[0]
+        progress = checkpoint[report_name]
+        yesterday = dt_util.now().date() - timedelta(days=1)
+        first_month = date.fromisoformat(progress["first_month"])
+        done = progress.get("month")
+        months = [
+            month
+            for month in month_starts(first_month, yesterday)
+            if done is None or month > date.fromisoformat(done)
+        ]
+        points = {
+            gwid: (date.fromisoformat(day), total)
+            for gwid, (day, total) in progress.get("points", {}).items()
+        }
+        # Carry on from the sums already imported before the backfilled months
+        for device in self.devices:
+            if device["GWID"] not in points:
+                total = await self._async_get_sum_before(
+                    statistic_id(report[1], device), first_month
+                )
+                points[device["GWID"]] = (first_month - timedelta(days=1), total)
+
+        async for month, daily_report in self.client.iter_monthly_reports(
+            report_name, months
+        ):
+            for device in self.devices:
+                gwid = device["GWID"]
+                series = daily_report.get(gwid)
+                if series:
+                    points[gwid] = self._add_series(
+                        device, report, series, points[gwid], yesterday
+                    )
+
+            progress["month"] = month.isoformat()
+            progress["points"] = {
+                gwid: (day.isoformat(), total) for gwid, (day, total) in points.items()
+            }
+            await self._store.async_save(checkpoint)
+
+        checkpoint.pop(report_name, None)
+        await self._store.async_save(checkpoint)
+
+    async def _async_run_backfill(self, checkpoint: dict) -> None:
+        reports = [report for report in STATISTIC_REPORTS if report[0] in checkpoint]
+        results = await asyncio.gather(
+            *[self._async_backfill_report(report, checkpoint) for report in reports],
+            return_exceptions=True,
+        )
+        for report, result in zip(reports, results):
+            if isinstance(result, PanasonicBaseException):
+                _LOGGER.warning(
+                    "Backfill of %s interrupted, will resume later: %s", report[0], result
+                )
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def async_backfill(self, months: int) -> None:
+        """Start a backfill covering the given number of months up to today"""
+        first_month = dt_util.now().date().replace(day=1)
+        for _ in range(months - 1):
+            first_month = (first_month - timedelta(days=1)).replace(day=1)
+
+        async with self._lock:
+            checkpoint = {
+                report[0]: {"first_month": first_month.isoformat()}
+                for report in STATISTIC_REPORTS
+            }
+            await self._store.async_save(checkpoint)
+            await self._async_run_backfill(checkpoint)
+
+    async def async_import(self, *_) -> None:
+        """Resume an interrupted backfill, then import new complete days"""
+        if not self.devices:
+            return
+
+        async with self._lock:
+            checkpoint = await self._store.async_load()
+            # A backfill already imports up to yesterday
+            backfilled = set(checkpoint or ())
+            if checkpoint:
+                _LOGGER.info("Resuming statistics backfill")
+                await self._async_run_backfill(checkpoint)
+
+            for report in STATISTIC_REPORTS:
+                if report[0] in backfilled:
+                    continue
+                try:
+                    await self._async_import_report(report)
+                except PanasonicBaseException as exception:
+                    _LOGGER.warning(
+                        "Failed to import %s statistics: %s", report[0], exception
+                    )
@@ -1,10 +1,21 @@
 import logging
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
-from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.components.switch import (
+    SwitchEntity,
+    SwitchEntityDescription,
+    SwitchDeviceClass,
+)
 
-from .entity import PanasonicBaseEntity
+from .entity import (
+    PanasonicBaseEntity,
+    PanasonicDescribedEntity,
+    PanasonicEntityDescription,
+    DISCOVERY_STATUS,
+    build_described_entities,
+    power_on,
+    power_reported,
+)
 from .const import (
     DOMAIN,
     DEVICE_TYPE_AC,
@@ -14,7 +25,6 @@ from .const import (
     DEVICE_TYPE_SWITCH,
     DATA_CLIENT,
     DATA_COORDINATOR,
-    DEVICE_CLASS_SWITCH,
     LABEL_SMART_SWITCH,
     LABEL_NANOE,
     LABEL_NANOEX,
@@ -44,150 +54,153 @@ from .const import (
 _LOGGER = logging.getLogger(__package__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class PanasonicSwitchEntityDescription(
+    PanasonicEntityDescription, SwitchEntityDescription
+):
+    """Describes a Panasonic on/off switch."""
+
+    device_class: SwitchDeviceClass | None = SwitchDeviceClass.SWITCH
+    # Some features (e.g. buzzer) report and accept 0 for "on"
+    invert: bool = False
+
+
+SWITCH_DESCRIPTIONS: tuple[PanasonicSwitchEntityDescription, ...] = (
+    PanasonicSwitchEntityDescription(
+        key="ac_nanoe",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x08",
+        set_command=136,
+        label=LABEL_NANOE,
+        icon=ICON_NANOE,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="ac_econavi",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x1B",
+        set_command=155,
+        label=LABEL_ECONAVI,
+        icon=ICON_ECONAVI,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="ac_buzzer",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x1E",
+        set_command=30,
+        label=LABEL_BUZZER,
+        icon=ICON_BUZZER,
+        invert=True,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="ac_turbo",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x1A",
+        set_command=154,
+        label=LABEL_TURBO,
+        icon=ICON_TURBO,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="ac_sleep",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x05",
+        set_command=5,
+        label=LABEL_CLIMATE_SLEEP,
+        icon=ICON_SLEEP,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="ac_mold_prevention",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x17",
+        set_command=23,
+        label=LABEL_CLIMATE_MOLD_PREVENTION,
+        icon=ICON_MOLD_PREVENTION,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="ac_self_clean",
+        device_type=DEVICE_TYPE_AC,
+        status_code="0x18",
+        set_command=24,
+        label=LABEL_CLIMATE_CLEAN,
+        icon=ICON_CLEAN,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="purifier_power",
+        device_type=DEVICE_TYPE_PURIFIER,
+        status_code="0x00",
+        set_command=128,
+        label=LABEL_POWER,
+        with_nickname=False,
+        icon=ICON_PURIFIER,
+        available_fn=power_reported,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="purifier_nanoex",
+        device_type=DEVICE_TYPE_PURIFIER,
+        status_code="0x07",
+        set_command=135,
+        label=LABEL_NANOEX,
+        icon=ICON_NANOEX,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="dehumidifier_nanoex",
+        device_type=DEVICE_TYPE_DEHUMIDIFIER,
+        status_code="0x0D",
+        set_command=0x80 + 0x0D,
+        label=LABEL_NANOEX,
+        icon=ICON_NANOEX,
+        available_fn=power_on,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="dehumidifier_buzzer",
+        device_type=DEVICE_TYPE_DEHUMIDIFIER,
+        status_code="0x18",
+        set_command=0x80 + 0x18,
+        label=LABEL_DEHUMIDIFIER_BUZZER,
+        icon=ICON_BUZZER,
+        invert=True,
+        available_fn=power_reported,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="refrigerator_stop_ice_making",
+        device_type=DEVICE_TYPE_REFRIGERATOR,
+        status_code="0x52",
+        set_command=0x52,
+        label=LABEL_REFRIGERATOR_STOP_ICE_MAKING,
+        icon=ICON_STOP_ICE_MAKING,
+        discovery=DISCOVERY_STATUS,
+    ),
+    PanasonicSwitchEntityDescription(
+        key="refrigerator_quick_ice_making",
+        device_type=DEVICE_TYPE_REFRIGERATOR,
+        status_code="0x53",
+        set_command=0x53,
+        label=LABEL_REFRIGERATOR_QUICK_ICE_MAKING,
+        icon=ICON_QUICK_ICE_MAKING,
+        discovery=DISCOVERY_STATUS,
+    ),
+)
+
+
 async def async_setup_entry(hass, entry, async_add_entities) -> bool:
     client = hass.data[DOMAIN][entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
     devices = coordinator.data
-    commands = client.get_commands()
-    switches = []
+    switches = build_described_entities(
+        coordinator, client, SWITCH_DESCRIPTIONS, PanasonicSwitch
+    )
 
     for index, device in enumerate(devices):
         device_type = int(device.get("DeviceType"))
-        current_device_commands = [
-            command
-            for command in commands
-            if command["ModelType"] == device.get("ModelType")
-        ][0]["JSON"][0]["list"]
-        command_types = list(
-            map(lambda c: c["CommandType"].lower(), current_device_commands)
-        )
-
-        if device_type == DEVICE_TYPE_AC:
-            # Process AC device switches
-            if "0x08" in command_types:
-                switches.append(
-                    PanasonicACNanoe(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x1b" in command_types:
-                switches.append(
-                    PanasonicACEconavi(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x1e" in command_types:
-                switches.append(
-                    PanasonicACBuzzer(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x1a" in command_types:
-                switches.append(
-                    PanasonicACTurbo(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x05" in command_types:
-                switches.append(
-                    PanasonicACSleepMode(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x17" in command_types:
-                switches.append(
-                    PanasonicACMoldPrevention(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x18" in command_types:
-                switches.append(
-                    PanasonicACSelfClean(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-
-        elif device_type == DEVICE_TYPE_PURIFIER:
-            # Process purifier device switches
-            if "0x00" in command_types:
-                switches.append(
-                    PanasonicPurifierPower(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-            if "0x07" in command_types:
-                switches.append(
-                    PanasonicPurifierNanoeX(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-
-        elif device_type == DEVICE_TYPE_DEHUMIDIFIER:
-            # Process dehumidifier device switches
-            if "0x0d" in command_types:
-                switches.append(
-                    PanasonicDehumidifierNanoeX(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-
-            if "0x18" in command_types:
-                switches.append(
-                    PanasonicDehumidifierBuzzer(
-                        coordinator,
-                        index,
-                        client,
-                        device,
-                    )
-                )
-
-        elif device_type == DEVICE_TYPE_REFRIGERATOR:
-            # Process refrigerator device switches
-            for switch_type in (
-                PanasonicRefrigeratorStopIceMakingSwitch,
-                PanasonicRefrigeratorQuickIceMakingSwitch,
-            ):
-                if switch_type.command_type in device["status"]:
-                    switches.append(
-                        switch_type(
-                            coordinator,
-                            index,
-                            client,
-                            device,
-                        )
-                    )
 
-        elif device_type == DEVICE_TYPE_SWITCH:
+        if device_type == DEVICE_TYPE_SWITCH:
             # Process smart switch device with sub-devices
             if "Devices" in device and isinstance(device["Devices"], list):
                 for sub_device in device["Devices"]:
@@ -212,550 +225,40 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
     return True
 
 
-class PanasonicACNanoe(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC nanoe switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_NANOE}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_NANOE
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _nanoe_status = status.get("0x08")
-        if _nanoe_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_nanoe_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on nanoe", self.label)
-        await self.client.set_command(self.auth, 136, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off nanoe", self.label)
-        await self.client.set_command(self.auth, 136, 0)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACEconavi(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC ECONAVI switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_ECONAVI}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_ECONAVI
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _nanoe_status = status.get("0x1B")
-        if _nanoe_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_nanoe_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on ECONAVI", self.label)
-        await self.client.set_command(self.auth, 155, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off ECONAVI", self.label)
-        await self.client.set_command(self.auth, 155, 0)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACBuzzer(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC buzzer switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_BUZZER}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_BUZZER
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _buzzer_status = status.get("0x1E")
-        if _buzzer_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = not bool(int(_buzzer_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on buzzer", self.label)
-        await self.client.set_command(self.auth, 30, 0)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off buzzer", self.label)
-        await self.client.set_command(self.auth, 30, 1)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACTurbo(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC turbo switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_TURBO}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_TURBO
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _turbo_status = status.get("0x1A", None)
-        if _turbo_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_turbo_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on turbo mode", self.label)
-        await self.client.set_command(self.auth, 154, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off turbo mode", self.label)
-        await self.client.set_command(self.auth, 154, 0)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACSleepMode(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC sleep mode switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_CLIMATE_SLEEP}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_SLEEP
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _sleep_mode_status = status.get("0x05")
-        if _sleep_mode_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_sleep_mode_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on sleep mode", self.label)
-        await self.client.set_command(self.auth, 5, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off sleep mode", self.label)
-        await self.client.set_command(self.auth, 5, 0)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACMoldPrevention(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC mold prevention switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_CLIMATE_MOLD_PREVENTION}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_MOLD_PREVENTION
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _mold_prevention_status = status.get("0x17")
-        if _mold_prevention_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_mold_prevention_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on mold prevention", self.label)
-        await self.client.set_command(self.auth, 23, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off mold prevention", self.label)
-        await self.client.set_command(self.auth, 23, 0)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicACSelfClean(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic AC self clean switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_CLIMATE_CLEAN}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_CLEAN
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _self_clean_status = status.get("0x18")
-        if _self_clean_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_self_clean_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on self clean", self.label)
-        await self.client.set_command(self.auth, 24, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off self clean", self.label)
-        await self.client.set_command(self.auth, 24, 0)
-        await self.coordinator.async_request_refresh()
-
-
-class PanasonicPurifierPower(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic Purifier power """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        return status.get("0x00", None) != None
-
-    @property
-    def label(self):
-        return LABEL_POWER
-
-    @property
-    def icon(self) -> str:
-        return ICON_PURIFIER
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _power_status = status.get("0x00")
-        if _power_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_power_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on nanoeX", self.label)
-        await self.client.set_command(self.auth, 128, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off nanoeX", self.label)
-        await self.client.set_command(self.auth, 128, 0)
-        await self.coordinator.async_request_refresh()
-
-
-
-class PanasonicPurifierNanoeX(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic Purifier nanoeX switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_NANOEX}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_NANOEX
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _nanoe_status = status.get("0x07")
-        if _nanoe_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_nanoe_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on nanoeX", self.label)
-        await self.client.set_command(self.auth, 135, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off nanoeX", self.label)
-        await self.client.set_command(self.auth, 135, 0)
-        await self.coordinator.async_request_refresh()
-
-class PanasonicDehumidifierNanoeX(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic Dehumidifier nanoeX switch """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        _is_on_status = bool(int(status.get("0x00", 0)))
-        return _is_on_status
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_NANOEX}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_NANOEX
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _nanoe_status = status.get("0x0D")
-        if _nanoe_status == None:
-            return STATE_UNAVAILABLE
-        _is_on = bool(int(_nanoe_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-        return _is_on
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on nanoeX", self.label)
-        await self.client.set_command(self.auth, 0x80 + 0x0D, 1)
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off nanoeX", self.label)
-        await self.client.set_command(self.auth, 0x80 + 0x0D, 0)
-        await self.coordinator.async_request_refresh()
-
-class PanasonicDehumidifierBuzzer(PanasonicBaseEntity, SwitchEntity):
-    """ Panasonic Dehumidifier buzzer """
-
-    @property
-    def available(self) -> bool:
-        status = self.coordinator.data[self.index]["status"]
-        return status.get("0x00", None) != None
-
-    @property
-    def label(self):
-        return f"{self.nickname} {LABEL_DEHUMIDIFIER_BUZZER}"
-
-    @property
-    def icon(self) -> str:
-        return ICON_BUZZER
-
-    @property
-    def device_class(self) -> str:
-        return DEVICE_CLASS_SWITCH
-
-    @property
-    def is_on(self) -> int:
-        status = self.coordinator.data[self.index]["status"]
-        _buzzer_status = status.get("0x18")
-        if _buzzer_status == None:
-            return STATE_UNAVAILABLE
-        _is_off = not bool(int(_buzzer_status))
-        _LOGGER.debug("[%s] is_on: %s", self.label, _is_off)
-        return _is_off
-
-    async def async_turn_on(self) -> None:
-        _LOGGER.debug("[%s] Turning on Dehumidifier buzzer", self.label)
-        await self.client.set_command(self.auth, 0x80 + 0x18, 0) # invert
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
-        _LOGGER.debug("[%s] Turning off Dehumidifier buzzer", self.label)
-        await self.client.set_command(self.auth, 0x80 + 0x18, 1) # invert
-        await self.coordinator.async_request_refresh()
+class PanasonicSwitch(PanasonicDescribedEntity, SwitchEntity):
+    """ Panasonic on/off feature switch """
 
+    entity_description: PanasonicSwitchEntityDescription
 
-class PanasonicRefrigeratorSwitchABC(PanasonicBaseEntity, SwitchEntity, ABC):
-    """Abstract class for switches of Panasonic refrigerator."""
-
-    @property
-    @abstractmethod
-    def icon(self) -> str:
-        """Icon of this entity."""
-
-    @property
-    @abstractmethod
-    def command_name(self) -> str:
-        """Command name from Panasonic UserGetRegisteredGwList2 API. Used for label."""
-
-    @property
-    @abstractmethod
-    def command_type(self) -> str:
-        """
-        Command type from Panasonic UserGetRegisteredGwList2 API. Used to get and set
-        the status.
-        """
-
-    @property
-    def device_class(self) -> SwitchDeviceClass:
-        return SwitchDeviceClass.SWITCH
+    def __init__(self, coordinator, index, client, device, description):
+        super().__init__(coordinator, index, client, device, description)
+        self._invert = description.invert
+        self._on_value = 0 if description.invert else 1
+        self._off_value = 1 - self._on_value
 
     @property
     def is_on(self) -> bool | None:
-        status = self.coordinator.data[self.index]["status"]
-
-        try:
-            _is_on = int(status[self.command_type]) == 1
-        except (KeyError, ValueError):
-            _LOGGER.exception("Error while getting status for %s", self.label)
+        value = self.raw_value
+        if value is None or value == "":
             return None
-
+        _is_on = bool(int(value)) != self._invert
         _LOGGER.debug("[%s] is_on: %s", self.label, _is_on)
-
         return _is_on
 
     async def async_turn_on(self, **_kwargs) -> None:
-        """Turn on the switch."""
         _LOGGER.debug("[%s] Turning on", self.label)
-
-        await self.client.set_command(
-            deviceId=self.auth,
-            command=int(self.command_type, 16),
-            value=1,
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_value(self._on_value)
 
     async def async_turn_off(self, **_kwargs) -> None:
-        """Turn off the switch."""
         _LOGGER.debug("[%s] Turning off", self.label)
-
-        await self.client.set_command(
-            deviceId=self.auth,
-            command=int(self.command_type, 16),
-            value=0,
-        )
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def label(self) -> str:
-        return f"{self.nickname} {self.command_name}"
-
-
-class PanasonicRefrigeratorStopIceMakingSwitch(PanasonicRefrigeratorSwitchABC):
-    """Stop ice making switch of Panasonic refrigerator."""
-
-    command_name = LABEL_REFRIGERATOR_STOP_ICE_MAKING
-    command_type = "0x52"
-    icon = ICON_STOP_ICE_MAKING
-
-
-class PanasonicRefrigeratorQuickIceMakingSwitch(PanasonicRefrigeratorSwitchABC):
-    """Quick ice making switch of Panasonic refrigerator."""
-
-    command_name = LABEL_REFRIGERATOR_QUICK_ICE_MAKING
-    command_type = "0x53"
-    icon = ICON_QUICK_ICE_MAKING
+        await self.async_send_value(self._off_value)
 
 
 class PanasonicSmartSwitch(PanasonicBaseEntity, SwitchEntity):
     """Panasonic Smart switch"""
 
+    status_codes = ("0x70",)
+
     def __init__(self, coordinator, index, client, device):
         super().__init__(coordinator, index, client, device)
         # Store the sub-device info separately for easy access
@@ -781,27 +284,34 @@ class PanasonicSmartSwitch(PanasonicBaseEntity, SwitchEntity):
         _LOGGER.debug("[%s] is_on: %s", self.label, status)
         return status
 
+    async def _async_set_power(self, power: bool) -> None:
+        # 0x70 command controls all circuits, the client merges concurrent
+        # changes and updates the cached 0x70 right away
+        device_bit = 1 << (self.sub_device["DeviceID"] - 1)
+        written = self.client.update_mask(
+            self.auth,
+            "0x70",
+            0x70,
+            set_bits=device_bit if power else 0,
+            clear_bits=0 if power else device_bit,
+        )
+        self.coordinator.async_update_listeners()
+
+        if not await written:
+            # The client has put the bit back already
+            _LOGGER.warning("[%s] Failed to switch circuit", self.label)
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_request_refresh()
+
     async def async_turn_on(self, **_kwargs) -> None:
         """ turn on switch """
         _LOGGER.debug("[%s] Turning on switch %d", self.label, self.sub_device["DeviceID"])
-        # 0x70 command controls all circuits, need to maintain other states
-        device_status = self.coordinator.data[self.index]["status"]
-        current_status = int(device_status.get("0x70", "0"), 16)
-        device_bit = 1 << (self.sub_device["DeviceID"] - 1)
-        new_status = current_status | device_bit  # Set device bit to 1
-        await self.client.set_command(self.auth, 0x70, new_status)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_power(True)
 
     async def async_turn_off(self, **_kwargs) -> None:
         """ turn off switch """
         _LOGGER.debug("[%s] Turning off switch %d", self.label, self.sub_device["DeviceID"])
-        # 0x70 command controls all circuits, need to maintain other states
-        device_status = self.coordinator.data[self.index]["status"]
-        current_status = int(device_status.get("0x70", "0"), 16)
-        device_bit = 1 << (self.sub_device["DeviceID"] - 1)
-        new_status = current_status & ~device_bit  # Clear device bit to 0
-        await self.client.set_command(self.auth, 0x70, new_status)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_power(False)
 
     @property
     def label(self) -> str:
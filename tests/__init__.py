@@ -0,0 +1 @@
+"""Tests of the Panasonic Smart App integration"""
@@ -0,0 +1,188 @@
+"""Tests of the month by month statistics backfill"""
+import asyncio
+import copy
+from datetime import date, timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.panasonic_smart_app import statistics
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import REPORT_POWER
+from custom_components.panasonic_smart_app.smartApp.exceptions import (
+    PanasonicBaseException,
+)
+from custom_components.panasonic_smart_app.statistics import (
+    STATISTIC_REPORTS,
+    StatisticsImporter,
+    month_starts,
+)
+
+DEVICE = {"GWID": "GW1", "Auth": "AUTH1", "NickName": "AC"}
+
+
+class MemoryStore(object):
+    def __init__(self):
+        self.saved = []
+
+    async def async_save(self, data):
+        self.saved.append(copy.deepcopy(data))
+
+
+def months_back(count: int) -> list[date]:
+    yesterday = dt_util.now().date() - timedelta(days=1)
+    first = yesterday.replace(day=1)
+    for _ in range(count - 1):
+        first = (first - timedelta(days=1)).replace(day=1)
+    return month_starts(first, yesterday)
+
+
+def client_failing_on(failing: set[date]) -> SmartApp:
+    client = SmartApp(None, "account", "password")
+
+    async def get_daily_report(name, start):
+        if start in failing:
+            raise PanasonicBaseException(f"Failed to get {name} report from {start}")
+        return {"GW1": [(start, 1.0)]}
+
+    client.get_daily_report = get_daily_report
+    return client
+
+
+def iterate(client, months) -> tuple[list[date], Exception | None]:
+    async def consume():
+        seen = []
+        try:
+            async for month, _ in client.iter_monthly_reports(REPORT_POWER, months):
+                seen.append(month)
+        except PanasonicBaseException as exception:
+            return seen, exception
+        return seen, None
+
+    return asyncio.run(consume())
+
+
+def test_month_starts():
+    assert month_starts(date(2023, 11, 15), date(2024, 2, 1)) == [
+        date(2023, 11, 1),
+        date(2023, 12, 1),
+        date(2024, 1, 1),
+        date(2024, 2, 1),
+    ]
+
+
+def test_iteration_stops_at_the_first_failed_month():
+    months = [date(2024, month, 1) for month in range(1, 7)]
+    seen, exception = iterate(client_failing_on({months[2], months[4]}), months)
+    assert seen == months[:2]
+    assert "2024-03-01" in str(exception)
+
+
+def test_iteration_keeps_the_order_of_months():
+    months = [date(2024, month, 1) for month in range(1, 7)]
+    assert iterate(client_failing_on(set()), months) == (months, None)
+
+
+class Recorder(object):
+    async def async_add_executor_job(self, target, *args):
+        return target(*args)
+
+
+@pytest.fixture
+def added(monkeypatch) -> list:
+    """Statistics passed to the recorder, which answers queries from them"""
+    added = []
+
+    def statistics_during_period(
+        hass, start_time, end_time, statistic_ids, period, units, types
+    ):
+        rows = sorted(
+            (row for row in added if start_time <= row["start"] < end_time),
+            key=lambda row: row["start"],
+        )
+        if not rows:
+            return {}
+        return {
+            stat_id: [{"start": row["start"].timestamp(), "sum": row["sum"]} for row in rows]
+            for stat_id in statistic_ids
+        }
+
+    monkeypatch.setattr(
+        statistics,
+        "async_add_external_statistics",
+        lambda hass, metadata, rows: added.extend(rows),
+    )
+    monkeypatch.setattr(statistics, "get_instance", lambda hass: Recorder())
+    monkeypatch.setattr(
+        statistics, "statistics_during_period", statistics_during_period
+    )
+    return added
+
+
+def backfill(client, checkpoint: dict, tmp_path):
+    """Checkpoints saved by a Power backfill, and the exception it raised"""
+
+    async def run():
+        importer = StatisticsImporter(HomeAssistant(str(tmp_path)), client, "entry")
+        importer._store = MemoryStore()
+        importer.set_devices([DEVICE])
+        try:
+            await importer._async_backfill_report(STATISTIC_REPORTS[0], checkpoint)
+        except PanasonicBaseException as exception:
+            return importer._store.saved, exception
+        return importer._store.saved, None
+
+    return asyncio.run(run())
+
+
+def test_backfill_checkpoint_stops_before_a_failed_month(added, tmp_path):
+    months = months_back(4)
+    checkpoint = {REPORT_POWER: {"first_month": months[0].isoformat()}}
+    saved, exception = backfill(client_failing_on({months[2]}), checkpoint, tmp_path)
+    assert exception is not None
+    assert checkpoint[REPORT_POWER]["month"] == months[1].isoformat()
+    assert [state[REPORT_POWER]["month"] for state in saved] == [
+        months[0].isoformat(),
+        months[1].isoformat(),
+    ]
+    assert len(added) == 2
+
+
+def test_backfill_resumes_after_the_last_saved_month(added, tmp_path):
+    months = months_back(4)
+    checkpoint = {REPORT_POWER: {"first_month": months[0].isoformat()}}
+    backfill(client_failing_on({months[2]}), checkpoint, tmp_path)
+
+    requested = []
+    client = client_failing_on(set())
+    get_daily_report = client.get_daily_report
+
+    async def recording(name, start):
+        requested.append(start)
+        return await get_daily_report(name, start)
+
+    client.get_daily_report = recording
+    saved, exception = backfill(client, checkpoint, tmp_path)
+    assert exception is None
+    assert requested == months[2:]
+    assert saved[-1] == {}
+    # Running sums carry on from the checkpoint
+    assert [row["sum"] for row in added] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_backfill_over_imported_days_keeps_the_earlier_sum(added, tmp_path):
+    months = months_back(2)
+    before = months[0] - timedelta(days=1)
+    # Imported earlier: the day before the backfill, and its first month
+    added.append({"start": dt_util.start_of_local_day(before), "sum": 40.0})
+    added.append({"start": dt_util.start_of_local_day(months[0]), "sum": 41.0})
+    added.append({"start": dt_util.start_of_local_day(months[1]), "sum": 45.0})
+
+    checkpoint = {REPORT_POWER: {"first_month": months[0].isoformat()}}
+    saved, exception = backfill(client_failing_on(set()), checkpoint, tmp_path)
+
+    assert exception is None
+    # Days of the backfilled months are imported again on top of the sum
+    # before them, instead of restarting from zero
+    assert [row["sum"] for row in added[3:]] == [41.0, 42.0]
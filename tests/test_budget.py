@@ -0,0 +1,109 @@
+"""Tests of the daily API call budget"""
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp.budget import (
+    CallBudget,
+    endpoint_name,
+)
+from custom_components.panasonic_smart_app.smartApp.const import (
+    BUDGET_MAX_REPORT_STRETCH,
+    BUDGET_MAX_STRETCH,
+    BUDGET_RESERVE,
+    BUDGET_WINDOW,
+)
+
+# A budget allowing one call per second once the reserve is set aside
+ONE_PER_SECOND = round(BUDGET_WINDOW / (1 - BUDGET_RESERVE))
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def planned(daily_budget, device_rate, account_rate, report_rate) -> tuple[float, float]:
+    budget = CallBudget(daily_budget, clock=Clock())
+    budget.plan(device_rate, account_rate, report_rate)
+    return budget.stretch, budget.report_stretch
+
+
+def test_endpoint_name():
+    assert endpoint_name("https://host/api/UserGetDeviceStatus/") == "UserGetDeviceStatus"
+
+
+def test_calls_leave_the_window_after_a_day():
+    clock = Clock()
+    budget = CallBudget(100, clock=clock)
+    budget.record("/api/DeviceGetInfo")
+    clock.now = 3000.0
+    budget.record("/api/DeviceGetInfo")
+    budget.record("/api/UserGetInfo")
+    assert budget.used() == {"DeviceGetInfo": 2, "UserGetInfo": 1}
+    assert budget.used(1000) == {"DeviceGetInfo": 1, "UserGetInfo": 1}
+    clock.now = BUDGET_WINDOW + 1000.0
+    assert budget.used() == {"DeviceGetInfo": 1, "UserGetInfo": 1}
+    assert budget.remaining == 98
+
+
+@pytest.mark.parametrize("daily_budget", [None, 0])
+def test_no_budget_never_stretches(daily_budget):
+    assert planned(daily_budget, 10.0, 10.0, 10.0) == (1.0, 1.0)
+    assert CallBudget(daily_budget).remaining is None
+    assert not CallBudget(daily_budget).exhausted
+
+
+def test_under_budget_never_stretches():
+    assert planned(ONE_PER_SECOND, 0.5, 0.1, 0.3) == (1.0, 1.0)
+
+
+def test_reports_are_refreshed_less_often_first():
+    stretch, report_stretch = planned(ONE_PER_SECOND, 0.5, 0.1, 0.6)
+    assert stretch == 1.0
+    # Reports get what polls leave: 0.4 calls per second
+    assert report_stretch == pytest.approx(0.6 / 0.4)
+
+
+def test_polls_are_stretched_once_reports_are_at_their_floor():
+    stretch, report_stretch = planned(ONE_PER_SECOND, 1.5, 0.5, 0.6)
+    assert report_stretch == BUDGET_MAX_REPORT_STRETCH
+    left = 1.0 - 0.6 / BUDGET_MAX_REPORT_STRETCH / BUDGET_MAX_STRETCH
+    assert stretch == pytest.approx(2.0 / left)
+
+
+def test_poll_stretch_is_capped():
+    stretch, _ = planned(ONE_PER_SECOND, 50.0, 1.0, 0.1)
+    assert stretch == BUDGET_MAX_STRETCH
+
+
+def test_no_room_left_for_polls():
+    # The report floor alone takes the whole budget
+    report_rate = BUDGET_MAX_REPORT_STRETCH * BUDGET_MAX_STRETCH
+    assert planned(ONE_PER_SECOND, 0.1, 0.1, report_rate) == (
+        BUDGET_MAX_STRETCH,
+        BUDGET_MAX_REPORT_STRETCH,
+    )
+
+
+def test_negative_budget_stretches_to_the_maximum():
+    assert planned(-100, 0.01, 0.01, 0.01) == (
+        BUDGET_MAX_STRETCH,
+        BUDGET_MAX_REPORT_STRETCH,
+    )
+
+
+def test_exhausted_budget_keeps_the_reserve():
+    budget = CallBudget(100, clock=Clock())
+    for _ in range(89):
+        budget.record("DeviceGetInfo")
+    assert not budget.exhausted
+    budget.record("DeviceGetInfo")
+    assert budget.exhausted
+    budget.plan(0.0001, 0.0001, 0.0001)
+    assert (budget.stretch, budget.report_stretch) == (
+        BUDGET_MAX_STRETCH,
+        BUDGET_MAX_REPORT_STRETCH,
+    )
+    assert budget.as_dict()["used"] == {"DeviceGetInfo": 90}
@@ -0,0 +1,87 @@
+"""Tests of the per-model status code capabilities"""
+from custom_components.panasonic_smart_app.smartApp.capabilities import (
+    ModelCapabilities,
+)
+from custom_components.panasonic_smart_app.smartApp.const import (
+    CAPABILITY_MISSES,
+    CAPABILITY_REPROBE,
+)
+
+MODEL = "CS-1"
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def miss(capabilities: ModelCapabilities, code: str, times: int = CAPABILITY_MISSES):
+    for _ in range(times):
+        capabilities.learn_response(MODEL, ["0x00", code], {"0x00": "1", code: ""})
+
+
+def test_code_left_out_after_repeated_misses():
+    capabilities = ModelCapabilities(clock=Clock())
+    miss(capabilities, "0x1F", CAPABILITY_MISSES - 1)
+    assert capabilities.filter(MODEL, ["0x00", "0x1F"]) == ["0x00", "0x1F"]
+    capabilities.changed = False
+    miss(capabilities, "0x1F", 1)
+    assert capabilities.filter(MODEL, ["0x00", "0x1F"]) == ["0x00"]
+    assert capabilities.changed
+    # Per model
+    assert capabilities.filter("CS-2", ["0x1F"]) == ["0x1F"]
+
+
+def test_an_answer_resets_the_misses():
+    capabilities = ModelCapabilities(clock=Clock())
+    miss(capabilities, "0x1F", CAPABILITY_MISSES - 1)
+    capabilities.learn_response(MODEL, ["0x1F"], {"0x1F": "3"})
+    miss(capabilities, "0x1F", CAPABILITY_MISSES - 1)
+    assert capabilities.filter(MODEL, ["0x1F"]) == ["0x1F"]
+    # Once answered, a code is never left out
+    miss(capabilities, "0x1F", CAPABILITY_MISSES * 2)
+    assert capabilities.filter(MODEL, ["0x1F"]) == ["0x1F"]
+
+
+def test_offline_device_teaches_nothing():
+    capabilities = ModelCapabilities(clock=Clock())
+    for _ in range(CAPABILITY_MISSES):
+        capabilities.learn_response(MODEL, ["0x00", "0x1F"], {"0x00": "", "0x1F": None})
+    assert capabilities.filter(MODEL, ["0x00", "0x1F"]) == ["0x00", "0x1F"]
+
+
+def test_command_list_codes_are_supported():
+    capabilities = ModelCapabilities(clock=Clock())
+    capabilities.learn_command_list(
+        [
+            {"ModelType": MODEL, "JSON": [{"list": [{"CommandType": "0x1F"}]}]},
+            {"ModelType": "CS-2", "JSON": []},
+        ]
+    )
+    miss(capabilities, "0x1f")
+    assert capabilities.filter(MODEL, ["0x1F"]) == ["0x1F"]
+
+
+def test_left_out_codes_are_asked_again_later():
+    clock = Clock()
+    capabilities = ModelCapabilities(clock=clock)
+    miss(capabilities, "0x1F")
+    clock.now += CAPABILITY_REPROBE - 1
+    assert capabilities.filter(MODEL, ["0x1F"]) == []
+    clock.now += 1
+    assert capabilities.filter(MODEL, ["0x1F"]) == ["0x1F"]
+    assert capabilities.filter(MODEL, ["0x1F"]) == ["0x1F"]
+
+
+def test_restore_round_trip():
+    capabilities = ModelCapabilities(clock=Clock())
+    capabilities.learn_response(MODEL, ["0x00"], {"0x00": "1"})
+    miss(capabilities, "0x1F")
+    restored = ModelCapabilities(clock=Clock())
+    restored.restore(capabilities.as_dict())
+    assert restored.as_dict() == capabilities.as_dict()
+    assert restored.filter(MODEL, ["0x00", "0x1F"]) == ["0x00"]
+    assert not restored.changed
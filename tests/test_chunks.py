@@ -0,0 +1,157 @@
+"""Tests of status reads split into chunks for models failing on wide reads"""
+import asyncio
+
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import (
+    COMMANDS_PER_REQUEST,
+)
+from custom_components.panasonic_smart_app.smartApp.exceptions import (
+    PanasonicExceedRateLimit,
+)
+from custom_components.panasonic_smart_app.smartApp.utils import chunks
+
+MODEL = "CS-1"
+CODES = [f"0x{code:02X}" for code in range(COMMANDS_PER_REQUEST * 3)]
+CHUNKS = chunks(list(CODES), COMMANDS_PER_REQUEST)
+
+
+class Client(SmartApp):
+    """SmartApp whose model answers reads of a limited width"""
+
+    def __init__(self, width: int = COMMANDS_PER_REQUEST):
+        super().__init__(None, "account", "password")
+        self.width = width
+        # Chunks failing that many more times
+        self.failures: dict[tuple, int] = {}
+        self.reads = []
+        self.in_flight = 0
+        self.concurrency = 0
+
+    async def get_device_info(self, deviceId=None, gwid=None, options=()):
+        self.reads.append(list(options))
+        self.in_flight += 1
+        self.concurrency = max(self.concurrency, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        if self.failures.get(tuple(options)):
+            self.failures[tuple(options)] -= 1
+            return {}
+        # tryApiStatus answers an empty dict when the request failed
+        if len(options) > self.width:
+            return {}
+        return {code: "1" for code in options}
+
+    def read(self, options=CODES) -> tuple[dict, list]:
+        return asyncio.run(self.read_device_info("auth", "gw", MODEL, options))
+
+
+def test_narrow_read_is_never_split():
+    client = Client()
+    info, failed = client.read(CODES[:COMMANDS_PER_REQUEST])
+    assert len(info) == COMMANDS_PER_REQUEST
+    assert failed == []
+    assert client.reads == [CODES[:COMMANDS_PER_REQUEST]]
+
+
+def test_wide_read_is_not_split_when_it_works():
+    client = Client(width=len(CODES))
+    info, failed = client.read()
+    assert list(info) == CODES
+    assert client.reads == [CODES]
+    assert MODEL not in client._chunked_models
+
+
+def test_failed_wide_read_is_split():
+    client = Client()
+    info, failed = client.read()
+
+    assert list(info) == CODES
+    assert failed == []
+    # The full read, the probe, then the other chunks at once
+    assert client.reads == [CODES, *CHUNKS]
+    assert client.concurrency == len(CHUNKS) - 1
+    assert MODEL in client._chunked_models
+
+    # Later reads of the model go straight to chunks, all concurrently
+    client.reads = []
+    client.concurrency = 0
+    client.read()
+    assert client.reads == CHUNKS
+    assert client.concurrency == len(CHUNKS)
+
+
+def test_failed_probe_does_not_mark_the_model():
+    client = Client()
+    client.failures = {tuple(CHUNKS[0]): 1}
+    info, failed = client.read()
+
+    assert info == {}
+    assert failed == CODES
+    assert client.reads == [CODES, CHUNKS[0]]
+    assert MODEL not in client._chunked_models
+
+
+def test_failed_chunk_is_retried_once():
+    client = Client()
+    client._chunked_models.add(MODEL)
+    client.failures = {tuple(CHUNKS[1]): 1}
+    info, failed = client.read()
+
+    assert list(info) == [*CHUNKS[0], *CHUNKS[2], *CHUNKS[1]]
+    assert failed == []
+    assert client.reads == [*CHUNKS, CHUNKS[1]]
+    assert client.metrics.retries == {"status_chunk": 1}
+
+
+def test_codes_of_a_chunk_failing_twice_are_returned():
+    client = Client()
+    client._chunked_models.add(MODEL)
+    client.failures = {tuple(CHUNKS[1]): 2}
+    info, failed = client.read()
+
+    assert set(info) == {*CHUNKS[0], *CHUNKS[2]}
+    assert failed == CHUNKS[1]
+
+
+def test_rate_limit_on_a_chunk_is_raised():
+    client = Client()
+    client._chunked_models.add(MODEL)
+    get_device_info = client.get_device_info
+
+    async def limited(deviceId=None, gwid=None, options=()):
+        if options == CHUNKS[2]:
+            raise PanasonicExceedRateLimit
+        return await get_device_info(deviceId, gwid, options)
+
+    client.get_device_info = limited
+    with pytest.raises(PanasonicExceedRateLimit):
+        client.read()
+
+
+def test_last_values_of_failed_codes_are_kept():
+    client = Client()
+    client._chunked_models.add(MODEL)
+    client._devices = [
+        {
+            "Auth": "auth",
+            "GWID": "gw",
+            "DeviceType": "1",
+            "ModelType": MODEL,
+            "NickName": "device",
+        }
+    ]
+    client.scheduler.account_due = lambda now: False
+    asyncio.run(client.get_device_with_info({1: CODES}))
+    status = client._devices[0]["status"]
+    status.update({code: "7" for code in CODES})
+
+    client.failures = {tuple(CHUNKS[1]): 2}
+    client.scheduler.is_due = lambda auth, now: True
+    asyncio.run(client.get_device_with_info({1: CODES}))
+
+    assert [status[code] for code in CHUNKS[1]] == ["7"] * COMMANDS_PER_REQUEST
+    assert [status[code] for code in CHUNKS[0]] == ["1"] * COMMANDS_PER_REQUEST
@@ -0,0 +1,188 @@
+"""Tests of the rate limit cooldown and the recovery after it"""
+import asyncio
+
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import (
+    RATE_LIMIT_COOLDOWN,
+    RATE_LIMIT_RECOVERY_READS,
+)
+from custom_components.panasonic_smart_app.smartApp.exceptions import (
+    PanasonicExceedRateLimit,
+)
+
+DEVICE_TYPE = 1
+CODES = {DEVICE_TYPE: ["0x00", "0x01"]}
+# Long enough for every device to be due again
+CYCLE = 1000
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Client(SmartApp):
+    """SmartApp answering from memory, counting the calls it gets"""
+
+    def __init__(self, clock: Clock, count: int = 5):
+        super().__init__(None, "account", "password")
+        self.set_clock(clock, clock)
+        self.devices = [
+            {
+                "Auth": f"auth-{index}",
+                "GWID": f"gw-{index}",
+                "DeviceType": str(DEVICE_TYPE),
+                "ModelType": "CS-1",
+                "NickName": f"device {index}",
+            }
+            for index in range(count)
+        ]
+        # Read of each device raises while it is listed here
+        self.limited = set()
+        self.reads = []
+        self.overviews = 0
+        self.listings = 0
+
+    async def get_devices(self):
+        self.listings += 1
+        self._devices = [dict(device) for device in self.devices]
+        return self._devices
+
+    async def get_report(self, name):
+        return {}
+
+    async def read_device_info(self, deviceId, gwid, model_type, options):
+        self.reads.append(deviceId)
+        if deviceId in self.limited:
+            raise PanasonicExceedRateLimit
+        return {code: "1" for code in options}, []
+
+    async def get_overview(self):
+        self.overviews += 1
+        return {device["GWID"]: {"0x00": "0"} for device in self.devices}
+
+    def cycle(self) -> list:
+        self.reads = []
+        return asyncio.run(self.get_device_with_info(CODES))
+
+
+def test_rate_limit_starts_cooldown():
+    clock = Clock()
+    client = Client(clock)
+    client.limited = {"auth-0"}
+
+    devices = client.cycle()
+
+    assert client.rate_limited_until == clock.now + RATE_LIMIT_COOLDOWN
+    # No more per-device reads once limited; the overview covers every device
+    assert client.reads == ["auth-0"]
+    assert client.overviews == 1
+    assert [device["status"]["0x00"] for device in devices] == ["0"] * 5
+
+
+def test_only_the_overview_during_cooldown():
+    clock = Clock()
+    client = Client(clock)
+    client.cycle()
+    client.limited = {"auth-0"}
+    clock.now += CYCLE
+    client.cycle()
+    listings, overviews = client.listings, client.overviews
+
+    for _ in range(3):
+        clock.now += CYCLE
+        client.cycle()
+        assert client.in_cooldown()
+        assert client.reads == []
+
+    # Neither the device list nor the reports are refreshed either
+    assert client.listings == listings
+    assert client.overviews == overviews + 3
+
+
+def test_rate_limit_on_the_device_list():
+    clock = Clock()
+    client = Client(clock)
+    client.cycle()
+    clock.now += CYCLE
+
+    async def limited():
+        raise PanasonicExceedRateLimit
+
+    client.get_devices = limited
+    client.cycle()
+
+    assert client.in_cooldown()
+    assert client.reads == []
+
+
+def test_report_error_is_raised_after_every_call():
+    clock = Clock()
+    client = Client(clock)
+    get_devices = client.get_devices
+
+    async def slow_devices():
+        await asyncio.sleep(0.01)
+        return await get_devices()
+
+    async def failing(name):
+        raise RuntimeError("boom")
+
+    client.get_devices = slow_devices
+    client.get_report = failing
+    with pytest.raises(RuntimeError):
+        client.cycle()
+    # The device list was not left running
+    assert client.listings == 1
+
+
+def test_cooldown_is_restored():
+    clock = Clock()
+    client = Client(clock)
+    client.limited = {"auth-0"}
+    client.cycle()
+    saved = client.cooldown_as_dict()
+
+    restarted = Client(clock)
+    restarted.restore_cooldown(saved)
+    restarted.cycle()
+    # Only the first device list is read
+    assert restarted.reads == []
+    assert restarted.overviews == 1
+
+    clock.now += RATE_LIMIT_COOLDOWN
+    assert not restarted.in_cooldown()
+    assert restarted.cooldown_as_dict() == {"until": None}
+
+
+def test_nothing_to_restore():
+    client = Client(Clock())
+    client.restore_cooldown({})
+    assert not client.in_cooldown()
+    assert client.rate_limited_until is None
+
+
+def test_recovery_reads_double_each_cycle():
+    clock = Clock()
+    client = Client(clock)
+    client.limited = {"auth-0"}
+    client.cycle()
+    client.limited = set()
+
+    clock.now += RATE_LIMIT_COOLDOWN
+    reads = []
+    for _ in range(5):
+        overviews = client.overviews
+        client.cycle()
+        reads.append(len(client.reads))
+        # Devices left unread are refreshed by the overview
+        assert client.overviews == overviews + (len(client.reads) < 5)
+        clock.now += CYCLE
+
+    assert reads[0] == RATE_LIMIT_RECOVERY_READS
+    assert reads == [1, 2, 4, 5, 5]
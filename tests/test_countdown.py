@@ -0,0 +1,91 @@
+"""Tests of countdowns ticked down between device reads"""
+import asyncio
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+
+WASHER = {
+    "Auth": "AUTH1",
+    "GWID": "GW1",
+    "DeviceType": "3",
+    "ModelType": "NA-V1",
+    "NickName": "Washer",
+}
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def washer_client(clock: Clock) -> tuple[SmartApp, dict]:
+    client = SmartApp(None, "account", "password")
+    client.set_clock(clock, clock)
+    client.scheduler.timer_codes = {3: {"0x13": (60, True)}}
+    device = dict(WASHER)
+    device["status"] = client.get_device_status(device, ["0x50", "0x13"])
+    return client, device
+
+
+def read(client: SmartApp, device: dict, info: dict, now: float) -> None:
+    """What a DeviceGetInfo read of the washer does to its status"""
+    device["status"].update(info)
+    client._mark_read(device["Auth"], info, now)
+
+
+def apply_overview(client: SmartApp, device: dict, overview: dict, now: float) -> None:
+    async def get_overview():
+        return {device["GWID"]: overview}
+
+    client.get_overview = get_overview
+    asyncio.run(client._apply_overview([device], now, {}))
+
+
+def test_countdown_ticks_down_from_the_read():
+    clock = Clock()
+    client, device = washer_client(clock)
+    read(client, device, {"0x50": "1", "0x13": "30"}, 0.0)
+    assert client.get_countdown(device, "0x13") == 30
+    clock.now = 600.0
+    assert client.get_countdown(device, "0x13") == 20
+    clock.now = 3600.0
+    assert client.get_countdown(device, "0x13") == 0
+
+
+def test_overview_without_the_code_keeps_its_read_time():
+    clock = Clock()
+    client, device = washer_client(clock)
+    read(client, device, {"0x50": "1", "0x13": "30"}, 0.0)
+
+    clock.now = 300.0
+    apply_overview(client, device, {"0x50": "1"}, clock.now)
+    clock.now = 600.0
+    assert client.get_countdown(device, "0x13") == 20
+
+    # Left empty by the overview, the value and its read time are kept
+    apply_overview(client, device, {"0x50": "1", "0x13": ""}, clock.now)
+    clock.now = 900.0
+    assert client.get_countdown(device, "0x13") == 15
+
+
+def test_overview_with_the_code_anchors_it_again():
+    clock = Clock()
+    client, device = washer_client(clock)
+    read(client, device, {"0x50": "1", "0x13": "30"}, 0.0)
+
+    clock.now = 600.0
+    apply_overview(client, device, {"0x13": "22"}, clock.now)
+    assert client.get_countdown(device, "0x13") == 22
+    clock.now = 660.0
+    assert client.get_countdown(device, "0x13") == 21
+
+
+def test_codes_without_a_timer_are_returned_as_read():
+    clock = Clock()
+    client, device = washer_client(clock)
+    read(client, device, {"0x50": "2", "0x13": ""}, 0.0)
+    clock.now = 600.0
+    assert client.get_countdown(device, "0x50") == 2
+    assert client.get_countdown(device, "0x13") is None
@@ -0,0 +1,91 @@
+"""Tests of the request slots shared between accounts"""
+import asyncio
+
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp.dispatcher import (
+    RequestDispatcher,
+)
+from tools.virtual_clock import run
+
+
+def flood(slots: int, requests: dict[str, int]) -> list[str]:
+    """Accounts each sending a burst of requests; the order of the grants"""
+    dispatcher = RequestDispatcher(slots)
+    grants = []
+
+    async def send(account: str):
+        async with dispatcher.slot(account):
+            grants.append(account)
+            await asyncio.sleep(2)
+
+    async def main():
+        await asyncio.gather(
+            *[
+                send(account)
+                for account, count in requests.items()
+                for _ in range(count)
+            ]
+        )
+        assert dispatcher.waiting == 0
+        assert dispatcher._free == slots
+
+    run(main())
+    return grants
+
+
+def test_accounts_take_turns():
+    grants = flood(1, {"a": 4, "b": 4})
+    # The first request finds the slot free, then the accounts alternate
+    assert grants == ["a", "a", "b", "a", "b", "a", "b", "b"]
+
+
+def test_busy_account_does_not_starve_another():
+    grants = flood(2, {"a": 10, "b": 2})
+    # Once both accounts wait, b gets every other slot despite the backlog of a
+    assert [index for index, account in enumerate(grants) if account == "b"] == [
+        3,
+        5,
+    ]
+
+
+def test_cancelled_waiter_leaves_the_line():
+    dispatcher = RequestDispatcher(1)
+
+    async def main():
+        await dispatcher.acquire("a")
+        waiter = asyncio.create_task(dispatcher.acquire("b"))
+        await asyncio.sleep(0)
+        assert dispatcher.waiting == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert dispatcher.waiting == 0
+
+        dispatcher.release()
+        assert dispatcher._free == 1
+
+    run(main())
+
+
+def test_slot_handed_to_a_cancelled_waiter_is_released():
+    dispatcher = RequestDispatcher(1)
+
+    async def main():
+        await dispatcher.acquire("a")
+        waiter = asyncio.create_task(dispatcher.acquire("b"))
+        await asyncio.sleep(0)
+
+        # Handed over, but cancelled before the waiter resumes
+        dispatcher.release()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert dispatcher.waiting == 0
+        assert dispatcher._free == 1
+        # The slot can still be taken
+        await asyncio.wait_for(dispatcher.acquire("c"), 1)
+
+    run(main())
@@ -0,0 +1,267 @@
+"""Tests of the table-driven switch, select and number entities"""
+import asyncio
+
+import pytest
+
+from custom_components.panasonic_smart_app.const import (
+    DEVICE_TYPE_AC,
+    DEVICE_TYPE_DEHUMIDIFIER,
+    DEVICE_TYPE_PURIFIER,
+    DEVICE_TYPE_REFRIGERATOR,
+    LABEL_BUZZER,
+    LABEL_CLIMATE_CLEAN,
+    LABEL_CLIMATE_INDICATOR,
+    LABEL_CLIMATE_MOLD_PREVENTION,
+    LABEL_CLIMATE_MOTION_DETECTION,
+    LABEL_CLIMATE_OFF_TIMER,
+    LABEL_CLIMATE_ON_TIMER,
+    LABEL_CLIMATE_SLEEP,
+    LABEL_DEHUMIDIFIER_BUZZER,
+    LABEL_DEHUMIDIFIER_FAN_MODE,
+    LABEL_DEHUMIDIFIER_FAN_POSITION,
+    LABEL_DEHUMIDIFIER_OFF_TIMER,
+    LABEL_DEHUMIDIFIER_ON_TIMER,
+    LABEL_ECONAVI,
+    LABEL_NANOE,
+    LABEL_NANOEX,
+    LABEL_POWER,
+    LABEL_PURIFIER_FAN_LEVEL,
+    LABEL_REFRIGERATOR_QUICK_ICE_MAKING,
+    LABEL_REFRIGERATOR_STOP_ICE_MAKING,
+    LABEL_TURBO,
+)
+from custom_components.panasonic_smart_app.entity import build_described_entities
+from custom_components.panasonic_smart_app.number import (
+    NUMBER_DESCRIPTIONS,
+    PanasonicTimerNumber,
+)
+from custom_components.panasonic_smart_app.select import (
+    SELECT_DESCRIPTIONS,
+    PanasonicSelect,
+)
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.switch import (
+    SWITCH_DESCRIPTIONS,
+    PanasonicSwitch,
+)
+
+NICKNAME = "Living room"
+PARAMETERS = [["Low", 0], ["High", 2]]
+
+# What the hand-written classes did: status code, set command, label
+# without the nickname, inverted values, and when they were available
+SWITCHES = {
+    "ac_nanoe": ("0x08", 136, LABEL_NANOE, False, "power_on"),
+    "ac_econavi": ("0x1B", 155, LABEL_ECONAVI, False, "power_on"),
+    "ac_buzzer": ("0x1E", 30, LABEL_BUZZER, True, "power_on"),
+    "ac_turbo": ("0x1A", 154, LABEL_TURBO, False, "power_on"),
+    "ac_sleep": ("0x05", 5, LABEL_CLIMATE_SLEEP, False, "power_on"),
+    "ac_mold_prevention": ("0x17", 23, LABEL_CLIMATE_MOLD_PREVENTION, False, "power_on"),
+    "ac_self_clean": ("0x18", 24, LABEL_CLIMATE_CLEAN, False, "power_on"),
+    "purifier_power": ("0x00", 128, None, False, "power_reported"),
+    "purifier_nanoex": ("0x07", 135, LABEL_NANOEX, False, "power_on"),
+    "dehumidifier_nanoex": ("0x0D", 0x8D, LABEL_NANOEX, False, "power_on"),
+    "dehumidifier_buzzer": ("0x18", 0x98, LABEL_DEHUMIDIFIER_BUZZER, True, "power_reported"),
+    "refrigerator_stop_ice_making": (
+        "0x52",
+        0x52,
+        LABEL_REFRIGERATOR_STOP_ICE_MAKING,
+        False,
+        None,
+    ),
+    "refrigerator_quick_ice_making": (
+        "0x53",
+        0x53,
+        LABEL_REFRIGERATOR_QUICK_ICE_MAKING,
+        False,
+        None,
+    ),
+}
+SELECTS = {
+    "dehumidifier_fan_mode": ("0x0E", 142, LABEL_DEHUMIDIFIER_FAN_MODE),
+    "dehumidifier_fan_position": ("0x09", 0x89, LABEL_DEHUMIDIFIER_FAN_POSITION),
+    "ac_motion_detection": ("0x19", 153, LABEL_CLIMATE_MOTION_DETECTION),
+    "ac_indicator_light": ("0x1F", 159, LABEL_CLIMATE_INDICATOR),
+    "purifier_fan_level": ("0x01", 129, None),
+    # Named after the CommandName of the model
+    "refrigerator_freezer_temperature": ("0x00", 0x00, "CommandName"),
+    "refrigerator_refrigerator_temperature": ("0x01", 0x01, "CommandName"),
+    "refrigerator_partial_freezing_temperature": ("0x57", 0x57, "CommandName"),
+}
+NUMBERS = {
+    "dehumidifier_off_timer": ("0x02", 130, LABEL_DEHUMIDIFIER_OFF_TIMER, "power_on"),
+    "dehumidifier_on_timer": ("0x55", 213, LABEL_DEHUMIDIFIER_ON_TIMER, "power_off"),
+    "ac_off_timer": ("0x0C", 140, LABEL_CLIMATE_OFF_TIMER, "power_on"),
+    "ac_on_timer": ("0x0B", 139, LABEL_CLIMATE_ON_TIMER, "power_off"),
+}
+# Power status of the appliance, and whether each rule makes it available
+AVAILABILITY = {
+    "power_on": {"1": True, "0": False, None: False},
+    "power_off": {"1": False, "0": True, None: False},
+    "power_reported": {"1": True, "0": True, None: False},
+    None: {"1": True, "0": True, None: True},
+}
+
+
+class Coordinator(object):
+    def __init__(self, devices: list):
+        self.data = devices
+        self.last_update_success = True
+        self.refreshes = 0
+
+    async def async_request_refresh(self) -> None:
+        self.refreshes += 1
+
+
+class Client(SmartApp):
+    """SmartApp recording the commands it is asked to send"""
+
+    def __init__(self, command_types=()):
+        super().__init__(None, "account", "password")
+        self._commands = [
+            {
+                "ModelType": "M1",
+                "JSON": [
+                    {
+                        "list": [
+                            {
+                                "CommandType": command_type,
+                                "CommandName": "CommandName",
+                                "Parameters": PARAMETERS,
+                            }
+                            for command_type in command_types
+                        ]
+                    }
+                ],
+            }
+        ]
+        self.sent = []
+
+    async def set_command(self, deviceId, command, value):
+        self.sent.append((deviceId, command, value))
+        return True
+
+
+def device(device_type: int, status: dict) -> dict:
+    return {
+        "Auth": "auth",
+        "DeviceType": str(device_type),
+        "ModelType": "M1",
+        "Model": "Model",
+        "NickName": NICKNAME,
+        "status": status,
+    }
+
+
+def describe(descriptions, key: str):
+    return next(description for description in descriptions if description.key == key)
+
+
+def entity(entity_class, descriptions, key: str, status: dict):
+    description = describe(descriptions, key)
+    client = Client([description.status_code])
+    coordinator = Coordinator([device(description.device_type, status)])
+    return entity_class(coordinator, 0, client, coordinator.data[0], description)
+
+
+def expected_label(label: str | None, default: str) -> str:
+    return f"{NICKNAME} {label}" if label else default
+
+
+def test_tables_cover_every_removed_class():
+    assert {d.key for d in SWITCH_DESCRIPTIONS} == set(SWITCHES)
+    assert {d.key for d in SELECT_DESCRIPTIONS} == set(SELECTS)
+    assert {d.key for d in NUMBER_DESCRIPTIONS} == set(NUMBERS)
+
+
+@pytest.mark.parametrize("key", SWITCHES)
+def test_switch_matches_the_removed_class(key):
+    status_code, command, label, invert, availability = SWITCHES[key]
+    switch = entity(PanasonicSwitch, SWITCH_DESCRIPTIONS, key, {status_code: "1"})
+
+    assert switch.label == expected_label(label, LABEL_POWER)
+    assert switch.unique_id == "auth" + switch.label
+    assert switch.is_on is not invert
+
+    asyncio.run(switch.async_turn_on())
+    asyncio.run(switch.async_turn_off())
+    on, off = (0, 1) if invert else (1, 0)
+    assert switch.client.sent == [("auth", command, on), ("auth", command, off)]
+    assert switch.coordinator.refreshes == 2
+
+    for power, available in AVAILABILITY[availability].items():
+        status = switch.coordinator.data[0]["status"]
+        status.pop("0x00", None)
+        if power is not None:
+            status["0x00"] = power
+        assert switch.available is available, power
+
+
+@pytest.mark.parametrize("key", SELECTS)
+def test_select_matches_the_removed_class(key):
+    status_code, command, label = SELECTS[key]
+    select = entity(PanasonicSelect, SELECT_DESCRIPTIONS, key, {status_code: "2"})
+
+    if key == "purifier_fan_level":
+        assert select.label == LABEL_PURIFIER_FAN_LEVEL
+    else:
+        assert select.label == expected_label(label, "")
+    assert select.options == ["Low", "High"]
+    assert select.current_option == "High"
+
+    asyncio.run(select.async_select_option("Low"))
+    asyncio.run(select.async_select_option("Unknown"))
+    assert select.client.sent == [("auth", command, 0)]
+
+
+@pytest.mark.parametrize("key", NUMBERS)
+def test_number_matches_the_removed_class(key):
+    status_code, command, label, availability = NUMBERS[key]
+    number = entity(PanasonicTimerNumber, NUMBER_DESCRIPTIONS, key, {status_code: "30"})
+    # Countdowns are read from the status record of the client
+    number.client.get_device_status(number.device).update({status_code: "30"})
+
+    assert number.label == expected_label(label, "")
+    assert number.native_value == 30
+    assert set(number.status_codes) == {status_code, "0x00"}
+
+    asyncio.run(number.async_set_native_value(45.0))
+    assert number.client.sent == [("auth", command, 45)]
+
+    number.coordinator.data[0]["status"]["0x00"] = "1"
+    assert number.available is AVAILABILITY[availability]["1"]
+
+
+def test_missing_command_is_labelled_by_key():
+    description = describe(SELECT_DESCRIPTIONS, "refrigerator_freezer_temperature")
+    client = Client()
+    coordinator = Coordinator([device(DEVICE_TYPE_REFRIGERATOR, {"0x00": "2"})])
+    select = PanasonicSelect(coordinator, 0, client, coordinator.data[0], description)
+
+    assert select.label == f"{NICKNAME} {description.key}"
+    assert select.options == []
+
+
+def test_entities_are_built_for_supported_codes_only():
+    # The AC model lacks nanoe; the refrigerator reports only stop ice making
+    client = Client(["0x1B", "0x1E"])
+    coordinator = Coordinator(
+        [
+            device(DEVICE_TYPE_AC, {"0x00": "1"}),
+            device(DEVICE_TYPE_REFRIGERATOR, {"0x52": "0"}),
+            device(DEVICE_TYPE_DEHUMIDIFIER, {}),
+            device(DEVICE_TYPE_PURIFIER, {}),
+        ]
+    )
+
+    switches = build_described_entities(
+        coordinator, client, SWITCH_DESCRIPTIONS, PanasonicSwitch
+    )
+
+    assert [
+        (switch.index, switch.entity_description.key) for switch in switches
+    ] == [
+        (0, "ac_econavi"),
+        (0, "ac_buzzer"),
+        (1, "refrigerator_stop_ice_making"),
+    ]
@@ -0,0 +1,132 @@
+"""Tests of coalesced bitmask writes"""
+import asyncio
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import MASK_WRITE_WINDOW
+from custom_components.panasonic_smart_app.smartApp.status import (
+    CommandTypeIndex,
+    DeviceStatus,
+)
+from tools.virtual_clock import run
+
+DEVICE = "device"
+CODE = "0x70"
+COMMAND = 112
+
+
+class Client(SmartApp):
+    """SmartApp whose writes are recorded instead of sent"""
+
+    def __init__(self, mask: str = "0", answers=(), duration: float = 1.0):
+        super().__init__(None, "account", "password")
+        self._statuses[DEVICE] = DeviceStatus(CommandTypeIndex(), {CODE: mask})
+        # Answer of each write in turn, True once they run out
+        self.answers = list(answers)
+        self.duration = duration
+        self.writes = []
+
+    async def set_command(self, deviceId, command, value):
+        loop = asyncio.get_running_loop()
+        self.writes.append((loop.time(), value))
+        await asyncio.sleep(self.duration)
+        answer = self.answers.pop(0) if self.answers else True
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    @property
+    def mask(self) -> str:
+        return self._statuses[DEVICE][CODE]
+
+
+def test_changes_within_the_window_are_one_write():
+    client = Client("1")
+
+    async def main():
+        first = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b010)
+        # Applied to the cached status right away
+        assert client.mask == "3"
+        await asyncio.sleep(MASK_WRITE_WINDOW / 2)
+        second = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b100)
+        assert client.mask == "7"
+        return await asyncio.gather(first, second)
+
+    assert run(main()) == [True, True]
+    assert [value for _, value in client.writes] == [0b111]
+    assert client.writes[0][0] == MASK_WRITE_WINDOW
+    assert client.mask == "7"
+
+
+def test_latest_change_of_a_bit_wins():
+    client = Client("1")
+
+    async def main():
+        client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b010)
+        return await client.update_mask(DEVICE, CODE, COMMAND, clear_bits=0b011)
+
+    assert run(main()) is True
+    assert [value for _, value in client.writes] == [0]
+    assert client.mask == "0"
+
+
+def test_change_during_a_write_joins_the_next_batch():
+    client = Client("0", duration=2.0)
+
+    async def main():
+        first = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b001)
+        # The first write is in flight until 2.5
+        await asyncio.sleep(MASK_WRITE_WINDOW + 0.5)
+        second = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b100)
+        third = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b010)
+        return await asyncio.gather(first, second, third)
+
+    assert run(main()) == [True, True, True]
+    # The second batch waits for the lock, then writes both of its changes
+    assert client.writes == [(MASK_WRITE_WINDOW, 0b001), (2 + MASK_WRITE_WINDOW, 0b111)]
+    assert client.mask == "7"
+
+
+def test_failed_write_reverts_only_its_bits():
+    client = Client("1", answers=[False, True], duration=2.0)
+
+    async def main():
+        first = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b010)
+        await asyncio.sleep(MASK_WRITE_WINDOW + 0.5)
+        # Changed by the next batch while the first one fails
+        second = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b100)
+        assert not await first
+        assert client.mask == "5"
+        return await second
+
+    assert run(main()) is True
+    assert [value for _, value in client.writes] == [0b011, 0b101]
+    assert client.mask == "5"
+
+
+def test_raising_write_is_reverted():
+    client = Client("1", answers=[RuntimeError("boom")])
+
+    async def main():
+        return await client.update_mask(DEVICE, CODE, COMMAND, clear_bits=0b001)
+
+    assert run(main()) is False
+    assert client.mask == "1"
+
+
+def test_cancelled_write_resolves_and_reverts():
+    client = Client("1")
+
+    async def main():
+        written = client.update_mask(DEVICE, CODE, COMMAND, set_bits=0b010)
+        batch = client._mask_batches[DEVICE]
+        await asyncio.sleep(0)
+        # As on unload, before the window ends
+        batch.task.cancel()
+        result = await written
+        # A later change starts a new batch
+        assert DEVICE not in client._mask_batches
+        return result
+
+    assert run(main()) is False
+    assert client.writes == []
+    assert client.mask == "1"
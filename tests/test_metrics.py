@@ -0,0 +1,121 @@
+"""Tests of the per-endpoint API metrics"""
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import LATENCY_BUCKETS
+from custom_components.panasonic_smart_app.smartApp.exceptions import (
+    PanasonicDeviceOffline,
+)
+from custom_components.panasonic_smart_app.smartApp.metrics import (
+    EndpointMetrics,
+    RequestMetrics,
+)
+from tools.virtual_clock import run
+
+ENDPOINT = "https://example.invalid/api/DeviceGetInfo"
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Response(object):
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class Session(object):
+    """Answers after the given latency on the clock, or fails"""
+
+    def __init__(self, clock: Clock, latency: float, response: Response | None):
+        self.clock = clock
+        self.latency = latency
+        self.response = response
+
+    async def request(self, method, **kwargs) -> Response:
+        self.clock.now += self.latency
+        if self.response is None:
+            raise ConnectionError("unreachable")
+        return self.response
+
+
+def client(latency: float, response: Response | None) -> SmartApp:
+    clock = Clock()
+    client = SmartApp(Session(clock, latency, response), "account", "password")
+    client.set_clock(clock, clock)
+    return client
+
+
+def test_latency_buckets_include_their_bound():
+    metrics = EndpointMetrics()
+    for latency in (0.1, LATENCY_BUCKETS[0], 0.3, LATENCY_BUCKETS[-1] + 1):
+        metrics.record(200, latency, 10)
+
+    assert metrics.buckets[0] == 2
+    assert metrics.buckets[1] == 1
+    assert metrics.buckets[-1] == 1
+    assert sum(metrics.buckets) == metrics.requests == 4
+    assert metrics.bytes_received == 40
+
+
+def test_quantiles_are_bucket_bounds():
+    metrics = EndpointMetrics()
+    assert metrics.latency_mean is None
+    assert metrics.latency_quantile(0.5) is None
+
+    for latency in [0.1] * 18 + [3.0, 40.0]:
+        metrics.record(200, latency, 0)
+
+    assert metrics.latency_quantile(0.5) == LATENCY_BUCKETS[0]
+    assert metrics.latency_quantile(0.95) == 5
+    # Beyond every bound, the slowest request seen
+    assert metrics.latency_quantile(1.0) == 40.0
+    assert metrics.latency_mean == pytest.approx((1.8 + 43.0) / 20)
+
+
+def test_statuses_and_retries_per_endpoint():
+    metrics = RequestMetrics()
+    metrics.record(ENDPOINT, 200, 0.2)
+    metrics.record(ENDPOINT + "/", 429, 0.2)
+    metrics.record("https://example.invalid/api/UserGetInfo", "error", 1.0)
+    metrics.retried("login")
+    metrics.retried("login")
+
+    data = metrics.as_dict()
+    assert set(data["endpoints"]) == {"DeviceGetInfo", "UserGetInfo"}
+    assert data["endpoints"]["DeviceGetInfo"]["statuses"] == {"200": 1, "429": 1}
+    assert data["endpoints"]["UserGetInfo"]["statuses"] == {"error": 1}
+    assert data["retries"] == {"login": 2}
+    # The same object the sensors read
+    assert metrics.get(ENDPOINT) is metrics.endpoints["DeviceGetInfo"]
+
+
+def test_answered_request_is_recorded():
+    api = client(0.3, Response(200, b'{"devices": []}'))
+    run(api._request("POST", {}, ENDPOINT))
+
+    metrics = api.metrics.get(ENDPOINT).as_dict()
+    assert metrics["requests"] == 1
+    assert metrics["statuses"] == {"200": 1}
+    # The HTTP exchange only, not the pause between requests
+    assert metrics["latency_max"] == pytest.approx(0.3)
+    assert metrics["bytes_received"] == len(b'{"devices": []}')
+
+
+def test_unanswered_request_is_recorded_as_an_error():
+    api = client(2.0, None)
+    with pytest.raises(PanasonicDeviceOffline):
+        run(api._request("POST", {}, ENDPOINT))
+
+    metrics = api.metrics.get(ENDPOINT).as_dict()
+    assert metrics["statuses"] == {"error": 1}
+    assert metrics["latency_max"] == pytest.approx(2.0)
+    assert metrics["bytes_received"] == 0
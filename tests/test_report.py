@@ -0,0 +1,93 @@
+"""Tests of the UserGetInfo report parsers"""
+from datetime import date
+import logging
+
+from custom_components.panasonic_smart_app.smartApp.report import (
+    parse_daily_report,
+    parse_report_metrics,
+)
+
+
+def test_daily_report_per_gateway():
+    response = {
+        "GwList": [
+            {
+                "GwID": "GW1",
+                "Information": [
+                    {"DataTime": "2024/01/01", "DataValue": "1.5"},
+                    {"DataTime": "2024-01-02", "DataValue": 2},
+                ],
+            },
+            {"GwID": "GW2", "Data": [{"Date": "20240103", "Value": "0.25"}]},
+            {"Information": [{"DataTime": "2024/01/01", "DataValue": 1}]},
+        ]
+    }
+    assert parse_daily_report(response) == {
+        "GW1": [(date(2024, 1, 1), 1.5), (date(2024, 1, 2), 2.0)],
+        "GW2": [(date(2024, 1, 3), 0.25)],
+    }
+
+
+def test_daily_report_skips_rows_without_a_value():
+    response = {
+        "GwList": [
+            {
+                "GwID": "GW1",
+                "Information": [
+                    {"DataTime": "2024/01/01", "DataValue": ""},
+                    {"DataTime": "2024/01/02", "DataValue": True},
+                    {"DataTime": "2024/01/03", "DataValue": "3"},
+                ],
+            }
+        ]
+    }
+    assert parse_daily_report(response) == {"GW1": [(date(2024, 1, 3), 3.0)]}
+
+
+def test_daily_report_skips_undated_rows(caplog):
+    response = {
+        "GwList": [
+            {
+                "GwID": "GW1",
+                "Information": [
+                    {"DataValue": "1"},
+                    "2",
+                    {"DataTime": "2024/01/03", "DataValue": "3"},
+                ],
+            }
+        ]
+    }
+    with caplog.at_level(logging.WARNING):
+        assert parse_daily_report(response) == {"GW1": [(date(2024, 1, 3), 3.0)]}
+    assert "Skipped 2 rows" in caplog.text
+
+
+def test_daily_report_without_a_series(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert parse_daily_report({"GwList": [{"GwID": "GW1", "Total": 3}]}) == {
+            "GW1": []
+        }
+    assert "No daily series" in caplog.text
+    assert parse_daily_report({}) == {}
+    assert parse_daily_report({"GwList": None}) == {}
+
+
+def test_report_metrics_keep_numeric_totals():
+    response = {
+        "GwList": [
+            {
+                "GwID": "GW1",
+                "Total_kwh": "12.5",
+                "Ref_OpenDoor_Total": 31,
+                "Name": "AC",
+                "Flag": True,
+                "DeviceID": 1,
+                "Count": 3,
+                "Missing_Total": "",
+            },
+            {"Total_kwh": "1"},
+        ]
+    }
+    assert parse_report_metrics(response) == {
+        "GW1": {"Total_kwh": 12.5, "Ref_OpenDoor_Total": 31.0}
+    }
@@ -0,0 +1,122 @@
+"""Tests of response handling and debug logging of API requests"""
+import json
+import logging
+
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import (
+    DEBUG_LOG_SAMPLE,
+    EXCEPTION_INVALID_REFRESH_TOKEN,
+)
+from custom_components.panasonic_smart_app.smartApp.exceptions import (
+    PanasonicExceedRateLimit,
+    PanasonicLoginFailed,
+    PanasonicTokenExpired,
+)
+from custom_components.panasonic_smart_app.smartApp.utils import chunks, redact
+from tools.virtual_clock import run
+
+LOGGER = "custom_components.panasonic_smart_app.smartApp"
+ENDPOINT = "https://example.invalid/api/UserGetInfo"
+
+
+class Response(object):
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+        self.reads = 0
+
+    async def read(self) -> bytes:
+        self.reads += 1
+        return self.body
+
+
+class Session(object):
+    def __init__(self, response: Response):
+        self.response = response
+
+    async def request(self, method, **kwargs) -> Response:
+        return self.response
+
+
+def request(status: int, answer, request_id: int = 1):
+    """Answer of one request, and the response it was read from"""
+    body = answer if isinstance(answer, bytes) else json.dumps(answer).encode()
+    response = Response(status, body)
+    client = SmartApp(Session(response), "account", "password")
+    client.last_request_id = request_id - 1
+    # On virtual time, so the delay between requests takes none
+    result = run(
+        client._request(
+            "POST",
+            {"cptoken": "secret-token", "auth": "device-auth"},
+            ENDPOINT,
+            data={"MemId": "me@example.com", "PW": "hunter2", "name": "Power"},
+        )
+    )
+    return result, response
+
+
+def test_chunks():
+    assert chunks([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+def test_redact_nested_credentials():
+    data = {
+        "CPToken": "a",
+        "List": [{"RefreshToken": "b", "Name": "c", "Auth": "d"}],
+        "pw": 1,
+    }
+    assert redact(data) == {
+        "CPToken": "**REDACTED**",
+        "List": [{"RefreshToken": "**REDACTED**", "Name": "c", "Auth": "**REDACTED**"}],
+        "pw": "**REDACTED**",
+    }
+    assert data["CPToken"] == "a"
+
+
+def test_ok_answer_is_read_once():
+    result, response = request(200, {"GwList": []})
+    assert result == {"GwList": []}
+    assert response.reads == 1
+
+
+def test_ok_answer_that_is_not_json():
+    assert request(200, b"<html>")[0] == {}
+
+
+def test_failed_answers():
+    with pytest.raises(PanasonicExceedRateLimit):
+        request(429, b"")
+    with pytest.raises(PanasonicTokenExpired):
+        request(417, {"StateMsg": EXCEPTION_INVALID_REFRESH_TOKEN})
+    with pytest.raises(PanasonicLoginFailed):
+        request(417, b"not json")
+    result, response = request(500, b"boom")
+    assert result is None
+    assert response.reads == 1
+
+
+def test_sampled_debug_log_is_redacted(caplog):
+    with caplog.at_level(logging.DEBUG, logger=LOGGER):
+        request(200, {"CPToken": "new-token", "GwList": []}, DEBUG_LOG_SAMPLE)
+    assert "UserGetInfo" in caplog.text
+    assert "**REDACTED**" in caplog.text
+    secrets = ("secret-token", "device-auth", "new-token", "me@example.com", "hunter2")
+    for secret in secrets:
+        assert secret not in caplog.text
+
+
+def test_unsampled_debug_log_is_a_summary(caplog):
+    with caplog.at_level(logging.DEBUG, logger=LOGGER):
+        request(200, {"CPToken": "new-token"}, DEBUG_LOG_SAMPLE + 1)
+    assert [record.getMessage() for record in caplog.records] == [
+        f"Making #{DEBUG_LOG_SAMPLE + 1} request to {ENDPOINT}"
+    ]
+
+
+def test_no_debug_log_when_disabled(caplog):
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        request(200, {"CPToken": "new-token"}, DEBUG_LOG_SAMPLE)
+    assert caplog.records == []
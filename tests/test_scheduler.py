@@ -0,0 +1,146 @@
+"""Tests of the activity-adaptive poll scheduler"""
+import pytest
+
+from custom_components.panasonic_smart_app.smartApp.budget import CallBudget
+from custom_components.panasonic_smart_app.smartApp.const import (
+    BUDGET_MAX_STRETCH,
+    POLL_IDLE_FACTOR,
+    POLL_INTERVAL_ACTIVE,
+    POLL_MIN_WAKEUP,
+    POLL_TRANSITION_MARGIN,
+)
+from custom_components.panasonic_smart_app.smartApp.scheduler import (
+    PollScheduler,
+    is_positive,
+)
+
+INTERVAL = 180
+IDLE = INTERVAL * POLL_IDLE_FACTOR
+AC = 1
+WASHER = 3
+
+ON = {"0x00": "1"}
+OFF = {"0x00": "0"}
+# Five devices off leave room in the configured volume for one running
+IDLE_FLEET = {f"off{i}": (AC, OFF) for i in range(5)}
+
+
+def scheduler(**kwargs) -> PollScheduler:
+    options = {
+        "active_codes": {AC: ("0x00",), WASHER: ("0x50",)},
+        "idle_codes": {AC: ("0x0A",)},
+        "timer_codes": {AC: {"0x0B": (60, False)}, WASHER: {"0x13": (60, True)}},
+        "clock": lambda: 0.0,
+    }
+    options.update(kwargs)
+    return PollScheduler(INTERVAL, **options)
+
+
+def delays(polled: dict, **kwargs) -> dict[str, float]:
+    planner = scheduler(**kwargs)
+    planner.plan(polled, 0.0)
+    return dict(planner._next_poll)
+
+
+@pytest.mark.parametrize(
+    "value, positive",
+    [("1", True), ("0", False), ("", False), (None, False), ("A", False), (2, True)],
+)
+def test_is_positive(value, positive):
+    assert is_positive({"0x00": value}, "0x00") is positive
+
+
+def test_device_interval_by_activity():
+    planner = scheduler()
+    assert planner.device_interval(AC, ON) == POLL_INTERVAL_ACTIVE
+    assert planner.device_interval(AC, OFF) == IDLE
+    # Waiting on the user wins over running
+    assert planner.device_interval(AC, {"0x00": "1", "0x0A": "1"}) == IDLE
+    # Unknown status, or a type without activity codes
+    assert planner.device_interval(AC, {}) == INTERVAL
+    assert planner.device_interval(99, ON) == INTERVAL
+
+
+def test_active_interval_never_exceeds_the_configured_one():
+    planner = PollScheduler(30, active_codes={AC: ("0x00",)})
+    assert planner.device_interval(AC, ON) == 30
+    assert planner.tick == 30
+
+
+def test_mixed_devices_keep_their_intervals():
+    # One running device and five idle ones read less than once per interval each
+    polled = {"on": (AC, ON), **IDLE_FLEET}
+    assert delays(polled) == {
+        "on": POLL_INTERVAL_ACTIVE,
+        **dict.fromkeys(IDLE_FLEET, IDLE),
+    }
+
+
+def test_running_devices_are_stretched_to_the_configured_volume():
+    polled = {"on": (AC, ON), "off": (AC, OFF)}
+    demand = 1 / POLL_INTERVAL_ACTIVE + 1 / IDLE
+    scale = demand / (2 / INTERVAL)
+    assert delays(polled) == {
+        "on": pytest.approx(POLL_INTERVAL_ACTIVE * scale),
+        "off": pytest.approx(IDLE * scale),
+    }
+
+
+def test_timer_reads_the_device_when_it_fires():
+    # Two minutes left on an AC timer, earlier than the idle read
+    assert delays({"ac": (AC, {"0x00": "0", "0x0B": "2"})}) == {
+        "ac": 120 + POLL_TRANSITION_MARGIN
+    }
+    # A running AC is still read at its own pace before the timer
+    polled = {"ac": (AC, {"0x00": "1", "0x0B": "30"}), **IDLE_FLEET}
+    assert delays(polled)["ac"] == POLL_INTERVAL_ACTIVE
+
+
+def test_exclusive_timer_skips_reads_until_it_fires():
+    # Nothing else changes while the washer runs, even though it is active
+    assert delays({"wm": (WASHER, {"0x50": "1", "0x13": "5"})}) == {
+        "wm": 300 + POLL_TRANSITION_MARGIN
+    }
+    # But a long wash is still checked at the slow pace
+    assert delays({"wm": (WASHER, {"0x50": "1", "0x13": "60"})}) == {"wm": IDLE}
+
+
+def test_next_transition_picks_the_earliest_timer():
+    planner = scheduler(timer_codes={AC: {"0x0B": (60, False), "0x0C": (1, True)}})
+    assert planner.next_transition(AC, {"0x0B": "2", "0x0C": "90"}) == (90, True)
+    assert planner.next_transition(AC, {"0x0B": "", "0x0C": "x"}) is None
+
+
+def test_next_wakeup_is_clamped():
+    planner = scheduler()
+    planner.account_polled(0.0)
+    planner.plan({"on": (AC, ON), **IDLE_FLEET}, 0.0)
+    assert planner.next_wakeup(0.0) == POLL_INTERVAL_ACTIVE
+    assert planner.next_wakeup(POLL_INTERVAL_ACTIVE - 1) == POLL_MIN_WAKEUP
+    assert planner.next_wakeup(-1000.0) == planner.tick
+
+
+def test_due_expedite_and_forget():
+    planner = scheduler()
+    planner.plan({"on": (AC, ON), "off": (AC, OFF)}, 0.0)
+    assert not planner.is_due("off", 100.0)
+    planner.expedite("off")
+    assert planner.is_due("off", 100.0)
+    planner.forget(["off"])
+    assert planner.is_due("on", 0.0)
+    assert "on" not in planner._intervals
+
+
+def test_exhausted_budget_stretches_every_read():
+    budget = CallBudget(10, clock=lambda: 0.0)
+    for _ in range(10):
+        budget.record("UserGetDeviceStatus")
+    # Scaled back to the configured interval first, then by the budget
+    assert delays({"on": (AC, ON)}, budget=budget) == {
+        "on": INTERVAL * BUDGET_MAX_STRETCH
+    }
+    planner = scheduler(budget=budget)
+    planner.plan({"on": (AC, ON)}, 0.0)
+    planner.account_polled(0.0)
+    assert planner.account_due(INTERVAL * BUDGET_MAX_STRETCH)
+    assert not planner.account_due(INTERVAL * BUDGET_MAX_STRETCH - 1)
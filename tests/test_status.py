@@ -0,0 +1,57 @@
+"""Tests of the compact device status records"""
+from custom_components.panasonic_smart_app.smartApp.status import (
+    CommandTypeIndex,
+    DeviceStatus,
+)
+
+
+def test_index_interns_each_command_type_once():
+    index = CommandTypeIndex(["0x00", "0x01"])
+    assert index.intern("0x01") == 1
+    assert index.intern("0x02") == 2
+    assert len(index) == 3
+    assert index.lookup("0x03") is None
+    assert index.key(2) == "0x02"
+
+
+def test_values_read_back_as_written():
+    status = DeviceStatus(CommandTypeIndex(["0x00", "0x01", "0x02", "0x03"]))
+    status.update({"0x00": "1", "0x01": 26, "0x02": "0A", "0x03": ""})
+    assert status["0x00"] == "1"
+    assert status["0x01"] == 26
+    assert status["0x02"] == "0A"
+    assert status["0x03"] == ""
+    assert dict(status) == {"0x00": "1", "0x01": 26, "0x02": "0A", "0x03": ""}
+
+
+def test_strings_that_do_not_round_trip_stay_raw():
+    status = DeviceStatus(CommandTypeIndex())
+    status.update({"0x00": "007", "0x01": "-3", "0x02": str(2**70), "0x03": True})
+    assert status["0x00"] == "007"
+    assert status["0x01"] == "-3"
+    assert status["0x02"] == str(2**70)
+    assert status["0x03"] is True
+
+
+def test_new_codes_grow_the_shared_index():
+    index = CommandTypeIndex(["0x00"])
+    first = DeviceStatus(index, {"0x00": "1"})
+    second = DeviceStatus(index)
+    second["0x7F"] = "5"
+    assert index.lookup("0x7F") == 1
+    assert "0x7F" not in first
+    assert first.get("0x7F") is None
+    first["0x7F"] = "6"
+    assert (first["0x7F"], second["0x7F"]) == ("6", "5")
+
+
+def test_clear_keeps_the_index():
+    index = CommandTypeIndex(["0x00", "0x01"])
+    status = DeviceStatus(index, {"0x00": "1", "0x01": "x"})
+    status.clear()
+    assert len(status) == 0
+    assert list(status) == []
+    assert "0x00" not in status
+    status["0x01"] = "2"
+    assert status.copy() == {"0x01": "2"}
+    assert len(index) == 2
@@ -0,0 +1,100 @@
+"""Tests of device reads booked around timer transitions"""
+import asyncio
+
+from custom_components.panasonic_smart_app.const import (
+    DEVICE_ACTIVE_CODES,
+    DEVICE_IDLE_CODES,
+    DEVICE_STATUS_CODES,
+    DEVICE_TIMER_CODES,
+    DEVICE_TYPE_AC,
+    DEVICE_TYPE_WASHING_MACHINE,
+)
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+from custom_components.panasonic_smart_app.smartApp.const import (
+    POLL_TRANSITION_MARGIN,
+)
+
+START = 1_700_000_000.0
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Client(SmartApp):
+    """SmartApp with one appliance whose status the test sets"""
+
+    def __init__(self, device_type: int, status: dict):
+        super().__init__(None, "account", "password")
+        clock = Clock()
+        self.set_clock(clock, clock)
+        self.device_type = device_type
+        self.status = status
+        self.read_at = []
+
+    async def get_devices(self):
+        self._devices = [
+            {
+                "Auth": "auth",
+                "GWID": "gw",
+                "DeviceType": str(self.device_type),
+                "ModelType": "M1",
+                "NickName": "device",
+            }
+        ]
+        return self._devices
+
+    async def get_report(self, name):
+        return {}
+
+    async def read_device_info(self, deviceId, gwid, model_type, options):
+        self.read_at.append(self.clock.now - START)
+        return {code: self.status.get(code, "0") for code in options}, []
+
+    def run(self, *seconds: float) -> list[float]:
+        """Refresh at each of the given seconds; when the device was read"""
+        for second in seconds:
+            self.clock.now = START + second
+            asyncio.run(
+                self.get_device_with_info(
+                    DEVICE_STATUS_CODES,
+                    DEVICE_ACTIVE_CODES,
+                    DEVICE_IDLE_CODES,
+                    DEVICE_TIMER_CODES,
+                )
+            )
+        return self.read_at
+
+
+def test_ac_is_read_right_after_its_on_timer_fires():
+    client = Client(DEVICE_TYPE_AC, {"0x00": "0", "0x0B": "2"})
+    fires = 2 * 60 + POLL_TRANSITION_MARGIN
+    # Idle, so it would otherwise wait for the slow tier
+    assert client.run(0, 60, 120, fires - 1, fires) == [0, fires]
+
+
+def test_earliest_timer_of_the_device_wins():
+    client = Client(DEVICE_TYPE_AC, {"0x00": "0", "0x0B": "30", "0x0C": "3"})
+    fires = 3 * 60 + POLL_TRANSITION_MARGIN
+    assert client.run(0, fires - 1, fires) == [0, fires]
+
+
+def test_running_washer_is_not_read_before_its_timer():
+    client = Client(DEVICE_TYPE_WASHING_MACHINE, {"0x50": "1", "0x13": "5"})
+    fires = 5 * 60 + POLL_TRANSITION_MARGIN
+    # Active, yet nothing else is expected to change until the wash ends
+    assert client.run(0, 60, 180, fires - 1, fires) == [0, fires]
+
+
+def test_cancelled_timer_falls_back_to_the_activity_pace():
+    client = Client(DEVICE_TYPE_AC, {"0x00": "0", "0x0B": "2"})
+    fires = 2 * 60 + POLL_TRANSITION_MARGIN
+    client.run(0)
+    client.status = {"0x00": "0", "0x0B": "0"}
+    client.run(fires)
+    # Idle with no timer left: no read at the next few wakeups
+    assert client.run(fires + 60, fires + 180) == [0, fires]
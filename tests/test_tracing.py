@@ -0,0 +1,125 @@
+"""Tests of poll cycle tracing"""
+import asyncio
+import json
+
+from custom_components.panasonic_smart_app.smartApp.tracing import Tracer, traced
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def tracer(cycles: int = 3) -> tuple[Tracer, Clock]:
+    clock = Clock()
+    tracer = Tracer(cycles, clock)
+    tracer.enabled = True
+    return tracer, clock
+
+
+def events(tracer: Tracer) -> dict[str, dict]:
+    return {event["name"]: event for event in tracer.export()["traceEvents"]}
+
+
+def test_nothing_is_recorded_while_disabled():
+    trace = Tracer()
+    trace.start_cycle()
+    with trace.span("poll"):
+        trace.record("http", 0.0, 1.0)
+    assert trace.export() == {"traceEvents": [], "displayTimeUnit": "ms"}
+
+
+def test_nested_spans_point_at_their_parent():
+    trace, clock = tracer()
+    trace.start_cycle()
+    with trace.span("poll", device="AC"):
+        clock.now += 0.5
+        with trace.span("request"):
+            clock.now += 0.25
+            trace.record("http", clock.now - 0.2, clock.now, status=200)
+
+    spans = events(trace)
+    assert spans["poll"]["args"]["parent_id"] is None
+    assert spans["request"]["args"]["parent_id"] == spans["poll"]["args"]["span_id"]
+    assert spans["http"]["args"]["parent_id"] == spans["request"]["args"]["span_id"]
+    assert spans["poll"]["args"]["device"] == "AC"
+    assert spans["http"]["args"]["status"] == 200
+    # Microseconds, as Chrome traces expect
+    assert spans["poll"]["ts"] == 10_000_000
+    assert spans["poll"]["dur"] == 750_000
+    assert spans["request"]["ts"] == 10_500_000
+    assert spans["poll"]["ph"] == "X"
+
+
+def test_gathered_tasks_keep_the_parent_on_their_own_lanes():
+    trace, _ = tracer()
+
+    async def read(name: str):
+        with trace.span(name):
+            await asyncio.sleep(0)
+
+    async def main():
+        trace.start_cycle()
+        with trace.span("cycle"):
+            await asyncio.gather(read("first"), read("second"))
+
+    asyncio.run(main())
+    spans = events(trace)
+    cycle_id = spans["cycle"]["args"]["span_id"]
+    assert spans["first"]["args"]["parent_id"] == cycle_id
+    assert spans["second"]["args"]["parent_id"] == cycle_id
+    lanes = {spans[name]["tid"] for name in ("cycle", "first", "second")}
+    assert len(lanes) == 3
+
+
+def test_only_the_last_cycles_are_kept():
+    trace, clock = tracer(cycles=3)
+    for cycle in range(5):
+        trace.start_cycle()
+        clock.now += 60
+        with trace.span(f"cycle {cycle}"):
+            pass
+
+    assert list(events(trace)) == ["cycle 2", "cycle 3", "cycle 4"]
+    assert [event["name"] for event in trace.export(2)["traceEvents"]] == [
+        "cycle 3",
+        "cycle 4",
+    ]
+    trace.clear()
+    assert trace.export()["traceEvents"] == []
+
+
+def test_events_are_sorted_by_start():
+    trace, _ = tracer()
+    trace.start_cycle()
+    trace.record("late", 2.0, 3.0)
+    trace.record("early", 1.0, 4.0)
+    assert [event["name"] for event in trace.export()["traceEvents"]] == [
+        "early",
+        "late",
+    ]
+    # Written as is by the dump_trace service
+    json.dumps(trace.export())
+
+
+def test_traced_method():
+    trace, clock = tracer()
+
+    class Client(object):
+        tracer = trace
+
+        @traced("refresh")
+        async def refresh(self, value):
+            clock.now += 1
+            return value
+
+    trace.start_cycle()
+    assert asyncio.run(Client().refresh(3)) == 3
+    assert events(trace)["refresh"]["dur"] == 1_000_000
+
+    trace.enabled = False
+    assert asyncio.run(Client().refresh(4)) == 4
+    assert len(trace.export()["traceEvents"]) == 1
@@ -0,0 +1,94 @@
+"""Tests of the status codes read for the enabled entities of a device"""
+import asyncio
+
+from custom_components.panasonic_smart_app.smartApp import SmartApp
+
+AUTH = "auth"
+DEVICE_TYPE = 1
+CODES = {DEVICE_TYPE: ["0x00", "0x01", "0x04"]}
+# Long enough for the device to be due again
+CYCLE = 1000
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Client(SmartApp):
+    """SmartApp with one device, recording the codes of each read"""
+
+    def __init__(self, clock: Clock):
+        super().__init__(None, "account", "password")
+        self.set_clock(clock, clock)
+        self.reads = []
+
+    async def get_devices(self):
+        self._devices = [
+            {
+                "Auth": AUTH,
+                "GWID": "gw",
+                "DeviceType": str(DEVICE_TYPE),
+                "ModelType": "CS-1",
+                "NickName": "device",
+            }
+        ]
+        return self._devices
+
+    async def get_report(self, name):
+        return {}
+
+    async def read_device_info(self, deviceId, gwid, model_type, options):
+        self.reads.append(list(options))
+        return {code: "1" for code in options}, []
+
+    def cycle(self) -> list:
+        self.clock.now += CYCLE
+        self.reads = []
+        asyncio.run(self.get_device_with_info(CODES))
+        return self.reads
+
+
+def test_every_code_before_entities_are_added():
+    client = Client(Clock())
+    assert client.cycle() == [CODES[DEVICE_TYPE]]
+
+
+def test_only_codes_of_enabled_entities():
+    client = Client(Clock())
+    client.want_status_codes(AUTH, "power", ["0x00"])
+    client.want_status_codes(AUTH, "mode", ["0x01"])
+    assert client.cycle() == [["0x00", "0x01"]]
+
+    # An entity reading every code
+    client.want_status_codes(AUTH, "all", None)
+    assert client.cycle() == [CODES[DEVICE_TYPE]]
+
+
+def test_codes_the_scheduler_needs_are_kept():
+    client = Client(Clock())
+    client.scheduler.active_codes = {DEVICE_TYPE: ["0x04"]}
+    client.want_status_codes(AUTH, "power", ["0x00"])
+    assert client.cycle() == [["0x00", "0x04"]]
+
+
+def test_disabled_then_reenabled_entities():
+    client = Client(Clock())
+    client.want_status_codes(AUTH, "power", ["0x00"])
+    client.want_status_codes(AUTH, "mode", ["0x01"])
+
+    client.drop_status_codes(AUTH, "mode")
+    assert client.cycle() == [["0x00"]]
+
+    # Every entity disabled: not read at all, rather than every code
+    client.drop_status_codes(AUTH, "power")
+    assert client.cycle() == []
+
+    client.scheduler.active_codes = {DEVICE_TYPE: ["0x04"]}
+    assert client.cycle() == [["0x04"]]
+
+    client.want_status_codes(AUTH, "mode", ["0x01"])
+    assert client.cycle() == [["0x01", "0x04"]]
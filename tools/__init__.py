@@ -0,0 +1 @@
+""" Development tools for the Panasonic Smart App integration """
@@ -0,0 +1,241 @@
+""" Microbenchmarks of entity properties and state writes
+
+    python -m tools.bench_entities --json entities.json
+    python -m tools.bench_entities --compare entities.json
+
+Entities are created by async_setup_entry of every platform, on devices read
+from the mock cloud by one poll cycle, so their CommandList and statuses are
+those the integration sees. For each entity class this times every property
+the integration defines, and the state write a coordinator update triggers:
+Home Assistant reading the state and attributes, then the state machine
+update. Times are nanoseconds per call, the best of --repeat runs for each entity,
+averaged over the entities of a class.
+"""
+import argparse
+import importlib
+import json
+import logging
+import platform
+import sys
+from types import SimpleNamespace
+import timeit
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+import custom_components.panasonic_smart_app.smartApp as smart_app
+from custom_components.panasonic_smart_app.const import (
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DEVICE_ACTIVE_CODES,
+    DEVICE_IDLE_CODES,
+    DEVICE_STATUS_CODES,
+    DEVICE_TIMER_CODES,
+    DOMAIN,
+    PLATFORMS,
+)
+
+from .bench_poll import DEFAULT_THRESHOLD
+from .mock_cloud import MockCloud, build_appliances
+from .mock_cloud.appliances import DEVICE_TYPES
+from .virtual_clock import LocalSession, VirtualClock, run
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE = "custom_components.panasonic_smart_app"
+ENTRY_ID = "bench"
+STATE_WRITE = "state_write"
+# Differences below this many nanoseconds are noise, whatever the ratio
+NOISE_FLOOR_NS = 200
+
+
+async def load_devices(count: int, seed: int):
+    """Client and coordinator data after one poll cycle of the mock cloud"""
+    clock = VirtualClock()
+    cloud = MockCloud(
+        build_appliances(count, seed),
+        seed=seed,
+        clock=clock.monotonic,
+        wall_clock=clock.time,
+    )
+    client = smart_app.SmartApp(LocalSession(cloud), "bench", "bench")
+    client.set_clock(clock.monotonic, clock.time)
+    await client.login()
+    devices = await client.get_device_with_info(
+        DEVICE_STATUS_CODES,
+        DEVICE_ACTIVE_CODES,
+        DEVICE_IDLE_CODES,
+        DEVICE_TIMER_CODES,
+    )
+    return client, devices
+
+
+async def create_entities(hass: HomeAssistant, client, devices) -> list:
+    """Every entity the platforms set up, ready to write its state"""
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name=ENTRY_ID)
+    coordinator.data = devices
+    hass.data[DOMAIN] = {ENTRY_ID: {DATA_CLIENT: client, DATA_COORDINATOR: coordinator}}
+    entry = SimpleNamespace(entry_id=ENTRY_ID, options={})
+
+    entities = []
+    for name in PLATFORMS:
+        module = importlib.import_module(f"{PACKAGE}.{name}")
+        created = []
+        await module.async_setup_entry(
+            hass, entry, lambda new_entities, update_before_add=False: created.extend(new_entities)
+        )
+        for entity in created:
+            entity.hass = hass
+            entity.entity_id = f"{name}.{ENTRY_ID}_{len(entities)}"
+            entities.append(entity)
+    return entities
+
+
+def integration_properties(entity_class) -> list[str]:
+    """Properties the integration defines on an entity class or its bases"""
+    names = set()
+    for cls in entity_class.__mro__:
+        if cls.__module__.startswith(PACKAGE):
+            names.update(
+                name for name, value in vars(cls).items() if isinstance(value, property)
+            )
+    return sorted(names)
+
+
+def time_call(func, number: int, repeat: int) -> float:
+    """Nanoseconds per call, the best of repeat runs of number calls.
+
+    The untimed first call also writes the initial state of an entity, so
+    timed state writes compare against an existing state.
+    """
+    func()
+    return min(timeit.Timer(func).repeat(repeat, number)) / number * 1e9
+
+
+def benchmark(entities: list, number: int, repeat: int) -> list[dict]:
+    by_class: dict[type, list] = {}
+    for entity in entities:
+        by_class.setdefault(type(entity), []).append(entity)
+
+    results = []
+    for entity_class, instances in sorted(by_class.items(), key=lambda item: item[0].__name__):
+        measures = {
+            name: [
+                lambda entity=entity, name=name: getattr(entity, name)
+                for entity in instances
+            ]
+            for name in integration_properties(entity_class)
+        }
+        # What a coordinator update runs for each entity
+        measures[STATE_WRITE] = [entity._handle_coordinator_update for entity in instances]
+
+        for measure, calls in measures.items():
+            timings = []
+            for call in calls:
+                try:
+                    timings.append(time_call(call, number, repeat))
+                except Exception as exception:
+                    _LOGGER.warning(
+                        "%s.%s failed: %r", entity_class.__name__, measure, exception
+                    )
+            if not timings:
+                continue
+            results.append(
+                {
+                    "entity": entity_class.__name__,
+                    "measure": measure,
+                    "entities": len(timings),
+                    "ns": round(sum(timings) / len(timings), 1),
+                }
+            )
+
+    writes = [result for result in results if result["measure"] == STATE_WRITE]
+    results.append(
+        {
+            "entity": "all",
+            "measure": "coordinator_update",
+            "entities": sum(result["entities"] for result in writes),
+            "ns": round(sum(result["ns"] * result["entities"] for result in writes), 1),
+        }
+    )
+    return results
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Measures slower than the baseline by more than threshold"""
+    previous = {
+        (result["entity"], result["measure"]): result for result in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        before = previous.get((result["entity"], result["measure"]))
+        if before is None:
+            continue
+        delta = result["ns"] - before["ns"]
+        if delta >= NOISE_FLOOR_NS and delta > before["ns"] * threshold:
+            regressions.append(
+                f"{result['entity']}.{result['measure']}: {before['ns']} -> {result['ns']} ns"
+            )
+    return regressions
+
+
+def print_table(results: list[dict]) -> None:
+    print(f"{'entity':<54} {'measure':<28} {'count':>5} {'ns/call':>11}")
+    for result in results:
+        print(
+            f"{result['entity']:<54} {result['measure']:<28} "
+            f"{result['entities']:>5} {result['ns']:>11.1f}"
+        )
+
+
+async def run_benchmarks(args) -> list[dict]:
+    client, devices = await load_devices(args.devices, args.seed)
+    hass = HomeAssistant(args.config_dir)
+    entities = await create_entities(hass, client, devices)
+    return benchmark(entities, args.number, args.repeat)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--devices", type=int, default=len(DEVICE_TYPES), help="one of each type by default"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--number", type=int, default=1000, help="calls per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs, the best is kept")
+    parser.add_argument("--config-dir", default=".", help="config directory of the bare hass")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    # Entities without a platform warn once on their first write
+    logging.getLogger("homeassistant").setLevel(logging.ERROR)
+    results = run(run_benchmarks(args))
+    print_table(results)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "devices": args.devices,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
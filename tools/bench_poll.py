@@ -0,0 +1,223 @@
+""" Poll-cycle benchmarks of SmartApp against the mock cloud
+
+    python -m tools.bench_poll --devices 1 10 100 500 --json poll.json
+    python -m tools.bench_poll --compare poll.json
+
+Every scenario runs against a fresh mock cloud and times three kinds of
+cycles, the same way the coordinator drives them:
+  cold  first cycle of a logged in client: device list, reports and every device
+  full  every device due, as after a burst of commands
+  idle  nothing due, the cost of waking up for nothing
+Wall time, API calls and CPU time are averaged over --cycles cycles; peak
+memory is traced in one extra cycle, so tracing does not skew the timings.
+The mock cloud runs in the same process, so CPU time includes its share.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+
+import custom_components.panasonic_smart_app.smartApp as smart_app
+from custom_components.panasonic_smart_app.smartApp import const as smart_app_const
+from custom_components.panasonic_smart_app.smartApp.session import create_session
+from custom_components.panasonic_smart_app.const import (
+    DEVICE_ACTIVE_CODES,
+    DEVICE_IDLE_CODES,
+    DEVICE_STATUS_CODES,
+    DEVICE_TIMER_CODES,
+)
+
+from .mock_cloud import MockCloud, build_appliances
+
+PHASES = ("cold", "full", "idle")
+# Relative slowdown of a metric reported as a regression by --compare
+DEFAULT_THRESHOLD = 0.25
+# Differences below this many milliseconds are noise, whatever the ratio
+NOISE_FLOOR_MS = 1.0
+COMPARED_METRICS = ("wall_ms", "cpu_ms", "api_calls")
+
+
+def status_code_mapping(width: int) -> dict:
+    """Status tables of the integration, cut to width codes per device type"""
+    if not width:
+        return DEVICE_STATUS_CODES
+    return {
+        device_type: codes[:width] for device_type, codes in DEVICE_STATUS_CODES.items()
+    }
+
+
+async def run_cycle(client: smart_app.SmartApp, mapping: dict) -> None:
+    """One coordinator update, as async_update_data runs it"""
+    await client.get_device_with_info(
+        mapping,
+        DEVICE_ACTIVE_CODES,
+        DEVICE_IDLE_CODES,
+        DEVICE_TIMER_CODES,
+    )
+    client.scheduler.next_wakeup(client.scheduler.now())
+
+
+async def prepare(client: smart_app.SmartApp, session, phase: str):
+    """Client whose next cycle is of the given phase"""
+    if phase == "cold":
+        client = smart_app.SmartApp(session, "bench", "bench")
+        await client.login()
+    elif phase == "full":
+        for device in client._devices:
+            client.scheduler.expedite(device["Auth"])
+    return client
+
+
+async def measure(client, cloud, mapping: dict) -> dict:
+    calls = sum(cloud.calls.values())
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    await run_cycle(client, mapping)
+    return {
+        "wall_ms": (time.perf_counter() - wall) * 1000,
+        "cpu_ms": (time.process_time() - cpu) * 1000,
+        "api_calls": sum(cloud.calls.values()) - calls,
+    }
+
+
+async def run_scenario(devices: int, width: int, cycles: int, seed: int, latency: float):
+    cloud = MockCloud(build_appliances(devices, seed), seed=seed, latency=latency)
+    smart_app_const.BASE_URL = await cloud.start()
+    session = create_session()
+    mapping = status_code_mapping(width)
+    client = None
+    results = []
+    try:
+        for phase in PHASES:
+            runs = []
+            for _ in range(cycles):
+                client = await prepare(client, session, phase)
+                runs.append(await measure(client, cloud, mapping))
+
+            client = await prepare(client, session, phase)
+            tracemalloc.start()
+            await run_cycle(client, mapping)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            results.append(
+                {
+                    "devices": devices,
+                    "width": width,
+                    "phase": phase,
+                    "cycles": len(runs),
+                    **{
+                        metric: round(sum(run[metric] for run in runs) / len(runs), 3)
+                        for metric in COMPARED_METRICS
+                    },
+                    "peak_kib": round(peak / 1024, 1),
+                }
+            )
+    finally:
+        await session.close()
+        await cloud.stop()
+    return results
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Metrics slower than the baseline by more than threshold"""
+    previous = {
+        (result["devices"], result["width"], result["phase"]): result
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        before = previous.get((result["devices"], result["width"], result["phase"]))
+        if before is None:
+            continue
+        for metric in COMPARED_METRICS:
+            delta = result[metric] - before[metric]
+            if metric.endswith("_ms") and delta < NOISE_FLOOR_MS:
+                continue
+            if delta > before[metric] * threshold:
+                regressions.append(
+                    f"{result['devices']} devices, width {result['width'] or 'all'}, "
+                    f"{result['phase']}: {metric} {before[metric]} -> {result[metric]}"
+                )
+    return regressions
+
+
+def print_table(results: list[dict]) -> None:
+    print(
+        f"{'devices':>7} {'width':>5} {'phase':>5} {'wall ms':>9} "
+        f"{'cpu ms':>9} {'calls':>6} {'peak KiB':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['devices']:>7} {result['width'] or 'all':>5} {result['phase']:>5} "
+            f"{result['wall_ms']:>9.1f} {result['cpu_ms']:>9.1f} "
+            f"{result['api_calls']:>6g} {result['peak_kib']:>9.1f}"
+        )
+
+
+async def run(args) -> list[dict]:
+    # Warm up imports and caches so the first scenario is not penalized
+    await run_scenario(1, 0, 1, args.seed, 0.0)
+    results = []
+    for devices in args.devices:
+        for width in args.widths:
+            results.extend(
+                await run_scenario(devices, width, args.cycles, args.seed, args.latency)
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 50, 100, 500])
+    parser.add_argument(
+        "--widths", type=int, nargs="+", default=[0, 4], help="status codes per type, 0 for all"
+    )
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="mock cloud seconds per response")
+    parser.add_argument(
+        "--request-spacing",
+        type=float,
+        default=0.0,
+        help="SECONDS_BETWEEN_REQUEST of the client, 2 in production",
+    )
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    smart_app.SECONDS_BETWEEN_REQUEST = args.request_spacing
+    results = asyncio.run(run(args))
+    print_table(results)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "request_spacing": args.request_spacing,
+        "latency": args.latency,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+""" Local stand-in for the Panasonic Smart App cloud
+
+Start it with `python -m tools.mock_cloud` from the repository root and
+point the client at it with PANASONIC_SMART_APP_BASE_URL.
+"""
+from .appliances import Appliance, build_appliances, command_list
+from .faults import PROFILES, Fault, FaultInjector
+from .server import MockCloud
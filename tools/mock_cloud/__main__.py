@@ -0,0 +1,47 @@
+import argparse
+import asyncio
+
+from .appliances import build_appliances
+from .faults import PROFILES, FaultInjector
+from .server import MockCloud, TOKEN_LIFETIME
+
+
+async def serve(args) -> None:
+    middlewares = []
+    if args.faults:
+        middlewares.append(FaultInjector.from_profile(args.faults, args.seed).middleware)
+    cloud = MockCloud(
+        build_appliances(args.devices, args.seed),
+        seed=args.seed,
+        latency=args.latency,
+        token_lifetime=args.token_lifetime,
+        middlewares=middlewares,
+    )
+    base_url = await cloud.start(args.host, args.port)
+    print(f"Mock Panasonic cloud with {args.devices} appliances on {base_url}")
+    if args.faults:
+        print(f"Injecting faults of the {args.faults} profile, seed {args.seed}")
+    print(f"export PANASONIC_SMART_APP_BASE_URL={base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await cloud.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--devices", type=int, default=7, help="appliances per account")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--token-lifetime", type=float, default=TOKEN_LIFETIME)
+    parser.add_argument("--faults", choices=sorted(PROFILES), help="fault profile")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+""" Simulated Panasonic appliances and their CommandList entries """
+from dataclasses import dataclass, field
+import random
+
+# DEVICE_TYPE_* of the integration, repeated so the mock needs no Home Assistant
+AC = 1
+REFRIGERATOR = 2
+WASHING_MACHINE = 3
+DEHUMIDIFIER = 4
+PURIFIER = 8
+ERV = 14
+SWITCH = 17
+
+DEVICE_TYPES = (AC, REFRIGERATOR, WASHING_MACHINE, DEHUMIDIFIER, PURIFIER, ERV, SWITCH)
+
+ON_OFF = [["關", 0], ["開", 1]]
+
+# CommandType: (CommandName, Parameters, initial status) of each device type
+COMMANDS = {
+    AC: {
+        "0x00": ("電源", ON_OFF, "1"),
+        "0x01": ("運轉模式", [["冷氣", 0], ["除濕", 1], ["送風", 2], ["自動", 3], ["暖氣", 4]], "0"),
+        "0x02": ("風量設定", [["自動", 0], ["20%", 1], ["40%", 2], ["60%", 3], ["80%", 4], ["100%", 5]], "0"),
+        "0x03": ("溫度設定", [["Min", 16], ["Max", 30]], "26"),
+        "0x04": ("室內溫度", [], "28"),
+        "0x05": ("睡眠模式", ON_OFF, "0"),
+        "0x08": ("nanoeX", ON_OFF, "1"),
+        "0x0B": ("開機時間", [["Min", 0], ["Max", 1440]], "0"),
+        "0x0C": ("關機時間", [["Min", 0], ["Max", 1440]], "0"),
+        "0x0F": ("風向設定", [["自動", 0], ["0°", 1], ["20°", 2], ["45°", 3], ["70°", 4], ["90°", 5]], "0"),
+        "0x11": ("左右風向", [["自動", 0], ["左", 1], ["中", 2], ["右", 3]], "0"),
+        "0x17": ("防霉", ON_OFF, "0"),
+        "0x18": ("自體淨", ON_OFF, "0"),
+        "0x19": ("動向感測", [["關", 0], ["自動", 1], ["避人", 2], ["對人", 3]], "0"),
+        "0x1A": ("急速", ON_OFF, "0"),
+        "0x1B": ("ECONAVI", ON_OFF, "0"),
+        "0x1E": ("操作提示音", ON_OFF, "1"),
+        "0x1F": ("指示燈", [["亮", 0], ["暗", 1], ["關", 2]], "0"),
+        "0x21": ("室外溫度", [], "31"),
+        "0x37": ("PM2.5", [], "12"),
+    },
+    REFRIGERATOR: {
+        "0x00": ("冷凍室溫度設定", [["強", 0], ["中", 1], ["弱", 2]], "1"),
+        "0x01": ("冷藏室溫度設定", [["強", 0], ["中", 1], ["弱", 2]], "1"),
+        "0x03": ("冷凍室溫度", [], "-18"),
+        "0x05": ("冷藏室溫度", [], "3"),
+        "0x0C": ("ECO", ON_OFF, "1"),
+        "0x50": ("除霜", ON_OFF, "0"),
+        "0x52": ("停止製冰", ON_OFF, "0"),
+        "0x53": ("快速製冰", ON_OFF, "0"),
+        "0x56": ("急速冷凍", ON_OFF, "0"),
+        "0x57": ("微凍室溫度設定", [["強", 0], ["中", 1], ["弱", 2]], "1"),
+        "0x58": ("微凍室溫度", [], "-3"),
+        "0x5A": ("冬季模式", ON_OFF, "0"),
+        "0x5B": ("購物模式", ON_OFF, "0"),
+        "0x5C": ("假期模式", ON_OFF, "0"),
+        "0x61": ("nanoe", ON_OFF, "1"),
+    },
+    WASHING_MACHINE: {
+        "0x13": ("剩餘洗衣時間", [], "35"),
+        "0x14": ("預約時間", [], "0"),
+        "0x15": ("預約剩餘時間", [], "0"),
+        "0x41": ("預約時間", [], "0"),
+        "0x50": ("洗衣機狀態", [["待機", 0], ["洗衣中", 1], ["暫停", 2], ["完成", 3]], "1"),
+        "0x54": ("目前模式", [["標準", 0], ["快洗", 1], ["毛毯", 2], ["浸泡", 3]], "0"),
+        "0x55": ("目前行程", [["洗衣", 1], ["清洗", 2], ["脫水", 3], ["烘乾", 4]], "1"),
+        "0x61": ("烘乾延遲", [], "0"),
+        "0x64": ("行程", [["洗衣", 1], ["清洗", 2], ["脫水", 3]], "1"),
+    },
+    DEHUMIDIFIER: {
+        "0x00": ("電源", ON_OFF, "1"),
+        "0x01": ("運轉模式", [["連續除濕", 0], ["自動除濕", 1], ["防霉", 2], ["送風", 3], ["目標濕度", 4]], "1"),
+        "0x02": ("關機時間", [["Min", 0], ["Max", 12]], "0"),
+        "0x04": ("目標濕度", [["40%", 0], ["45%", 1], ["50%", 2], ["55%", 3], ["60%", 4], ["65%", 5], ["70%", 6]], "2"),
+        "0x07": ("室內濕度", [], "58"),
+        "0x09": ("風向", [["固定", 0], ["擺動", 1]], "0"),
+        "0x0A": ("水箱", [["正常", 0], ["滿水", 1]], "0"),
+        "0x0D": ("nanoe", ON_OFF, "1"),
+        "0x0E": ("風量", [["自動", 0], ["強", 1], ["弱", 2]], "0"),
+        "0x18": ("操作提示音", ON_OFF, "1"),
+        "0x50": ("濾網", [], "0"),
+        "0x53": ("PM2.5", [], "9"),
+        "0x55": ("開機時間", [["Min", 0], ["Max", 12]], "0"),
+        "0x56": ("PM1.0", [], "6"),
+    },
+    PURIFIER: {
+        "0x00": ("電源", ON_OFF, "1"),
+        "0x01": ("風量", [["自動", 0], ["弱", 1], ["中", 2], ["強", 3]], "0"),
+        "0x07": ("nanoeX", ON_OFF, "1"),
+        "0x50": ("PM2.5", [], "8"),
+    },
+    ERV: {
+        "0x00": ("電源", ON_OFF, "1"),
+        "0x15": ("運轉模式", [["自動", 0], ["全熱交換", 1], ["普通換氣", 2]], "0"),
+        "0x56": ("風量", [["自動", 0], ["弱", 1], ["強", 2]], "0"),
+    },
+    SWITCH: {
+        "0x70": ("電源", [], "7"),
+    },
+}
+
+MODEL_TYPES = {
+    AC: "CS-MOCK-AC",
+    REFRIGERATOR: "NR-MOCK-REF",
+    WASHING_MACHINE: "NA-MOCK-WM",
+    DEHUMIDIFIER: "F-MOCK-DH",
+    PURIFIER: "F-MOCK-PX",
+    ERV: "FY-MOCK-ERV",
+    SWITCH: "WTY-MOCK-SW",
+}
+
+SWITCH_CIRCUITS = 3
+# Bitmask commands keep their status in hexadecimal
+HEX_STATUS_CODES = {"0x70"}
+
+
+def command_list(device_types=DEVICE_TYPES) -> list[dict]:
+    """CommandList entries of UserGetRegisteredGwList2"""
+    return [
+        {
+            "ModelType": MODEL_TYPES[device_type],
+            "JSON": [
+                {
+                    "list": [
+                        {
+                            "CommandType": code,
+                            "CommandName": name,
+                            "Parameters": parameters,
+                        }
+                        for code, (name, parameters, _) in COMMANDS[device_type].items()
+                    ]
+                }
+            ],
+        }
+        for device_type in device_types
+    ]
+
+
+@dataclass
+class Appliance(object):
+    """A device of the mock cloud, with the status it reports"""
+
+    device_type: int
+    gwid: str
+    auth: str
+    nickname: str
+    online: bool = True
+    status: dict[str, str] = field(default_factory=dict)
+    # Status of each sub-device behind a gateway, by DeviceID
+    sub_status: dict[int, dict[str, str]] = field(default_factory=dict)
+    energy: float = 0.0
+
+    @property
+    def model_type(self) -> str:
+        return MODEL_TYPES[self.device_type]
+
+    def gateway_entry(self) -> dict:
+        entry = {
+            "GWID": self.gwid,
+            "Auth": self.auth,
+            "DeviceType": str(self.device_type),
+            "ModelType": self.model_type,
+            "Model": self.model_type,
+            "NickName": self.nickname,
+        }
+        if self.sub_status:
+            entry["Devices"] = [
+                {"DeviceID": device_id, "Name": f"迴路 {device_id}"}
+                for device_id in self.sub_status
+            ]
+        return entry
+
+    def read(self, device_id: int, code: str) -> str:
+        """Status of a code, empty when the device does not support it"""
+        if device_id != 1:
+            return self.sub_status.get(device_id, {}).get(code, "")
+        return self.status.get(code, "")
+
+    def write(self, code: str, value: int) -> None:
+        if code in HEX_STATUS_CODES:
+            self.status[code] = format(value, "x")
+            for device_id, status in self.sub_status.items():
+                status["0x00"] = "1" if value & (1 << (device_id - 1)) else "0"
+        else:
+            self.status[code] = str(value)
+
+    def tick(self, elapsed: float) -> None:
+        """Let the appliance run for the given seconds"""
+        if self.device_type == WASHING_MACHINE and self.status.get("0x50") == "1":
+            remaining = max(int(self.status["0x13"]) - int(elapsed // 60), 0)
+            self.status["0x13"] = str(remaining)
+            if remaining == 0:
+                self.status["0x50"] = "3"
+        if self.device_type == AC and self.status.get("0x00") == "1":
+            current = float(self.status["0x04"])
+            target = float(self.status["0x03"])
+            step = min(abs(target - current), elapsed / 600)
+            current += step if target > current else -step
+            self.status["0x04"] = str(round(current))
+            self.energy += 0.3 * elapsed / 3600
+
+
+def build_appliances(count: int, seed: int = 0, device_types=DEVICE_TYPES) -> list[Appliance]:
+    """Synthetic account of count appliances spread over the device types"""
+    rng = random.Random(seed)
+    appliances = []
+    for number in range(count):
+        device_type = device_types[number % len(device_types)]
+        status = {
+            code: initial for code, (_, _, initial) in COMMANDS[device_type].items()
+        }
+        # Vary a few readings so devices do not all look alike
+        for code in ("0x04", "0x07", "0x50", "0x53", "0x37"):
+            if code in status and not COMMANDS[device_type][code][1]:
+                status[code] = str(int(status[code]) + rng.randint(-3, 3))
+        appliance = Appliance(
+            device_type=device_type,
+            gwid=f"MOCKGW{number:05d}",
+            auth=f"MOCKAUTH{number:05d}",
+            nickname=f"{MODEL_TYPES[device_type].split('-')[-1]} {number}",
+            status=status,
+            energy=round(rng.uniform(5, 80), 1),
+        )
+        if device_type == SWITCH:
+            appliance.sub_status = {
+                device_id: {"0x00": "1"} for device_id in range(1, SWITCH_CIRCUITS + 1)
+            }
+        appliances.append(appliance)
+    return appliances
@@ -0,0 +1,172 @@
+""" Seeded fault injection for the mock cloud """
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import json
+import random
+
+from aiohttp import web
+
+from custom_components.panasonic_smart_app.smartApp.const import (
+    EXCEPTION_CPTOKEN_EXPIRED,
+    EXCEPTION_DEVICE_JP_INFO,
+    EXCEPTION_DEVICE_NOT_RESPONDING,
+    EXCEPTION_INVALID_REFRESH_TOKEN,
+    EXCEPTION_REACH_RATE_LIMIT,
+)
+
+RATE_LIMIT = "rate_limit"
+DEVICE_NO_RESPONSE = "device_no_response"
+DEVICE_JP_INFO = "device_jp_info"
+EXPIRED_TOKEN = "expired_token"
+INVALID_REFRESH_TOKEN = "invalid_refresh_token"
+EMPTY_OVERVIEW = "empty_overview"
+SLOW = "slow"
+CONNECTION_RESET = "connection_reset"
+
+FAULT_KINDS = (
+    RATE_LIMIT,
+    DEVICE_NO_RESPONSE,
+    DEVICE_JP_INFO,
+    EXPIRED_TOKEN,
+    INVALID_REFRESH_TOKEN,
+    EMPTY_OVERVIEW,
+    SLOW,
+    CONNECTION_RESET,
+)
+
+AUTH_ENDPOINTS = ("userlogin1", "RefreshToken1")
+
+
+@dataclass(frozen=True)
+class Fault(object):
+    """A misbehaviour applied to matching requests.
+
+    A request matches when its endpoint is listed (or no endpoint is), at
+    least `after` matching requests came before it and fewer than `count`
+    were hit already. It is then hit with the given probability.
+    """
+
+    kind: str
+    endpoints: tuple[str, ...] = ()
+    probability: float = 1.0
+    after: int = 0
+    count: int | None = None
+    # Seconds added to the response of SLOW faults
+    delay: float = 0.0
+
+    def matches(self, endpoint: str) -> bool:
+        if self.endpoints:
+            return endpoint in self.endpoints
+        return endpoint not in AUTH_ENDPOINTS
+
+
+PROFILES: dict[str, tuple[Fault, ...]] = {
+    # Every request is refused for a while after the first 20
+    "rate_limit_storm": (Fault(RATE_LIMIT, after=20, count=60),),
+    "flaky_devices": (
+        Fault(DEVICE_NO_RESPONSE, ("DeviceGetInfo",), probability=0.2),
+        Fault(DEVICE_NO_RESPONSE, ("DeviceSetCommand",), probability=0.1),
+    ),
+    "jp_failures": (Fault(DEVICE_JP_INFO, ("DeviceGetInfo",), probability=0.3),),
+    "token_churn": (
+        Fault(EXPIRED_TOKEN, probability=0.05),
+        Fault(INVALID_REFRESH_TOKEN, ("RefreshToken1",), probability=0.5),
+    ),
+    "empty_overview": (Fault(EMPTY_OVERVIEW, ("UserGetDeviceStatus",), probability=0.5),),
+    "slow_cloud": (Fault(SLOW, probability=0.3, delay=3.0),),
+    "connection_resets": (Fault(CONNECTION_RESET, probability=0.05),),
+    "chaos": (
+        Fault(SLOW, probability=0.2, delay=1.0),
+        Fault(DEVICE_NO_RESPONSE, ("DeviceGetInfo",), probability=0.1),
+        Fault(DEVICE_JP_INFO, ("DeviceGetInfo",), probability=0.05),
+        Fault(EXPIRED_TOKEN, probability=0.02),
+        Fault(EMPTY_OVERVIEW, ("UserGetDeviceStatus",), probability=0.3),
+        Fault(CONNECTION_RESET, probability=0.02),
+        Fault(RATE_LIMIT, after=200, count=20),
+    ),
+}
+
+
+class FaultInjector(object):
+    """aiohttp middleware applying faults, reproducibly for a given seed.
+
+    Whether a request is hit depends only on the seed, the fault and how
+    many requests to its endpoint came before, so a scenario replays the
+    same way even when concurrent requests arrive in another order.
+    """
+
+    def __init__(self, faults, seed: int = 0):
+        self.faults = tuple(faults)
+        self.seed = seed
+        self._seen: Counter[int] = Counter()
+        self._hits: Counter[int] = Counter()
+        self._endpoint_calls: Counter[str] = Counter()
+        # (endpoint, request number of that endpoint, fault kind) of every hit
+        self.injected: list[tuple[str, int, str]] = []
+
+    @classmethod
+    def from_profile(cls, name: str, seed: int = 0) -> "FaultInjector":
+        return cls(PROFILES[name], seed)
+
+    def _hit(self, index: int, fault: Fault, endpoint: str, number: int) -> bool:
+        if not fault.matches(endpoint):
+            return False
+        seen = self._seen[index]
+        self._seen[index] += 1
+        if seen < fault.after:
+            return False
+        if fault.count is not None and self._hits[index] >= fault.count:
+            return False
+        if fault.probability < 1.0:
+            draw = random.Random(f"{self.seed}/{index}/{endpoint}/{number}").random()
+            if draw >= fault.probability:
+                return False
+        self._hits[index] += 1
+        self.injected.append((endpoint, number, fault.kind))
+        return True
+
+    @staticmethod
+    def _state_msg(message: str, status: int = 417) -> web.Response:
+        return web.json_response({"StateMsg": message}, status=status)
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler):
+        endpoint = request.path.rsplit("/", 1)[-1]
+        number = self._endpoint_calls[endpoint]
+        self._endpoint_calls[endpoint] += 1
+
+        empty_overview = False
+        for index, fault in enumerate(self.faults):
+            if not self._hit(index, fault, endpoint, number):
+                continue
+            if fault.kind == RATE_LIMIT:
+                return self._state_msg(EXCEPTION_REACH_RATE_LIMIT, 429)
+            if fault.kind == DEVICE_NO_RESPONSE:
+                return self._state_msg(EXCEPTION_DEVICE_NOT_RESPONDING)
+            if fault.kind == DEVICE_JP_INFO:
+                return self._state_msg(EXCEPTION_DEVICE_JP_INFO)
+            if fault.kind == EXPIRED_TOKEN:
+                return self._state_msg(EXCEPTION_CPTOKEN_EXPIRED)
+            if fault.kind == INVALID_REFRESH_TOKEN:
+                return self._state_msg(EXCEPTION_INVALID_REFRESH_TOKEN)
+            if fault.kind == CONNECTION_RESET:
+                request.transport.close()
+                raise ConnectionResetError
+            if fault.kind == SLOW:
+                await asyncio.sleep(fault.delay)
+            elif fault.kind == EMPTY_OVERVIEW:
+                empty_overview = True
+
+        response = await handler(request)
+        if empty_overview and response.status == 200:
+            # Devices that lost contact with the cloud report empty statuses
+            overview = json.loads(response.body)
+            for gateway in overview.get("GwList", []):
+                for info in gateway.get("List", []):
+                    info["Status"] = ""
+            response = web.json_response(overview)
+        return response
+
+    def summary(self) -> dict[str, int]:
+        return dict(Counter(kind for _, _, kind in self.injected))
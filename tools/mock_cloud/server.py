@@ -0,0 +1,270 @@
+""" aiohttp stand-in for the Panasonic Smart App cloud """
+import asyncio
+from collections import Counter
+import copy
+from datetime import date, datetime, timedelta
+import json
+import random
+import time
+import uuid
+
+from aiohttp import web
+
+from custom_components.panasonic_smart_app.smartApp.const import (
+    EXCEPTION_CPTOKEN_EXPIRED,
+    EXCEPTION_DEVICE_OFFLINE,
+    EXCEPTION_INVALID_REFRESH_TOKEN,
+    EXCEPTION_TOKEN_EXPIRED,
+    REPORT_CO2,
+    REPORT_OTHER,
+    REPORT_POWER,
+    REPORT_TOTAL_CO2,
+    REPORT_TOTAL_ENERGY,
+    REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR,
+)
+
+from .appliances import REFRIGERATOR, Appliance, command_list
+
+# Seconds a CPToken stays valid, as observed on the real cloud
+TOKEN_LIFETIME = 3600
+EXCEPTION_LOGIN_FAILED = "帳號或密碼錯誤"
+CO2_PER_KWH = 0.502
+
+
+class Account(object):
+    def __init__(self, password: str | None, appliances: list[Appliance]):
+        self.password = password
+        self.appliances = appliances
+        self.by_auth = {appliance.auth: appliance for appliance in appliances}
+        self.ticked_at: float | None = None
+
+
+class MockCloud(object):
+    """Serves the endpoints SmartApp uses, backed by simulated appliances.
+
+    Logins with an unknown MemId get a copy of the default appliances, so
+    any credentials work unless accounts are added with add_account. The
+    clock is injectable; appliances run for the time elapsed between two
+    requests of their account, and reports end on the day of wall_clock.
+    Extra aiohttp middlewares, such as fault injection, run before the
+    handlers.
+    """
+
+    def __init__(
+        self,
+        appliances: list[Appliance] | None = None,
+        *,
+        seed: int = 0,
+        latency: float = 0.0,
+        token_lifetime: float = TOKEN_LIFETIME,
+        clock=time.monotonic,
+        wall_clock=time.time,
+        middlewares=(),
+    ):
+        self.seed = seed
+        self.latency = latency
+        self.token_lifetime = token_lifetime
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self._default_appliances = appliances
+        self.accounts: dict[str, Account] = {}
+        self._cp_tokens: dict[str, tuple[str, float]] = {}
+        self._refresh_tokens: dict[str, str] = {}
+        # Requests served per endpoint
+        self.calls: Counter[str] = Counter()
+        self.app = web.Application(middlewares=[self._middleware, *middlewares])
+        self.app.add_routes(
+            [
+                web.post("/api/userlogin1", self.login),
+                web.post("/api/RefreshToken1", self.refresh_token),
+                web.get("/api/UserGetRegisteredGwList2", self.get_devices),
+                web.post("/api/DeviceGetInfo", self.get_device_info),
+                web.get("/api/UserGetDeviceStatus", self.get_device_overview),
+                web.post("/api/UserGetInfo", self.get_info),
+                web.get("/api/DeviceSetCommand", self.set_command),
+                web.get("/api", self.root),
+            ]
+        )
+        self._runner: web.AppRunner | None = None
+        self.base_url: str | None = None
+
+    def add_account(
+        self, member_id: str, password: str | None, appliances: list[Appliance]
+    ) -> Account:
+        account = self.accounts[member_id] = Account(password, appliances)
+        return account
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on host and port, returning the base URL to give SmartApp"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}/api"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.calls[request.path.rsplit("/", 1)[-1]] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    @staticmethod
+    def _failure(message: str) -> web.HTTPException:
+        return web.HTTPExpectationFailed(
+            text=json.dumps({"StateMsg": message}), content_type="application/json"
+        )
+
+    def _account(self, request: web.Request) -> Account:
+        """Account of the CPToken of a request, with its appliances run up to now"""
+        token = self._cp_tokens.get(request.headers.get("cptoken", ""))
+        if token is None:
+            raise self._failure(EXCEPTION_TOKEN_EXPIRED)
+        now = self.clock()
+        if now - token[1] > self.token_lifetime:
+            raise self._failure(EXCEPTION_CPTOKEN_EXPIRED)
+
+        account = self.accounts[token[0]]
+        if account.ticked_at is not None:
+            for appliance in account.appliances:
+                appliance.tick(now - account.ticked_at)
+        account.ticked_at = now
+        return account
+
+    def _appliance(self, request: web.Request) -> Appliance:
+        appliance = self._account(request).by_auth.get(request.headers.get("auth"))
+        if appliance is None:
+            raise self._failure(EXCEPTION_TOKEN_EXPIRED)
+        if not appliance.online:
+            raise self._failure(EXCEPTION_DEVICE_OFFLINE)
+        return appliance
+
+    def _issue_tokens(self, member_id: str) -> dict:
+        cp_token = uuid.uuid4().hex
+        refresh_token = uuid.uuid4().hex
+        self._cp_tokens[cp_token] = (member_id, self.clock())
+        self._refresh_tokens[refresh_token] = member_id
+        return {"CPToken": cp_token, "RefreshToken": refresh_token}
+
+    async def root(self, request: web.Request) -> web.Response:
+        return web.Response(text="")
+
+    async def login(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        member_id = data.get("MemId")
+        account = self.accounts.get(member_id)
+        if account is None:
+            appliances = copy.deepcopy(self._default_appliances or [])
+            account = self.add_account(member_id, None, appliances)
+        if account.password is not None and account.password != data.get("PW"):
+            raise self._failure(EXCEPTION_LOGIN_FAILED)
+        return web.json_response(self._issue_tokens(member_id))
+
+    async def refresh_token(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        member_id = self._refresh_tokens.pop(data.get("RefreshToken"), None)
+        if member_id is None:
+            raise self._failure(EXCEPTION_INVALID_REFRESH_TOKEN)
+        return web.json_response(self._issue_tokens(member_id))
+
+    async def get_devices(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        device_types = sorted({appliance.device_type for appliance in account.appliances})
+        return web.json_response(
+            {
+                "GwList": [appliance.gateway_entry() for appliance in account.appliances],
+                "CommandList": command_list(device_types),
+            }
+        )
+
+    async def get_device_info(self, request: web.Request) -> web.Response:
+        appliance = self._appliance(request)
+        devices = []
+        for entry in await request.json():
+            device_id = int(entry.get("DeviceID", 1))
+            if device_id != 1 and device_id not in appliance.sub_status:
+                continue
+            devices.append(
+                {
+                    "DeviceID": device_id,
+                    "Info": [
+                        {
+                            "CommandType": command["CommandType"],
+                            "status": appliance.read(device_id, command["CommandType"]),
+                        }
+                        for command in entry.get("CommandTypes", [])
+                    ],
+                }
+            )
+        return web.json_response({"devices": devices})
+
+    async def get_device_overview(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        return web.json_response(
+            {
+                "GwList": [
+                    {
+                        "GWID": appliance.gwid,
+                        "List": [
+                            {"CommandType": code, "Status": value}
+                            for code, value in appliance.status.items()
+                        ],
+                    }
+                    for appliance in account.appliances
+                    if appliance.online
+                ]
+            }
+        )
+
+    def _daily_value(self, appliance: Appliance, day: date) -> float:
+        rng = random.Random(f"{self.seed}/{appliance.gwid}/{day.isoformat()}")
+        return round(rng.uniform(0.2, 4.0), 2)
+
+    async def get_info(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        data = await request.json()
+        name = data.get("name")
+        start = datetime.strptime(data.get("from"), "%Y/%m/%d").date()
+        today = date.fromtimestamp(self.wall_clock())
+        days = [
+            start + timedelta(days=offset)
+            for offset in range(int(data.get("max_num", 31)))
+            if start + timedelta(days=offset) <= today
+        ]
+
+        gw_list = []
+        for appliance in account.appliances:
+            entry = {"GwID": appliance.gwid}
+            if name == REPORT_OTHER:
+                if appliance.device_type != REFRIGERATOR:
+                    continue
+                series = [int(self._daily_value(appliance, day) * 10) for day in days]
+                entry[REPORT_TOTAL_REFRIGERATOR_OPEN_DOOR] = sum(series)
+            else:
+                series = [self._daily_value(appliance, day) for day in days]
+                if name == REPORT_CO2:
+                    series = [round(value * CO2_PER_KWH, 2) for value in series]
+                    entry[REPORT_TOTAL_CO2] = round(sum(series), 2)
+                elif name == REPORT_POWER:
+                    entry[REPORT_TOTAL_ENERGY] = round(sum(series) + appliance.energy, 2)
+            entry["Information"] = [
+                {"DataTime": day.strftime("%Y/%m/%d"), "DataValue": value}
+                for day, value in zip(days, series)
+            ]
+            gw_list.append(entry)
+        return web.json_response({"GwList": gw_list})
+
+    async def set_command(self, request: web.Request) -> web.Response:
+        appliance = self._appliance(request)
+        command = int(request.query["CommandType"])
+        value = int(request.query["Value"])
+        # Write commands set the high bit of the status code they change
+        appliance.write(f"0x{command & 0x7F:02X}", value)
+        return web.json_response({})
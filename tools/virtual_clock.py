@@ -0,0 +1,328 @@
+""" Virtual time for SmartApp and the coordinator
+
+    python -m tools.virtual_clock --hours 48 --devices 20 --faults rate_limit_storm
+
+The event loop of this module reads a VirtualClock and, whenever no callback
+is ready, moves the clock to the next timer instead of sleeping. The delay
+between requests, REQUEST_TIMEOUT, the update_interval of the coordinator,
+token lifetimes and rate limit cooldowns then take no wall time. The mock
+cloud is served in process through LocalSession: a virtual clock cannot skip
+waiting on sockets or executor threads, so nothing in a simulation may use
+them.
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import functools
+import json
+import logging
+import sys
+import tempfile
+import time
+
+from aiohttp import web
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+import custom_components.panasonic_smart_app.smartApp as smart_app
+from custom_components.panasonic_smart_app.smartApp.const import POLL_INTERVAL
+from custom_components.panasonic_smart_app.const import (
+    DEVICE_ACTIVE_CODES,
+    DEVICE_IDLE_CODES,
+    DEVICE_STATUS_CODES,
+    DEVICE_TIMER_CODES,
+)
+
+from .mock_cloud import PROFILES, FaultInjector, MockCloud, build_appliances
+
+_LOGGER = logging.getLogger(__name__)
+
+# Four hours before a month rollover, so a day of polling crosses one
+DEFAULT_START = datetime(2024, 1, 31, 20, 0)
+DEFAULT_LATENCY = 0.3
+
+
+class VirtualClock(object):
+    """Monotonic and wall clocks that only move when told to"""
+
+    def __init__(self, start: datetime = DEFAULT_START):
+        self._epoch = start.timestamp()
+        self._elapsed = 0.0
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def time(self) -> float:
+        return self._epoch + self._elapsed
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.time())
+
+    def advance(self, seconds: float) -> None:
+        self._elapsed += max(seconds, 0.0)
+
+    def advance_to(self, monotonic: float) -> None:
+        self._elapsed = max(self._elapsed, monotonic)
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """Event loop on a VirtualClock, skipping ahead instead of sleeping"""
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__()
+        self.clock = clock
+
+    def time(self) -> float:
+        return self.clock.monotonic()
+
+    def _run_once(self):
+        # _ready and _scheduled are the callback queue and timer heap of
+        # BaseEventLoop; with nothing ready, the next timer is due right away
+        if not self._ready and not self._stopping:
+            when = min(
+                (timer.when() for timer in self._scheduled if not timer.cancelled()),
+                default=None,
+            )
+            if when is not None:
+                self.clock.advance_to(when)
+        super()._run_once()
+
+
+def run(main, clock: VirtualClock | None = None):
+    """asyncio.run on virtual time"""
+    loop = VirtualEventLoop(clock or VirtualClock())
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+def _encode(data) -> bytes:
+    return b"" if data is None else json.dumps(data).encode()
+
+
+class _Transport(object):
+    def close(self) -> None:
+        pass
+
+
+class _LocalRequest(object):
+    """The parts of web.Request the mock cloud and its middlewares use"""
+
+    def __init__(self, method: str, url: URL, headers, body: bytes):
+        self.method = method
+        self.rel_url = url.relative()
+        self.path = url.path
+        self.query = url.query
+        self.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        self.transport = _Transport()
+        self._body = body
+
+    async def json(self):
+        return json.loads(self._body) if self._body else None
+
+
+class LocalResponse(object):
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self) -> None:
+        pass
+
+
+class LocalSession(object):
+    """aiohttp.ClientSession stand-in serving requests from a MockCloud in process"""
+
+    def __init__(self, cloud: MockCloud):
+        self.cloud = cloud
+        self.closed = False
+
+    async def request(
+        self, method, url, *, json=None, params=None, headers=None, timeout=None, proxy=None
+    ) -> LocalResponse:
+        url = URL(url)
+        if params:
+            url = url.update_query(params)
+        body = _encode(json)
+        dispatch = self._dispatch(_LocalRequest(method, url, headers, body))
+        timeout = getattr(timeout, "total", timeout)
+        if timeout:
+            return await asyncio.wait_for(dispatch, timeout)
+        return await dispatch
+
+    async def _dispatch(self, request: _LocalRequest) -> LocalResponse:
+        app = self.cloud.app
+        handler = (await app.router.resolve(request)).handler
+        for middleware in reversed(app.middlewares):
+            handler = functools.partial(middleware, handler=handler)
+        try:
+            response = await handler(request)
+        except web.HTTPException as exception:
+            response = exception
+        return LocalResponse(response.status, response.body or b"")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@dataclass(frozen=True)
+class Cycle(object):
+    """A coordinator update of a simulation"""
+
+    at: datetime
+    api_calls: int
+    # Seconds until the next update, as set by the update
+    interval: float
+    rate_limited: bool
+    failed: bool
+
+
+async def simulate(
+    clock: VirtualClock,
+    cloud: MockCloud,
+    hours: float,
+    *,
+    update_interval: int = POLL_INTERVAL,
+    status_codes: dict = DEVICE_STATUS_CODES,
+) -> list[Cycle]:
+    """Poll an account of the mock cloud for hours through a coordinator.
+
+    The update method does what async_update_data of the integration does;
+    the coordinator is Home Assistant's own, scheduling on the loop time.
+    """
+    client = smart_app.SmartApp(
+        LocalSession(cloud), "virtual", "virtual", update_interval=update_interval
+    )
+    client.set_clock(clock.monotonic, clock.time)
+    await client.login()
+
+    cycles: list[Cycle] = []
+
+    async def async_update_data():
+        calls = sum(cloud.calls.values())
+        failed = False
+        try:
+            devices = await client.get_device_with_info(
+                status_codes,
+                DEVICE_ACTIVE_CODES,
+                DEVICE_IDLE_CODES,
+                DEVICE_TIMER_CODES,
+            )
+        except Exception as exception:
+            _LOGGER.debug("Update failed: %s", exception)
+            devices, failed = None, True
+
+        scheduler = client.scheduler
+        coordinator.update_interval = timedelta(
+            seconds=scheduler.next_wakeup(scheduler.now())
+        )
+        cycles.append(
+            Cycle(
+                at=clock.now(),
+                api_calls=sum(cloud.calls.values()) - calls,
+                interval=coordinator.update_interval.total_seconds(),
+                rate_limited=client.rate_limited_until is not None,
+                failed=failed,
+            )
+        )
+        if failed:
+            raise UpdateFailed("Failed while updating device status")
+        return devices
+
+    hass = HomeAssistant(tempfile.gettempdir())
+    coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name="virtual",
+        update_method=async_update_data,
+        update_interval=timedelta(seconds=client.scheduler.tick),
+    )
+    await coordinator.async_refresh()
+    # Coordinators only keep polling while something listens
+    remove_listener = coordinator.async_add_listener(lambda: None)
+    await asyncio.sleep(hours * 3600)
+    remove_listener()
+    await coordinator.async_shutdown()
+    return cycles
+
+
+def summarize(cycles: list[Cycle], cloud: MockCloud) -> dict:
+    return {
+        "cycles": len(cycles),
+        "failed_cycles": sum(cycle.failed for cycle in cycles),
+        "rate_limited_cycles": sum(cycle.rate_limited for cycle in cycles),
+        "months": sorted({cycle.at.strftime("%Y-%m") for cycle in cycles}),
+        "api_calls": dict(sorted(cloud.calls.items())),
+        "mean_interval": round(
+            sum(cycle.interval for cycle in cycles) / max(len(cycles), 1), 1
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--faults", choices=sorted(PROFILES))
+    parser.add_argument(
+        "--latency", type=float, default=DEFAULT_LATENCY, help="mock cloud seconds per response"
+    )
+    parser.add_argument("--token-lifetime", type=float, help="seconds a CPToken stays valid")
+    parser.add_argument("--update-interval", type=int, default=POLL_INTERVAL)
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        default=DEFAULT_START,
+        help="virtual wall time to start at, ISO 8601",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    clock = VirtualClock(args.start)
+    injector = FaultInjector.from_profile(args.faults, args.seed) if args.faults else None
+    options = {}
+    if args.token_lifetime is not None:
+        options["token_lifetime"] = args.token_lifetime
+    cloud = MockCloud(
+        build_appliances(args.devices, args.seed),
+        seed=args.seed,
+        latency=args.latency,
+        clock=clock.monotonic,
+        wall_clock=clock.time,
+        middlewares=[injector.middleware] if injector else [],
+        **options,
+    )
+
+    started_at = time.perf_counter()
+    cycles = run(
+        simulate(clock, cloud, args.hours, update_interval=args.update_interval), clock
+    )
+    elapsed = time.perf_counter() - started_at
+
+    report = summarize(cycles, cloud)
+    report["virtual_hours"] = round(clock.monotonic() / 3600, 2)
+    report["wall_seconds"] = round(elapsed, 2)
+    if injector:
+        report["faults"] = injector.summary()
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())